@@ -0,0 +1,152 @@
+"""Benchmark batch ASR against the local fake ASR server.
+
+Usage (after ``pip install -e .``):
+
+    python scripts/bench_asr.py --segments 500 --latency-ms 150 --error-rate 0.05 --rate 40
+
+Writes a synthetic working WAV whose segments hold one to three tone bursts, starts a
+``FakeASRServer`` with the given latency, error and throttling settings and runs
+``ASRWorker`` over every segment, as a virtual split's batch ASR does. Reports wall
+time, segments per second, the real-time factor, the requests, retries and failures
+the batch saw, how the server answered, and how many transcripts differ from what the
+server makes of each segment on its own (non-zero means packing split words wrongly).
+``--concurrency``, ``--client-rate`` and ``--retries`` override the
+``TEXTGRID_ASR_*`` settings for the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import shutil
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication
+
+from textgrid_transcriber import asr_batch
+from textgrid_transcriber.asr_fake import HTTPASRBackend, add_server_arguments, fake_words, server_from_arguments
+from textgrid_transcriber.main import ASRWorker
+from textgrid_transcriber.segment_table import Segment
+from textgrid_transcriber.wav import write_wav
+
+SAMPLE_RATE = 16000
+TIERS = ("words", "phones")
+SEGMENT_GAP_MS = 200
+WORD_GAP_MS = 250
+
+
+def tone(duration_ms: int, frequency: float) -> array:
+    count = SAMPLE_RATE * duration_ms // 1000
+    step = 2 * math.pi * frequency / SAMPLE_RATE
+    return array("h", (int(8000 * math.sin(step * n)) for n in range(count)))
+
+
+def build_corpus(directory: Path, size: int, long_share: float, seed: int) -> tuple[Path, list[Segment]]:
+    rng = random.Random(seed)
+    bursts = [tone(duration, 220 + 55 * n) for n, duration in enumerate((120, 200, 320, 450, 600, 900))]
+    silence = array("h", bytes(SAMPLE_RATE * 2 // 1000 * WORD_GAP_MS))
+    gap = array("h", bytes(SAMPLE_RATE * 2 // 1000 * SEGMENT_GAP_MS))
+    pcm = array("h")
+    segments = []
+    for row in range(size):
+        tier = TIERS[row % len(TIERS)]
+        start_ms = len(pcm) * 1000 // SAMPLE_RATE
+        # Long segments repeat their bursts until they run past a few seconds.
+        words = rng.randint(1, 3) * (8 if rng.random() < long_share else 1)
+        for word in range(words):
+            if word:
+                pcm.extend(silence)
+            pcm.extend(rng.choice(bursts))
+        end_ms = len(pcm) * 1000 // SAMPLE_RATE
+        pcm.extend(gap)
+        segments.append(
+            Segment(
+                tier, row // len(TIERS) + 1, start_ms, end_ms, str(directory / f"{tier}_{row}.wav"), "", "", False, False
+            )
+        )
+    working = directory / "working.wav"
+    write_wav(working, pcm.tobytes(), SAMPLE_RATE)
+    return working, segments
+
+
+def run_batch(backend: HTTPASRBackend, segments: list[Segment], working: Path) -> tuple[float, dict[int, str], list]:
+    worker = ASRWorker(list(enumerate(segments)), backend, None, None, "fake", working)
+    transcripts: dict[int, str] = {}
+    summaries = []
+    worker.segment_done.connect(transcripts.__setitem__)
+    worker.finished.connect(summaries.append)
+    worker.failed.connect(lambda message: print(f"failed: {message}"))
+    started = time.perf_counter()
+    worker.run()
+    return time.perf_counter() - started, transcripts, summaries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=500)
+    parser.add_argument("--long-share", type=float, default=0.1, help="share of multi-second segments")
+    parser.add_argument("--concurrency", type=int, help="requests in flight (TEXTGRID_ASR_CONCURRENCY)")
+    parser.add_argument("--client-rate", type=float, help="requests per second sent (TEXTGRID_ASR_RATE)")
+    parser.add_argument("--retries", type=int, help="retries per request (TEXTGRID_ASR_RETRIES)")
+    parser.add_argument("--backoff-base", type=float, default=0.05, help="seconds before the first retry")
+    parser.add_argument("--no-packing", action="store_true", help="send one request per segment")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    for name, value in (
+        ("TEXTGRID_ASR_CONCURRENCY", args.concurrency),
+        ("TEXTGRID_ASR_RATE", args.client_rate),
+        ("TEXTGRID_ASR_RETRIES", args.retries),
+    ):
+        if value is not None:
+            os.environ[name] = str(value)
+    os.environ["TEXTGRID_ASR_PACKING"] = "0" if args.no_packing else "1"
+    # Real quota errors call for second-long pauses; a local server does not.
+    asr_batch.BACKOFF_BASE_S = args.backoff_base
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    directory = Path(tempfile.mkdtemp(prefix="bench_asr_"))
+    try:
+        working, segments = build_corpus(directory, args.segments, args.long_share, args.seed)
+        audio_s = sum(segment.end_ms - segment.start_ms for segment in segments) / 1000
+        pcm = working.read_bytes()[44:]
+        expected = [
+            " ".join(word for word, _, _ in fake_words(pcm[segment.start_ms * 32 : segment.end_ms * 32]))
+            for segment in segments
+        ]
+
+        server = server_from_arguments(args)
+        server.start()
+        backend = HTTPASRBackend(server.url, server=server)
+        elapsed, transcripts, summaries = run_batch(backend, segments, working)
+        backend.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"{len(segments)} segments, {audio_s:.1f}s of audio")
+    print(f"  wall time:        {elapsed:8.2f}s")
+    print(f"  throughput:       {len(segments) / elapsed:8.1f} segments/s")
+    print(f"  real-time factor: {elapsed / audio_s:8.4f}")
+    if summaries:
+        summary = summaries[0]
+        print(
+            f"  batch:            {summary.requests} requests, {summary.retries} retries, "
+            f"{len(summary.failures)} failed segments"
+        )
+    stats = server.stats
+    print(
+        f"  server:           {stats.requests} requests, {stats.succeeded} answered, "
+        f"{stats.throttled} throttled, {stats.errors} errors, {stats.max_in_flight} max in flight"
+    )
+    wrong = sum(1 for row, transcript in transcripts.items() if transcript != expected[row])
+    print(f"  mismatched:       {wrong}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmark painting the segment list while it scrolls.
+
+Usage (after ``pip install -e .``):
+
+    python scripts/bench_delegate.py --ratio 2 --height 1080 --frames 300
+
+Scrolls a list of synthetic segments one page per frame and reports the time the
+delegate spends painting each frame's rows into an image at the given device pixel
+ratio (2 approximates a 4K display at 200% scaling), for ``SegmentListDelegate`` and
+for the previous delegate, which measured and drew every badge on every paint.
+Set ``QT_QPA_PLATFORM=offscreen`` to run without a display.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QFontMetrics, QImage, QPainter
+from PySide6.QtWidgets import QApplication, QListView, QStyle, QStyleOptionViewItem
+
+from textgrid_transcriber.segment_table import SegmentTable
+from textgrid_transcriber.segments_delegate import SegmentListDelegate
+from textgrid_transcriber.segments_model import STATUS_EMPTY, SegmentListModel
+
+TIERS = ("words", "phones", "syllables")
+WIDTH = 960
+ROWS = 20_000
+# Untimed frames first, so glyph caches are warm for both delegates.
+WARMUP = 30
+
+
+class LegacyDelegate(SegmentListDelegate):
+    """The delegate before badges and font metrics were cached."""
+
+    def paint(self, painter: QPainter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        is_selected = bool(option.state & QStyle.State_Selected)
+        if is_selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        text = index.data(Qt.DisplayRole) or ""
+        status = index.data(Qt.UserRole + 1) or STATUS_EMPTY
+
+        palette = option.palette
+        text_color = palette.highlightedText().color() if is_selected else palette.text().color()
+
+        rect = option.rect.adjusted(8, 2, -8, -2)
+        fm = QFontMetrics(option.font)
+        badge_width = fm.horizontalAdvance(status) + 16
+        badge_height = fm.height() + 4
+        badge_rect = QRect(rect.right() - badge_width, rect.center().y() - (badge_height // 2), badge_width, badge_height)
+        badge_color, border_color, badge_text_color = self._badge_colors(status, is_selected)
+
+        painter.setPen(border_color)
+        painter.setBrush(badge_color)
+        painter.drawRoundedRect(badge_rect, 8, 8)
+
+        painter.setPen(text_color)
+        text_rect = QRect(rect.left(), rect.top(), rect.width() - badge_width - 8, rect.height())
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, text)
+
+        painter.setPen(badge_text_color)
+        painter.drawText(badge_rect, Qt.AlignCenter, status)
+
+        painter.restore()
+
+
+def build_model(size: int) -> SegmentListModel:
+    table = SegmentTable(base="/data/project")
+    padding = len(str(size))
+    for row in range(size):
+        tier = TIERS[row % len(TIERS)]
+        index = row // len(TIERS) + 1
+        start_ms = row * 40
+        end_ms = start_ms + 35
+        table.append_values(
+            tier,
+            index,
+            start_ms,
+            end_ms,
+            f"{tier}/{tier}_{index:0{padding}d}_{start_ms}_{end_ms}.wav",
+            "",
+            "hello" if row % 3 else "",
+            False,
+            row % 5 == 0,
+        )
+    model = SegmentListModel()
+    model.set_segments(table)
+    return model
+
+
+def run(label: str, delegate, view: QListView, model: SegmentListModel, args) -> None:
+    image = QImage(round(WIDTH * args.ratio), round(args.height * args.ratio), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(args.ratio)
+    option = QStyleOptionViewItem()
+    option.initFrom(view)
+    option.font = view.font()
+    row_height = delegate.sizeHint(option, model.index(0, 0)).height()
+    per_frame = args.height // row_height + 1
+
+    frames = []
+    for frame in range(WARMUP + args.frames):
+        first = (frame * per_frame) % (model.rowCount() - per_frame)
+        image.fill(Qt.white)
+        started = time.perf_counter()
+        painter = QPainter(image)
+        painter.setFont(option.font)
+        for offset in range(per_frame):
+            index = model.index(first + offset, 0)
+            option.rect = QRect(0, offset * row_height, WIDTH, row_height)
+            # Select one row per frame, as when scrolling with a current item.
+            option.state = option.state | QStyle.State_Selected if offset == 0 else option.state & ~QStyle.State_Selected
+            delegate.paint(painter, option, index)
+        painter.end()
+        if frame >= WARMUP:
+            frames.append(time.perf_counter() - started)
+
+    frames.sort()
+    print(
+        f"  {label:>6}: {statistics.mean(frames) * 1000:7.2f} ms/frame avg, "
+        f"{frames[len(frames) * 95 // 100] * 1000:7.2f} ms p95 ({per_frame} rows per frame)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ratio", type=float, default=2.0, help="device pixel ratio to paint at")
+    parser.add_argument("--height", type=int, default=1080, help="visible list height in logical pixels")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    model = build_model(ROWS)
+    view = QListView()
+    view.setModel(model)
+    print(f"{args.frames} frames at {WIDTH}x{args.height} logical pixels, ratio {args.ratio:g}")
+    run("cached", SegmentListDelegate(view), view, model, args)
+    run("legacy", LegacyDelegate(view), view, model, args)
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Benchmark sorting and filtering the segment list proxy.
+
+Usage (after ``pip install -e .``):
+
+    python scripts/bench_proxy.py --sizes 10000 100000 1000000
+
+Builds a synthetic ``SegmentTable`` per size and reports how long the model takes to
+compute its sort and filter keys, then the latency of each sort mode, of typing a
+search filter one keystroke at a time (and a phrase and a regex query), of the tier and status filters and of
+toggling one segment's verified flag. With
+``--legacy-max`` the same operations are timed against the previous proxy, which
+derived names and statuses per comparison, up to that many rows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication, QSortFilterProxyModel, Qt
+
+from textgrid_transcriber.segment_table import SegmentTable
+from textgrid_transcriber.segments_model import (
+    STATUS_VERIFIED,
+    SegmentFilterProxy,
+    SegmentListModel,
+    segment_status,
+    status_rank,
+)
+
+TIERS = ("words", "phones", "syllables")
+SEARCH = "hello"
+QUERIES = ('"hello world"', r"/world \d+5$/")
+EDITS = 20
+
+
+class LegacyProxy(QSortFilterProxyModel):
+    """The proxy before the model kept per-row keys."""
+
+    def __init__(self):
+        super().__init__()
+        self._filter_text = ""
+        self._filter_tier = "All"
+        self._filter_status = "All"
+        self._sort_mode = SegmentFilterProxy.SORT_STATUS
+
+    def set_filter_text(self, text: str) -> None:
+        self._filter_text = text.strip().lower()
+        self.invalidateFilter()
+
+    def set_filter_tier(self, tier: str) -> None:
+        self._filter_tier = tier
+        self.invalidateFilter()
+
+    def set_filter_status(self, status: str) -> None:
+        self._filter_status = status
+        self.invalidateFilter()
+
+    def set_sort_mode(self, mode: str) -> None:
+        self._sort_mode = mode
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        segment = self.sourceModel().segment_at(source_row)
+        if self._filter_tier != "All" and segment.tier != self._filter_tier:
+            return False
+        status = segment_status(segment)
+        if self._filter_status != "All" and status != self._filter_status:
+            return False
+        if self._filter_text:
+            name = Path(segment.path).name.lower()
+            transcript = segment.transcript.lower()
+            if self._filter_text not in name and self._filter_text not in transcript:
+                return False
+        return True
+
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        left_segment = model.segment_at(left.row())
+        right_segment = model.segment_at(right.row())
+        if self._sort_mode == SegmentFilterProxy.SORT_DURATION:
+            left_value = left_segment.end_ms - left_segment.start_ms
+            right_value = right_segment.end_ms - right_segment.start_ms
+        elif self._sort_mode == SegmentFilterProxy.SORT_NAME:
+            left_value = Path(left_segment.path).name
+            right_value = Path(right_segment.path).name
+        else:
+            left_value = status_rank(segment_status(left_segment))
+            right_value = status_rank(segment_status(right_segment))
+        if left_value == right_value:
+            left_value = Path(left_segment.path).name
+            right_value = Path(right_segment.path).name
+        return left_value < right_value
+
+
+def build_table(size: int) -> SegmentTable:
+    table = SegmentTable(base="/data/project")
+    padding = len(str(size))
+    for row in range(size):
+        tier = TIERS[row % len(TIERS)]
+        index = row // len(TIERS) + 1
+        start_ms = row * 40
+        end_ms = start_ms + 20 + (row * 7919) % 400
+        table.append_values(
+            tier,
+            index,
+            start_ms,
+            end_ms,
+            f"{tier}/{tier}_{index:0{padding}d}_{start_ms}_{end_ms}.wav",
+            "",
+            f"Hello world {row}" if row % 3 == 0 else "",
+            False,
+            row % 5 == 0,
+        )
+    return table
+
+
+def timed(proxy, action) -> float:
+    started = time.perf_counter()
+    action()
+    # QSortFilterProxyModel maps lazily; counting rows makes it finish the work.
+    proxy.rowCount()
+    return time.perf_counter() - started
+
+
+def run(label: str, proxy_class, table: SegmentTable) -> None:
+    model = SegmentListModel()
+    started = time.perf_counter()
+    model.set_segments(table)
+    print(f"  {label:>6} model keys:    {time.perf_counter() - started:8.3f}s")
+
+    proxy = proxy_class()
+    proxy.setSourceModel(model)
+    for mode in (SegmentFilterProxy.SORT_STATUS, SegmentFilterProxy.SORT_DURATION, SegmentFilterProxy.SORT_NAME):
+
+        def sort(mode=mode):
+            proxy.set_sort_mode(mode)
+            proxy.sort(0, Qt.AscendingOrder)
+
+        print(f"  {label:>6} sort {mode + ':':<10} {timed(proxy, sort):8.3f}s")
+
+    keystrokes = [timed(proxy, lambda n=n: proxy.set_filter_text(SEARCH[:n])) for n in range(1, len(SEARCH) + 1)]
+    print(
+        f"  {label:>6} search keystroke: {sum(keystrokes) / len(keystrokes):8.3f}s "
+        f"avg, {max(keystrokes):.3f}s max ({proxy.rowCount()} rows match)"
+    )
+    if not isinstance(proxy, LegacyProxy):
+        for query in QUERIES:
+            elapsed = timed(proxy, lambda query=query: proxy.set_filter_text(query))
+            print(f"  {label:>6} search {query + ':':<15} {elapsed:8.3f}s ({proxy.rowCount()} rows match)")
+    proxy.set_filter_text("")
+    print(f"  {label:>6} tier filter:   {timed(proxy, lambda: proxy.set_filter_tier(TIERS[1])):8.3f}s")
+    proxy.set_filter_tier("All")
+    print(f"  {label:>6} status filter: {timed(proxy, lambda: proxy.set_filter_status(STATUS_VERIFIED)):8.3f}s")
+    proxy.set_filter_status("All")
+    proxy.set_sort_mode(SegmentFilterProxy.SORT_STATUS)
+
+    def edit(row):
+        segment = model.segment_at(row)
+        segment.verified = not segment.verified
+        model.update_segment(row)
+        if isinstance(proxy, LegacyProxy):
+            # What the window did after every edit before updates were incremental.
+            proxy.invalidate()
+            proxy.sort(0, Qt.AscendingOrder)
+
+    rng = random.Random(0)
+    edits = [timed(proxy, lambda row=rng.randrange(len(table)): edit(row)) for _ in range(EDITS)]
+    print(f"  {label:>6} verify toggle: {sum(edits) / len(edits):8.3f}s avg, {max(edits):.3f}s max")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=0, help="also time the old proxy up to this size")
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    for size in args.sizes:
+        print(f"{size} segments")
+        table = build_table(size)
+        run("new", SegmentFilterProxy, table)
+        if size <= args.legacy_max:
+            run("legacy", LegacyProxy, table)
+    del app
+
+
+if __name__ == "__main__":
+    main()
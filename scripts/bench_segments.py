@@ -0,0 +1,125 @@
+"""Benchmark loading large projects into Segment lists versus a SegmentTable.
+
+Usage (after ``pip install -e .``):
+
+    python scripts/bench_segments.py --sizes 100000 1000000
+
+Writes a synthetic project per size, then reports load time and the memory the
+loaded segments keep alive, for a plain list of ``Segment`` objects (how projects
+used to be loaded) and for the columnar ``SegmentTable`` that ``load_project`` builds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from textgrid_transcriber.project import Segment, load_project
+
+TIERS = ("words", "phones", "syllables")
+MARKS = ("a", "ba", "kh", "ʃ", "hello", "world")
+
+
+def write_project(path: Path, size: int) -> None:
+    padding = len(str(size))
+    segments = []
+    for row in range(size):
+        tier = TIERS[row % len(TIERS)]
+        index = row // len(TIERS) + 1
+        start_ms = row * 40
+        end_ms = start_ms + 35
+        segments.append(
+            {
+                "tier": tier,
+                "index": index,
+                "start_ms": start_ms,
+                "end_ms": end_ms,
+                "path": f"{tier}/{tier}_{index:0{padding}d}_{start_ms}_{end_ms}.wav",
+                "mark": MARKS[row % len(MARKS)],
+                "transcript": f"transcript {row}" if row % 4 == 0 else "",
+                "asr_generated": row % 8 == 0,
+                "verified": row % 16 == 0,
+            }
+        )
+    data = {
+        "version": 1,
+        "audio_path": "source.wav",
+        "textgrid_path": "source.TextGrid",
+        "output_dir": ".",
+        "batch_asr": False,
+        "credentials_path": "",
+        "asr_model": "chirp_3",
+        "segments": segments,
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def load_as_list(path: Path) -> list[Segment]:
+    base = path.parent
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [
+        Segment(
+            tier=segment["tier"],
+            index=segment["index"],
+            start_ms=segment["start_ms"],
+            end_ms=segment["end_ms"],
+            path=str((base / segment["path"]).resolve()),
+            mark=segment.get("mark", ""),
+            transcript=segment.get("transcript", ""),
+            asr_generated=segment.get("asr_generated", False),
+            verified=segment.get("verified", False),
+        )
+        for segment in data["segments"]
+    ]
+
+
+def load_as_table(path: Path):
+    return load_project(path).segments
+
+
+def measure(load, path: Path) -> tuple[float, int]:
+    gc.collect()
+    started = time.perf_counter()
+    segments = load(path)
+    elapsed = time.perf_counter() - started
+    del segments
+    gc.collect()
+    # Measure retained memory on a second run; tracing would distort the timing.
+    tracemalloc.start()
+    segments = load(path)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del segments
+    return elapsed, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="tg-bench-"))
+    try:
+        for size in args.sizes:
+            project_path = workdir / f"project-{size}.json"
+            write_project(project_path, size)
+            for label, load in (("list", load_as_list), ("table", load_as_table)):
+                elapsed, retained = measure(load, project_path)
+                print(
+                    f"{size:>9} {label:>5}: load {elapsed:.2f}s, "
+                    f"{retained / 1e6:.1f} MB retained ({retained / size:.0f} B/segment)"
+                )
+            project_path.unlink()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark the split engines on a synthetic recording.
+
+Usage (after ``pip install -e .``):
+
+    python scripts/bench_split.py --minutes 30 --intervals 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from textgrid_transcriber.ffmpeg import get_ffmpeg_path
+from textgrid_transcriber.splitter import SPLIT_ENGINES, split_audio_with_ffmpeg
+from textgrid_transcriber.wav import write_wav
+
+SAMPLE_RATE = 16000
+
+
+def write_source(path: Path, minutes: float) -> float:
+    duration = minutes * 60
+    rng = random.Random(0)
+    frames = int(duration * SAMPLE_RATE)
+    pcm = bytes(rng.getrandbits(8) for _ in range(min(frames, SAMPLE_RATE) * 2))
+    repeats, remainder = divmod(frames * 2, len(pcm))
+    write_wav(path, pcm * repeats + pcm[:remainder], SAMPLE_RATE)
+    return duration
+
+
+def write_textgrid(path: Path, duration: float, intervals: int) -> None:
+    step = duration / (intervals * 2)
+    rows = []
+    for i in range(intervals * 2):
+        mark = f"w{i // 2}" if i % 2 == 0 else ""
+        rows.append((i * step, (i + 1) * step, mark))
+
+    lines = [
+        'File type = "ooTextFile"',
+        'Object class = "TextGrid"',
+        "",
+        "xmin = 0",
+        f"xmax = {duration}",
+        "tiers? <exists>",
+        "size = 1",
+        "item []:",
+        "    item [1]:",
+        '        class = "IntervalTier"',
+        '        name = "words"',
+        "        xmin = 0",
+        f"        xmax = {duration}",
+        f"        intervals: size = {len(rows)}",
+    ]
+    for number, (xmin, xmax, mark) in enumerate(rows, start=1):
+        lines += [
+            f"        intervals [{number}]:",
+            f"            xmin = {xmin}",
+            f"            xmax = {xmax}",
+            f'            text = "{mark}"',
+        ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--intervals", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--engines", nargs="+", default=list(SPLIT_ENGINES), choices=SPLIT_ENGINES)
+    args = parser.parse_args()
+
+    ffmpeg_path = get_ffmpeg_path()
+    workdir = Path(tempfile.mkdtemp(prefix="tg-bench-"))
+    try:
+        audio_path = workdir / "source.wav"
+        textgrid_path = workdir / "source.TextGrid"
+        duration = write_source(audio_path, args.minutes)
+        write_textgrid(textgrid_path, duration, args.intervals)
+
+        for engine in args.engines:
+            for workers in args.workers:
+                output_dir = workdir / f"splits-{engine}-{workers}"
+                started = time.perf_counter()
+                _, segments = split_audio_with_ffmpeg(
+                    ffmpeg_path, audio_path, textgrid_path, output_dir, engine=engine, workers=workers
+                )
+                elapsed = time.perf_counter() - started
+                print(
+                    f"{engine:>12} x{workers:<3}: {len(segments)} segments in {elapsed:.2f}s "
+                    f"({len(segments) / elapsed:.1f} segments/s)"
+                )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
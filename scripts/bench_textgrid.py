@@ -0,0 +1,192 @@
+"""Check the native TextGrid parser against the textgrid package and benchmark both.
+
+Usage (after ``pip install -e .``):
+
+    python scripts/bench_textgrid.py --intervals 200000
+
+Writes synthetic grids (long, short and UTF-16 text, plus Praat's binary format),
+verifies that the labeled intervals the native parser yields match what the
+textgrid package reads, then reports parse time and peak memory for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import struct
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from textgrid import TextGrid
+
+from textgrid_transcriber.textgrid_parser import iter_labeled_tiers
+
+MARKS = ["a", "", "ba", 'say ""hi""', "ʃ", "", "multi\nline", "  ", "x"]
+
+
+def synthetic_tiers(intervals: int, seed: int = 0) -> list[tuple[str, str, list]]:
+    rng = random.Random(seed)
+    tiers = []
+    for name, count in (("words", max(1, intervals // 10)), ("phones", intervals)):
+        rows = []
+        time_ = 0.0
+        for _ in range(count):
+            step = rng.uniform(0.01, 0.3)
+            rows.append((time_, time_ + step, rng.choice(MARKS)))
+            time_ += step
+        tiers.append(("IntervalTier", name, rows))
+    tiers.append(("TextTier", "events", [(0.5, "beep"), (1.5, "")]))
+    return tiers
+
+
+def _duration(tiers) -> float:
+    return max(rows[-1][1] for kind, _, rows in tiers if kind == "IntervalTier")
+
+
+def write_long(path: Path, tiers, encoding: str = "utf-8") -> None:
+    xmax = _duration(tiers)
+    lines = [
+        'File type = "ooTextFile"',
+        'Object class = "TextGrid"',
+        "",
+        "xmin = 0 ",
+        f"xmax = {xmax!r} ",
+        "tiers? <exists> ",
+        f"size = {len(tiers)} ",
+        "item []: ",
+    ]
+    for number, (kind, name, rows) in enumerate(tiers, start=1):
+        lines += [
+            f"    item [{number}]:",
+            f'        class = "{kind}" ',
+            f'        name = "{name}" ',
+            "        xmin = 0 ",
+            f"        xmax = {xmax!r} ",
+        ]
+        if kind == "IntervalTier":
+            lines.append(f"        intervals: size = {len(rows)} ")
+            for row_number, (xmin, xmax_, mark) in enumerate(rows, start=1):
+                lines += [
+                    f"        intervals [{row_number}]:",
+                    f"            xmin = {xmin!r} ",
+                    f"            xmax = {xmax_!r} ",
+                    f'            text = "{mark}" ',
+                ]
+        else:
+            lines.append(f"        points: size = {len(rows)} ")
+            for row_number, (time_, mark) in enumerate(rows, start=1):
+                lines += [
+                    f"        points [{row_number}]:",
+                    f"            number = {time_!r} ",
+                    f'            mark = "{mark}" ',
+                ]
+    path.write_text("\n".join(lines) + "\n", encoding=encoding)
+
+
+def write_short(path: Path, tiers) -> None:
+    # The textgrid package misreads point tiers in the short format, so leave them out.
+    tiers = [tier for tier in tiers if tier[0] == "IntervalTier"]
+    xmax = _duration(tiers)
+    lines = ['File type = "ooTextFile"', 'Object class = "TextGrid"', "", "0", repr(xmax), "<exists>", str(len(tiers))]
+    for kind, name, rows in tiers:
+        lines += [f'"{kind}"', f'"{name}"', "0", repr(xmax), str(len(rows))]
+        for row in rows:
+            lines += [repr(value) for value in row[:-1]] + [f'"{row[-1]}"']
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _binary_text(value: str) -> bytes:
+    value = value.replace('""', '"')
+    try:
+        encoded = value.encode("ascii")
+    except UnicodeEncodeError:
+        encoded = value.encode("utf-16-be")
+        return struct.pack(">HH", 0xFFFF, len(encoded) // 2) + encoded
+    return struct.pack(">H", len(encoded)) + encoded
+
+
+def write_binary(path: Path, tiers) -> None:
+    xmax = _duration(tiers)
+    out = bytearray(b"ooBinaryFile" + bytes([8]) + b"TextGrid")
+    out += struct.pack(">dd", 0.0, xmax) + b"\x01" + struct.pack(">i", len(tiers))
+    for kind, name, rows in tiers:
+        out += bytes([len(kind)]) + kind.encode("ascii") + _binary_text(name)
+        out += struct.pack(">ddi", 0.0, xmax, len(rows))
+        for row in rows:
+            out += struct.pack(f">{len(row) - 1}d", *row[:-1]) + _binary_text(row[-1])
+    path.write_bytes(bytes(out))
+
+
+def native_intervals(path: Path) -> list[tuple[str, float, float, str]]:
+    return [
+        (name, interval.min_time, interval.max_time, interval.mark)
+        for name, intervals in iter_labeled_tiers(path)
+        for interval in intervals
+    ]
+
+
+def library_intervals(path: Path) -> list[tuple[str, float, float, str]]:
+    tg = TextGrid()
+    tg.read(str(path))
+    return [
+        (tier.name, interval.minTime, interval.maxTime, interval.mark)
+        for tier in tg.tiers
+        if tier.__class__.__name__ == "IntervalTier"
+        for interval in tier
+        if (interval.mark or "").strip()
+    ]
+
+
+def measure(parse, path: Path):
+    started = time.perf_counter()
+    result = parse(path)
+    elapsed = time.perf_counter() - started
+    # Measure memory on a second run; tracing would distort the timing.
+    tracemalloc.start()
+    parse(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--intervals", type=int, default=50000)
+    args = parser.parse_args()
+
+    tiers = synthetic_tiers(args.intervals)
+    workdir = Path(tempfile.mkdtemp(prefix="tg-bench-"))
+    try:
+        grids = {
+            "long": workdir / "long.TextGrid",
+            "long-utf16": workdir / "long16.TextGrid",
+            "short": workdir / "short.TextGrid",
+            "binary": workdir / "binary.TextGrid",
+        }
+        write_long(grids["long"], tiers)
+        write_long(grids["long-utf16"], tiers, encoding="utf-16")
+        write_short(grids["short"], tiers)
+        write_binary(grids["binary"], tiers)
+
+        reference = None
+        for label, path in grids.items():
+            native, native_time, native_peak = measure(native_intervals, path)
+            line = f"{label:>10}: native {native_time:.2f}s / {native_peak / 1e6:.1f} MB"
+            if label == "binary":
+                # The textgrid package cannot read binary grids; compare with the text result.
+                match = native == reference
+            else:
+                library, library_time, library_peak = measure(library_intervals, path)
+                match = native == library
+                reference = reference or library
+                line += f", textgrid {library_time:.2f}s / {library_peak / 1e6:.1f} MB"
+            print(f"{line}, {len(native)} intervals, parity {'OK' if match else 'MISMATCH'}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark offline Whisper ASR throughput on a synthetic corpus.
+
+Usage (after ``pip install -e '.[offline]'``):
+
+    python scripts/bench_whisper.py --segments 100 --workers 1 4 --model small
+
+Synthesizes speech-like segments (voiced harmonics under a syllable-rate envelope, with
+pauses) of random length and transcribes them with ``WhisperBackend`` for each worker
+count, with as many requests in flight as there are workers, the way batch ASR keeps its
+pool busy. Reports the time to start the pool and load the model in every worker, then
+segments per second and the real-time factor (processing time over audio time) of the
+batch. The transcripts are nonsense; only the timing matters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from textgrid_transcriber.asr_whisper import (
+    DEFAULT_WHISPER_COMPUTE_TYPE,
+    DEFAULT_WHISPER_MODEL,
+    WhisperBackend,
+    whisper_available,
+)
+
+SAMPLE_RATE = 16000
+SYLLABLE_HZ = 4.0
+HARMONICS = 6
+
+
+def synthesize(duration_s: float, rng: random.Random) -> bytes:
+    count = int(duration_s * SAMPLE_RATE)
+    pitch = rng.uniform(90, 220)
+    pause_start = rng.uniform(0.3, 0.7) * count
+    pause_end = pause_start + 0.25 * SAMPLE_RATE
+    samples = array("h", bytes(count * 2))
+    phase = 0.0
+    for n in range(count):
+        t = n / SAMPLE_RATE
+        # Pitch drifts slowly, as in intonation.
+        phase += 2 * math.pi * pitch * (1 + 0.1 * math.sin(2 * math.pi * 0.7 * t)) / SAMPLE_RATE
+        envelope = max(0.0, math.sin(math.pi * SYLLABLE_HZ * t)) ** 2
+        if pause_start <= n < pause_end:
+            envelope = 0.0
+        voiced = sum(math.sin(k * phase) / k for k in range(1, HARMONICS + 1))
+        samples[n] = int(6000 * envelope * voiced + rng.gauss(0, 60))
+    return samples.tobytes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=100)
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    parser.add_argument("--max-seconds", type=float, default=8.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--model", default=DEFAULT_WHISPER_MODEL)
+    parser.add_argument("--compute-type", default=DEFAULT_WHISPER_COMPUTE_TYPE)
+    parser.add_argument("--language", default="en-US")
+    args = parser.parse_args()
+    if not whisper_available():
+        parser.error("faster-whisper is not installed; pip install -e '.[offline]'")
+
+    rng = random.Random(0)
+    clips = [synthesize(rng.uniform(args.min_seconds, args.max_seconds), rng) for _ in range(args.segments)]
+    audio_s = sum(len(clip) for clip in clips) / (SAMPLE_RATE * 2)
+    print(f"{len(clips)} segments, {audio_s:.1f}s of audio, model {args.model} ({args.compute_type})")
+
+    for workers in args.workers:
+        backend = WhisperBackend(args.model, workers, args.compute_type)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as requests:
+                started = time.perf_counter()
+                # One short request per worker starts every process and loads every model.
+                list(requests.map(lambda clip: backend.recognize_pcm(clip, None, args.language), clips[:workers]))
+                load = time.perf_counter() - started
+
+                started = time.perf_counter()
+                list(requests.map(lambda clip: backend.recognize_pcm(clip, None, args.language), clips))
+                elapsed = time.perf_counter() - started
+        finally:
+            backend.close()
+        print(
+            f"  x{workers:<3}: start {load:6.2f}s, batch {elapsed:7.2f}s, "
+            f"{len(clips) / elapsed:6.2f} segments/s, real-time factor {elapsed / audio_s:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
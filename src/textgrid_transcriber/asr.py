@@ -1,18 +1,58 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
-import wave
+import threading
+import time
 from pathlib import Path
+from typing import Callable, Iterable
 
-from google.api_core.exceptions import NotFound, PermissionDenied
+from google.api_core.exceptions import (
+    Aborted,
+    DeadlineExceeded,
+    InternalServerError,
+    NotFound,
+    PermissionDenied,
+    ResourceExhausted,
+    ServiceUnavailable,
+)
 from google.cloud.speech_v2 import SpeechClient
 from google.cloud.speech_v2.types import cloud_speech
 from google.oauth2 import service_account
 
-DEFAULT_ASR_MODEL = "chirp_3"
+from textgrid_transcriber.asr_backend import (
+    DEFAULT_ASR_LANGUAGE,
+    DEFAULT_ASR_MODEL,
+    STREAM_CHUNK_MS,
+    STREAM_MAX_MS,
+    STREAMING_MIN_MS,
+    RecognitionResult,
+)
+from textgrid_transcriber.wav import iter_pcm, read_pcm, wav_duration_ms
+
 DEFAULT_ASR_LOCATION = "us"
 DEFAULT_RECOGNIZER_ID = "default"
+STREAM_CHUNK_FRAMES = 16000 * STREAM_CHUNK_MS // 1000
+STREAM_MAX_BYTES = 16000 * 2 * STREAM_MAX_MS // 1000
+RECOGNIZER_CACHE_TTL_S = 24 * 60 * 60
+
+# Quota and transient server or network errors; worth retrying after a pause.
+RETRYABLE_ERRORS = (
+    Aborted,
+    DeadlineExceeded,
+    InternalServerError,
+    ResourceExhausted,
+    ServiceUnavailable,
+    ConnectionError,
+    TimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    return isinstance(exc, RETRYABLE_ERRORS)
 
 
 def _client(credentials_path: Path | None, location: str) -> SpeechClient:
@@ -102,48 +142,316 @@ def _ensure_recognizer(
         ) from exc
 
 
+class RecognizerCache:
+    """Names of recognizers known to exist, so a lookup is skipped until ``ttl`` passes.
+
+    With a ``path`` the names are kept as JSON and survive restarts.
+    """
+
+    def __init__(self, path: Path | None = None, ttl: float = RECOGNIZER_CACHE_TTL_S):
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._checked: dict[str, float] = {}
+        if self.path is not None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            if isinstance(data, dict):
+                self._checked = {
+                    name: checked for name, checked in data.items() if isinstance(checked, (int, float))
+                }
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            checked = self._checked.get(name)
+        return checked is not None and time.time() - checked < self.ttl
+
+    def add(self, name: str) -> None:
+        with self._lock:
+            self._checked[name] = time.time()
+            self._write()
+
+    def discard(self, name: str) -> None:
+        with self._lock:
+            if self._checked.pop(name, None) is not None:
+                self._write()
+
+    def _write(self) -> None:
+        if self.path is None:
+            return
+        now = time.time()
+        data = {name: checked for name, checked in self._checked.items() if now - checked < self.ttl}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.path.with_name(f"{self.path.name}.part")
+            partial.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(partial, self.path)
+        except OSError:
+            logger.warning("Could not write recognizer cache %s", self.path, exc_info=True)
+
+
+class ASRSession:
+    """Speech clients and recognizer lookups shared by every ASR request.
+
+    Keeps one client, and so one gRPC channel, per (credentials, location) and resolves
+    each project ID and recognizer once instead of on every request. Safe to use from
+    several threads at once. ``close`` shuts the channels down.
+    """
+
+    requires_credentials = True
+    rate_limited = True
+    concurrency = 0
+
+    def __init__(self, recognizers: RecognizerCache | None = None):
+        self.recognizers = recognizers or RecognizerCache()
+        self._lock = threading.Lock()
+        self._recognizer_lock = threading.Lock()
+        self._clients: dict[tuple[str, str], SpeechClient] = {}
+        self._project_ids: dict[tuple[str, str, str], str] = {}
+
+    def _client(self, credentials_path: Path | None, location: str) -> SpeechClient:
+        key = (str(credentials_path or ""), location)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = _client(credentials_path, location)
+        return client
+
+    def _project_id(self, credentials_path: Path | None) -> str:
+        key = (
+            str(credentials_path or ""),
+            os.getenv("GOOGLE_CLOUD_PROJECT", ""),
+            os.getenv("GOOGLE_CLOUD_QUOTA_PROJECT", ""),
+        )
+        project_id = self._project_ids.get(key)
+        if project_id is None:
+            project_id = self._project_ids[key] = _resolve_project_id(credentials_path)
+        return project_id
+
+    def recognizer_name(self, credentials_path: Path | None) -> str:
+        """The recognizer requests with these credentials go to, without any RPC."""
+        return _resolve_recognizer_name(self._project_id(credentials_path), _resolve_location())[0]
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        return is_retryable_error(exc)
+
+    def _recognizer(
+        self,
+        client: SpeechClient,
+        credentials_path: Path | None,
+        location: str,
+        language: str,
+        model: str,
+    ) -> str:
+        project_id = self._project_id(credentials_path)
+        recognizer_name, recognizer_id = _resolve_recognizer_name(project_id, location)
+        if recognizer_name not in self.recognizers:
+            # One thread looks the recognizer up while the others wait for its answer.
+            with self._recognizer_lock:
+                if recognizer_name not in self.recognizers:
+                    _ensure_recognizer(client, project_id, location, recognizer_name, recognizer_id, language, model)
+                    self.recognizers.add(recognizer_name)
+        return recognizer_name
+
+    def transcribe_wav(
+        self,
+        audio_path: Path,
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> str:
+        """Transcribe a 16 kHz mono WAV file.
+
+        Files longer than synchronous recognition allows are streamed from disk a chunk at
+        a time instead; ``on_partial`` then gets the transcript so far as it grows.
+        """
+        if wav_duration_ms(audio_path) > STREAMING_MIN_MS:
+            chunks = iter_pcm(audio_path, STREAM_CHUNK_FRAMES)
+            return self.stream_pcm(chunks, credentials_path, language, model, on_partial).transcript
+        return self.transcribe_pcm(read_pcm(audio_path), credentials_path, language, model)
+
+    def transcribe_pcm(
+        self,
+        audio_content: bytes | memoryview,
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+    ) -> str:
+        """Transcribe raw 16 kHz mono 16-bit PCM, e.g. a range of a virtual split's working WAV."""
+        return self.recognize_pcm(audio_content, credentials_path, language, model).transcript
+
+    def recognize_pcm(
+        self,
+        audio_content: bytes | memoryview,
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        word_offsets: bool = False,
+    ) -> RecognitionResult:
+        client, recognizer_name, config = self._prepare(credentials_path, language, model, word_offsets)
+        request = cloud_speech.RecognizeRequest(
+            recognizer=recognizer_name,
+            config=config,
+            content=bytes(audio_content),
+        )
+        try:
+            response = client.recognize(request=request)
+        except NotFound:
+            # The recognizer was deleted since it was cached; look it up again next time.
+            self.recognizers.discard(recognizer_name)
+            raise
+
+        transcripts = []
+        alternatives = []
+        words = []
+        for result in response.results:
+            if result.alternatives:
+                transcripts.append(result.alternatives[0].transcript)
+                words.extend(
+                    (
+                        info.word,
+                        round(info.start_offset.total_seconds() * 1000),
+                        round(info.end_offset.total_seconds() * 1000),
+                    )
+                    for info in result.alternatives[0].words
+                )
+            alternatives.append(
+                [
+                    {"transcript": alternative.transcript, "confidence": alternative.confidence}
+                    for alternative in result.alternatives
+                ]
+            )
+
+        return RecognitionResult(" ".join(transcripts).strip(), alternatives, words)
+
+    def stream_pcm(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> RecognitionResult:
+        """Recognize raw 16 kHz mono 16-bit PCM with streaming recognition.
+
+        ``chunks`` are sent as they are produced, so a file read incrementally never has
+        to be in memory whole; keep each under 25 KB. A stream takes up to five minutes of
+        audio, so longer audio is sent as consecutive streams of ``STREAM_MAX_MS`` each
+        and their results joined; a word spoken across a cut may be misrecognized. With
+        ``on_partial``, interim results are requested and it is called with the final
+        results so far plus the current hypothesis whenever that changes.
+        """
+        client, recognizer_name, config = self._prepare(credentials_path, language, model)
+        streaming_config = cloud_speech.StreamingRecognitionConfig(
+            config=config,
+            streaming_features=cloud_speech.StreamingRecognitionFeatures(interim_results=on_partial is not None),
+        )
+        source = iter(chunks)
+        # The rest of a chunk that did not fit into the previous stream.
+        carried: list[bytes | memoryview] = []
+
+        def next_chunk() -> bytes | memoryview | None:
+            return carried.pop() if carried else next(source, None)
+
+        def requests(chunk: bytes | memoryview):
+            yield cloud_speech.StreamingRecognizeRequest(recognizer=recognizer_name, streaming_config=streaming_config)
+            budget = STREAM_MAX_BYTES
+            while chunk is not None:
+                if len(chunk) > budget:
+                    carried.append(chunk[budget:])
+                    chunk = chunk[:budget]
+                yield cloud_speech.StreamingRecognizeRequest(audio=bytes(chunk))
+                budget -= len(chunk)
+                if budget <= 0:
+                    return
+                chunk = next_chunk()
+
+        transcripts = []
+        alternatives = []
+        try:
+            while (first := next_chunk()) is not None:
+                for response in client.streaming_recognize(requests=requests(first)):
+                    interim = []
+                    for result in response.results:
+                        if not result.alternatives:
+                            continue
+                        if not result.is_final:
+                            interim.append(result.alternatives[0].transcript)
+                            continue
+                        transcripts.append(result.alternatives[0].transcript)
+                        alternatives.append(
+                            [
+                                {"transcript": alternative.transcript, "confidence": alternative.confidence}
+                                for alternative in result.alternatives
+                            ]
+                        )
+                    # Final results of earlier streams carry over, so the transcript only grows.
+                    if on_partial is not None and response.results:
+                        on_partial(" ".join(transcripts + interim).strip())
+        except NotFound:
+            self.recognizers.discard(recognizer_name)
+            raise
+
+        return RecognitionResult(" ".join(transcripts).strip(), alternatives)
+
+    def _prepare(
+        self,
+        credentials_path: Path | None,
+        language: str,
+        model: str | None,
+        word_offsets: bool = False,
+    ) -> tuple[SpeechClient, str, cloud_speech.RecognitionConfig]:
+        location = _resolve_location()
+        client = self._client(credentials_path, location)
+        resolved_model = model or DEFAULT_ASR_MODEL
+        recognizer_name = self._recognizer(client, credentials_path, location, language, resolved_model)
+        config = cloud_speech.RecognitionConfig(
+            explicit_decoding_config=cloud_speech.ExplicitDecodingConfig(
+                encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=16000,
+                audio_channel_count=1,
+            ),
+            language_codes=[language],
+            model=resolved_model,
+            features=cloud_speech.RecognitionFeatures(enable_word_time_offsets=word_offsets),
+        )
+        return client, recognizer_name, config
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.transport.close()
+
+    def __enter__(self) -> ASRSession:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
 def transcribe_wav(
     audio_path: Path,
     credentials_path: Path | None,
-    language: str = "en-US",
+    language: str = DEFAULT_ASR_LANGUAGE,
     model: str | None = DEFAULT_ASR_MODEL,
+    on_partial: Callable[[str], None] | None = None,
 ) -> str:
-    with wave.open(str(audio_path), "rb") as wav_file:
-        audio_content = wav_file.readframes(wav_file.getnframes())
-
-    location = _resolve_location()
-    client = _client(credentials_path, location)
-    project_id = _resolve_project_id(credentials_path)
-    recognizer_name, recognizer_id = _resolve_recognizer_name(project_id, location)
-    resolved_model = model or DEFAULT_ASR_MODEL
-    _ensure_recognizer(
-        client,
-        project_id,
-        location,
-        recognizer_name,
-        recognizer_id,
-        language,
-        resolved_model,
-    )
-    config = cloud_speech.RecognitionConfig(
-        explicit_decoding_config=cloud_speech.ExplicitDecodingConfig(
-            encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
-            audio_channel_count=1,
-        ),
-        language_codes=[language],
-        model=resolved_model,
-    )
-    request = cloud_speech.RecognizeRequest(
-        recognizer=recognizer_name,
-        config=config,
-        content=audio_content,
-    )
-    response = client.recognize(request=request)
+    """One-off transcription; use an ``ASRSession`` for more than one request."""
+    with ASRSession() as session:
+        return session.transcribe_wav(audio_path, credentials_path, language, model, on_partial)
 
-    transcripts = []
-    for result in response.results:
-        if result.alternatives:
-            transcripts.append(result.alternatives[0].transcript)
 
-    return " ".join(transcripts).strip()
+def transcribe_pcm(
+    audio_content: bytes | memoryview,
+    credentials_path: Path | None,
+    language: str = DEFAULT_ASR_LANGUAGE,
+    model: str | None = DEFAULT_ASR_MODEL,
+) -> str:
+    """One-off transcription; use an ``ASRSession`` for more than one request."""
+    with ASRSession() as session:
+        return session.transcribe_pcm(audio_content, credentials_path, language, model)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Protocol
+
+DEFAULT_ASR_MODEL = "chirp_3"
+DEFAULT_ASR_LANGUAGE = "en-US"
+# Synchronous recognition takes up to a minute of audio; longer segments are streamed.
+STREAMING_MIN_MS = 55_000
+# Audio per streaming request, as the Speech-to-Text docs recommend.
+STREAM_CHUNK_MS = 100
+# A stream takes up to five minutes of audio; longer audio goes out in consecutive streams.
+STREAM_MAX_MS = 290_000
+
+ASR_BACKEND_GOOGLE = "google"
+ASR_BACKEND_FAKE = "fake"
+ASR_BACKEND_WHISPER = "whisper"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RecognitionResult:
+    """A transcript plus every alternative the recognizer returned, per result.
+
+    ``words`` holds (word, start_ms, end_ms) of the top alternatives when word time
+    offsets were requested.
+    """
+
+    transcript: str
+    alternatives: list[list[dict]]
+    words: list[tuple[str, int, int]] = field(default_factory=list)
+
+
+class ASRBackend(Protocol):
+    """What batch and single-segment ASR need from a speech recognition engine.
+
+    Implementations must allow ``recognize_pcm`` from several threads at once.
+    """
+
+    # Whether requests need the Google credentials the window asks for.
+    requires_credentials: bool
+    # Whether requests count against a service quota, so TEXTGRID_ASR_RATE applies.
+    rate_limited: bool
+    # Requests the engine can work on at once, so batch ASR keeps at least this many in
+    # flight; 0 leaves it to TEXTGRID_ASR_CONCURRENCY.
+    concurrency: int
+
+    def recognize_pcm(
+        self,
+        audio_content: bytes | memoryview,
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        word_offsets: bool = False,
+    ) -> RecognitionResult:
+        """Recognize raw 16 kHz mono 16-bit PCM."""
+        ...
+
+    def stream_pcm(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> RecognitionResult:
+        """Recognize PCM sent a chunk at a time, for audio too long for ``recognize_pcm``.
+
+        ``on_partial`` gets the transcript so far whenever the engine revises it.
+        """
+        ...
+
+    def recognizer_name(self, credentials_path: Path | None) -> str:
+        """Names the engine configuration, as part of ASR cache keys; no network calls."""
+        ...
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Whether ``exc`` is a quota or transient error worth retrying after a pause."""
+        ...
+
+    def close(self) -> None: ...
+
+
+def resolve_asr_backend() -> str:
+    """``google`` (default), ``whisper`` for offline ASR, ``fake`` for an in-process fake
+    server, or a fake server's URL."""
+    return os.getenv("TEXTGRID_ASR_BACKEND", "").strip() or ASR_BACKEND_GOOGLE
+
+
+def create_asr_backend(cache_dir: Path, backend: str | None = None) -> ASRBackend:
+    backend = backend or resolve_asr_backend()
+    if backend == ASR_BACKEND_FAKE:
+        from textgrid_transcriber.asr_fake import FakeASRServer, HTTPASRBackend
+
+        server = FakeASRServer()
+        server.start()
+        return HTTPASRBackend(server.url, server=server)
+    if backend == ASR_BACKEND_WHISPER:
+        from textgrid_transcriber.asr_whisper import WhisperBackend
+
+        return WhisperBackend()
+    if backend.startswith(("http://", "https://")):
+        from textgrid_transcriber.asr_fake import HTTPASRBackend
+
+        return HTTPASRBackend(backend)
+    if backend != ASR_BACKEND_GOOGLE:
+        logger.warning("Unknown ASR backend %r; using %s", backend, ASR_BACKEND_GOOGLE)
+
+    # Imported here so the Google client libraries load only when they are used.
+    from textgrid_transcriber.asr import ASRSession, RecognizerCache
+
+    return ASRSession(RecognizerCache(cache_dir / "recognizers.json"))
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Sequence
+
+from textgrid_transcriber.project import Segment
+
+DEFAULT_ASR_CONCURRENCY = 8
+# Requests per second; comfortably under Speech-to-Text's default per-minute quota.
+DEFAULT_ASR_RATE = 10.0
+DEFAULT_ASR_RETRIES = 4
+BACKOFF_BASE_S = 1.0
+BACKOFF_CAP_S = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_asr_concurrency() -> int:
+    value = os.getenv("TEXTGRID_ASR_CONCURRENCY", "").strip()
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return DEFAULT_ASR_CONCURRENCY
+
+
+def resolve_asr_rate() -> float:
+    """Requests per second to allow; ``0`` turns the limit off."""
+    value = os.getenv("TEXTGRID_ASR_RATE", "").strip()
+    try:
+        rate = float(value)
+    except ValueError:
+        return DEFAULT_ASR_RATE
+    return rate if rate >= 0 else DEFAULT_ASR_RATE
+
+
+def resolve_asr_retries() -> int:
+    value = os.getenv("TEXTGRID_ASR_RETRIES", "").strip()
+    if value.isdigit():
+        return int(value)
+    return DEFAULT_ASR_RETRIES
+
+
+def backoff_delay(attempt: int, rng: random.Random | None = None) -> float:
+    """Seconds to wait before retry ``attempt`` (from 0), with full jitter.
+
+    Drawing uniformly below the exponential bound spreads out the workers that hit
+    the same quota error together instead of having them all retry at once.
+    """
+    bound = min(BACKOFF_CAP_S, BACKOFF_BASE_S * (2**attempt))
+    return (rng or random).uniform(0, bound)
+
+
+def retry_delay(exc: BaseException, attempt: int, rng: random.Random | None = None) -> float:
+    """``backoff_delay``, but at least the ``retry_after`` seconds an error may carry.
+
+    Servers that throttle say when to come back (HTTP ``Retry-After``); retrying sooner
+    only earns another refusal.
+    """
+    delay = backoff_delay(attempt, rng)
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class RateLimiter:
+    """Token bucket shared by all request threads.
+
+    Allows ``rate`` requests per second on average and bursts of up to ``burst``.
+    A ``rate`` of 0 never waits.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    def acquire(self, cancelled: threading.Event | None = None) -> bool:
+        """Wait for a request slot; False if ``cancelled`` was set while waiting."""
+        if self.rate <= 0:
+            return True
+        cancelled = cancelled or threading.Event()
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                delay = (1 - self._tokens) / self.rate
+            if cancelled.wait(delay):
+                return False
+
+
+@dataclass(frozen=True)
+class SegmentFailure:
+    row: int
+    name: str
+    error: str
+    attempts: int
+
+
+@dataclass
+class BatchSummary:
+    total: int
+    succeeded: int = 0
+    cached: int = 0
+    requests: int = 0
+    retries: int = 0
+    failures: list[SegmentFailure] = field(default_factory=list)
+    cancelled: bool = False
+
+    def message(self) -> str:
+        cached = f" ({self.cached} from cache)" if self.cached else ""
+        if self.cancelled:
+            return f"ASR cancelled after {self.succeeded}/{self.total} segments{cached}."
+        if not self.failures:
+            return f"ASR complete: {self.succeeded}/{self.total} segments transcribed{cached}."
+        first = self.failures[0]
+        return (
+            f"ASR finished: {self.succeeded}/{self.total} segments transcribed{cached}, "
+            f"{len(self.failures)} failed (first: {first.name}: {first.error})."
+        )
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class _GaveUp(Exception):
+    def __init__(self, error: BaseException, attempts: int):
+        super().__init__(str(error) or type(error).__name__)
+        self.attempts = attempts
+
+
+_CANCELLED = _Cancelled()
+
+
+class BatchTranscriber:
+    """Transcribes many segments with several requests in flight.
+
+    Work comes in jobs: lists of segments sent together in one request, usually just
+    one. ``transcribe(segments)`` runs on up to ``workers`` threads and returns a
+    transcript per segment, or None for a segment that should be sent on its own
+    instead. Each call first takes a slot from ``limiter``; segments ``cached``
+    already has a transcript for are not sent at all. Errors ``retryable`` accepts are
+    retried up to ``retries`` times with ``retry_delay``; any other error, or one
+    that keeps recurring, is recorded for each segment of the request (after trying a
+    failed job's segments one by one) and the batch moves on. Results are handed to
+    the callbacks on the thread that called ``run``, in completion order.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[list[Segment]], list[str | None]],
+        workers: int,
+        limiter: RateLimiter,
+        retries: int,
+        retryable: Callable[[BaseException], bool],
+        rng: random.Random | None = None,
+        cached: Callable[[Segment], str | None] | None = None,
+    ):
+        self._transcribe = transcribe
+        self.workers = max(1, workers)
+        self.limiter = limiter
+        self.retries = retries
+        self._retryable = retryable
+        self._rng = rng or random.Random()
+        self._cached = cached
+        self._cancelled = threading.Event()
+        self._count_lock = threading.Lock()
+        self._retry_count = 0
+        self._request_count = 0
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(
+        self,
+        jobs: Sequence[Sequence[tuple[int, Segment]]],
+        on_result: Callable[[int, str], None],
+        on_progress: Callable[[int, int, str], None] | None = None,
+    ) -> BatchSummary:
+        summary = BatchSummary(sum(len(job) for job in jobs))
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asr") as pool:
+            pending = {pool.submit(self._run_job, job) for job in jobs if job}
+            try:
+                while pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        for row, segment, outcome in future.result():
+                            if outcome is _CANCELLED:
+                                continue
+                            name = Path(segment.path).name
+                            if isinstance(outcome, _GaveUp):
+                                summary.failures.append(SegmentFailure(row, name, str(outcome), outcome.attempts))
+                            else:
+                                transcript, from_cache = outcome
+                                summary.succeeded += 1
+                                summary.cached += from_cache
+                                on_result(row, transcript)
+                            done += 1
+                            if on_progress:
+                                on_progress(done, summary.total, name)
+            finally:
+                for future in pending:
+                    future.cancel()
+        summary.requests = self._request_count
+        summary.retries = self._retry_count
+        summary.cancelled = self._cancelled.is_set()
+        summary.failures.sort(key=lambda failure: failure.row)
+        return summary
+
+    def _run_job(self, job: Sequence[tuple[int, Segment]]) -> list[tuple[int, Segment, object]]:
+        outcomes: list[object] = [None] * len(job)
+        remaining = []
+        for position, (_, segment) in enumerate(job):
+            transcript = self._lookup(segment)
+            if transcript is not None:
+                outcomes[position] = (transcript, True)
+            else:
+                remaining.append(position)
+
+        alone = []
+        if len(remaining) > 1:
+            try:
+                transcripts = self._request([job[position][1] for position in remaining])
+            except _Cancelled:
+                transcripts = [_CANCELLED] * len(remaining)
+            except _GaveUp:
+                transcripts = [None] * len(remaining)
+            for position, transcript in zip(remaining, transcripts):
+                if transcript is None:
+                    alone.append(position)
+                else:
+                    outcomes[position] = transcript if transcript is _CANCELLED else (transcript, False)
+        else:
+            alone = remaining
+
+        for position in alone:
+            try:
+                transcript = self._request([job[position][1]])[0]
+            except _Cancelled:
+                outcomes[position] = _CANCELLED
+            except _GaveUp as exc:
+                outcomes[position] = exc
+            else:
+                outcomes[position] = (transcript or "", False)
+        return [(row, segment, outcome) for (row, segment), outcome in zip(job, outcomes)]
+
+    def _lookup(self, segment: Segment) -> str | None:
+        if self._cached is None or self._cancelled.is_set():
+            return None
+        try:
+            return self._cached(segment)
+        except Exception:
+            # A failed lookup only costs the request it would have saved.
+            logger.warning("ASR cache lookup failed for %s", Path(segment.path).name, exc_info=True)
+            return None
+
+    def _request(self, segments: list[Segment]) -> list[str | None]:
+        attempt = 0
+        while True:
+            if self._cancelled.is_set() or not self.limiter.acquire(self._cancelled):
+                raise _Cancelled()
+            with self._count_lock:
+                self._request_count += 1
+            try:
+                return self._transcribe(segments)
+            except Exception as exc:
+                if self._cancelled.is_set():
+                    raise _Cancelled() from exc
+                if attempt >= self.retries or not self._retryable(exc):
+                    raise _GaveUp(exc, attempt + 1) from exc
+                delay = retry_delay(exc, attempt, self._rng)
+            with self._count_lock:
+                self._retry_count += 1
+            if self._cancelled.wait(delay):
+                raise _Cancelled()
+            attempt += 1
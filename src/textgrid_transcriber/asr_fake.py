@@ -0,0 +1,463 @@
+"""A local stand-in for a speech recognition service, for load tests and benchmarks.
+
+Run it on its own with ``python -m textgrid_transcriber.asr_fake --port 8765`` and set
+``TEXTGRID_ASR_BACKEND=http://127.0.0.1:8765``, or set ``TEXTGRID_ASR_BACKEND=fake`` to
+start one inside the app.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from array import array
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from textgrid_transcriber.asr_backend import DEFAULT_ASR_LANGUAGE, DEFAULT_ASR_MODEL, RecognitionResult
+
+SAMPLE_RATE = 16000
+FRAME_MS = 10
+# Samples quieter than this count as silence.
+SILENCE_LEVEL = 500
+# Silence at least this long ends a word; shorter than the gap between packed segments.
+WORD_GAP_MS = 200
+VOCABULARY = (
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliett", "kilo", "lima", "mike", "november", "oscar", "papa",
+)  # fmt: skip
+
+
+@dataclass
+class FakeServerStats:
+    requests: int = 0
+    succeeded: int = 0
+    throttled: int = 0
+    errors: int = 0
+    max_in_flight: int = 0
+    audio_ms: int = 0
+
+
+def fake_words(pcm: bytes) -> list[tuple[str, int, int]]:
+    """One word per stretch of sound in 16 kHz mono 16-bit PCM, with its (start_ms, end_ms).
+
+    The word is picked from the stretch's samples, so the same audio always gets the
+    same transcript.
+    """
+    samples = array("h")
+    samples.frombytes(pcm[: len(pcm) - len(pcm) % 2])
+    frame = SAMPLE_RATE * FRAME_MS // 1000
+    words = []
+    start = None
+    quiet = 0
+    for position in range(0, len(samples), frame):
+        chunk = samples[position : position + frame]
+        if max(chunk) > SILENCE_LEVEL or -min(chunk) > SILENCE_LEVEL:
+            if start is None:
+                start = position
+            quiet = 0
+            end = position + len(chunk)
+        elif start is not None:
+            quiet += FRAME_MS
+            if quiet >= WORD_GAP_MS:
+                words.append((start, end))
+                start = None
+    if start is not None:
+        words.append((start, end))
+    result = []
+    for start, end in words:
+        # Trim to the loud samples, so where the frames happen to fall does not matter.
+        while abs(samples[start]) <= SILENCE_LEVEL:
+            start += 1
+        while abs(samples[end - 1]) <= SILENCE_LEVEL:
+            end -= 1
+        word = VOCABULARY[zlib.crc32(samples[start:end].tobytes()) % len(VOCABULARY)]
+        result.append((word, start * 1000 // SAMPLE_RATE, end * 1000 // SAMPLE_RATE))
+    return result
+
+
+class FakeASRServer:
+    """An HTTP server that answers ``POST /recognize`` with made-up transcripts.
+
+    Each request waits ``latency_ms`` plus ``latency_per_s_ms`` for every second of
+    audio, give or take ``jitter_ms``. ``rate`` (requests per second, bursts up to
+    ``burst``) and ``max_concurrent`` turn excess requests away with 429; ``error_rate``
+    of the rest fail with 503. Which attempts fail depends only on ``seed``, the audio
+    and how often it was sent before, not on the order requests arrive in, so a batch
+    sees the same errors every run. Transcripts come from ``fake_words``.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        latency_per_s_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate: float = 0.0,
+        burst: int = 1,
+        max_concurrent: int = 0,
+        seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.latency_per_s_ms = latency_per_s_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrent = max_concurrent
+        self.seed = seed
+        self.stats = FakeServerStats()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._attempts: dict[bytes, int] = {}
+        self._thread: threading.Thread | None = None
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-asr", daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> FakeASRServer:
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _admit(self) -> float | None:
+        """Count a request in; seconds until a retry makes sense if it is throttled."""
+        with self._lock:
+            self.stats.requests += 1
+            if self.max_concurrent and self._in_flight >= self.max_concurrent:
+                self.stats.throttled += 1
+                return 1.0
+            if self.rate > 0:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens < 1:
+                    self.stats.throttled += 1
+                    return (1 - self._tokens) / self.rate
+                self._tokens -= 1
+            self._in_flight += 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+            return None
+
+    def _attempt(self, pcm: bytes) -> tuple[float, bool]:
+        """Count an attempt at ``pcm``: its latency in seconds and whether it fails."""
+        digest = hashlib.blake2b(pcm, digest_size=16).digest()
+        audio_ms = len(pcm) * 1000 // (SAMPLE_RATE * 2)
+        with self._lock:
+            attempt = self._attempts.get(digest, 0)
+            self._attempts[digest] = attempt + 1
+            self.stats.audio_ms += audio_ms
+        rng = random.Random(f"{self.seed}:{digest.hex()}:{attempt}")
+        delay = self.latency_ms + self.latency_per_s_ms * audio_ms / 1000
+        if self.jitter_ms:
+            delay += rng.uniform(-self.jitter_ms, self.jitter_ms)
+        failed = rng.random() < self.error_rate
+        if failed:
+            with self._lock:
+                self.stats.errors += 1
+        return max(0.0, delay) / 1000, failed
+
+    def _respond(self, pcm: bytes, word_offsets: bool) -> tuple[int, dict]:
+        delay, failed = self._attempt(pcm)
+        time.sleep(delay)
+        if failed:
+            return 503, {"error": "fake server error"}
+
+        words = fake_words(pcm)
+        transcript = " ".join(word for word, _, _ in words)
+        with self._lock:
+            self.stats.succeeded += 1
+        return 200, {
+            "transcript": transcript,
+            "alternatives": [[{"transcript": transcript, "confidence": 0.9}]] if words else [],
+            "words": words if word_offsets else [],
+        }
+
+    def _stream(self, pcm: bytes) -> Iterator[dict]:
+        """Interim results, one more word each, then the final result.
+
+        The latency is spread over the words by their position in the audio, so the
+        first word arrives well before the whole transcript would.
+        """
+        delay, failed = self._attempt(pcm)
+        if failed:
+            yield {"error": "fake server error"}
+            return
+        words = fake_words(pcm)
+        audio_ms = max(1, len(pcm) * 1000 // (SAMPLE_RATE * 2))
+        spent = 0.0
+        for count, (_, _, end_ms) in enumerate(words, 1):
+            time.sleep(max(0.0, delay * end_ms / audio_ms - spent))
+            spent = max(spent, delay * end_ms / audio_ms)
+            yield {"transcript": " ".join(word for word, _, _ in words[:count]), "final": False}
+        time.sleep(max(0.0, delay - spent))
+        transcript = " ".join(word for word, _, _ in words)
+        with self._lock:
+            self.stats.succeeded += 1
+        yield {
+            "transcript": transcript,
+            "alternatives": [[{"transcript": transcript, "confidence": 0.9}]] if words else [],
+            "final": True,
+        }
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                url = urllib.parse.urlsplit(self.path)
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    pcm = self._read_chunked()
+                else:
+                    pcm = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if url.path not in ("/recognize", "/stream"):
+                    self._send(404, {"error": "not found"})
+                    return
+                retry_after = server._admit()
+                if retry_after is not None:
+                    self._send(429, {"error": "throttled"}, {"Retry-After": str(math.ceil(retry_after))})
+                    return
+                try:
+                    if url.path == "/stream":
+                        self._send_stream(pcm)
+                        return
+                    query = urllib.parse.parse_qs(url.query)
+                    status, body = server._respond(pcm, query.get("word_offsets") == ["1"])
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+                self._send(status, body)
+
+            def _read_chunked(self) -> bytes:
+                parts = []
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0], 16)
+                    if size == 0:
+                        self.rfile.readline()
+                        return b"".join(parts)
+                    parts.append(self.rfile.read(size))
+                    self.rfile.readline()
+
+            def _send_stream(self, pcm: bytes) -> None:
+                messages = server._stream(pcm)
+                first = next(messages)
+                if first.get("error"):
+                    self._send(503, first)
+                    return
+                # Newline-delimited JSON, written as each result is ready; the connection
+                # closing marks the end.
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                for message in itertools.chain((first,), messages):
+                    self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+            def _send(self, status: int, body: dict, headers: dict[str, str] | None = None) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class ASRHTTPError(Exception):
+    """An error response; ``retry_after`` holds the seconds the server asked to wait, if any."""
+
+    def __init__(self, status: int, message: str, retry_after: float | None = None):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_response(cls, exc: urllib.error.HTTPError) -> ASRHTTPError:
+        # Only the delta-seconds form; the fake server never sends an HTTP date.
+        value = (exc.headers.get("Retry-After") or "").strip() if exc.headers else ""
+        try:
+            retry_after = max(0.0, float(value))
+        except ValueError:
+            retry_after = None
+        return cls(exc.code, exc.reason, retry_after)
+
+
+class HTTPASRBackend:
+    """An ``ASRBackend`` for a ``FakeASRServer`` at ``url``; closes ``server`` if given one."""
+
+    requires_credentials = False
+    # It stands in for a service with a quota.
+    rate_limited = True
+    concurrency = 0
+
+    def __init__(self, url: str, server: FakeASRServer | None = None, timeout: float = 60.0):
+        self.url = url.rstrip("/")
+        self.server = server
+        self.timeout = timeout
+
+    def recognize_pcm(
+        self,
+        audio_content: bytes | memoryview,
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        word_offsets: bool = False,
+    ) -> RecognitionResult:
+        query = urllib.parse.urlencode(
+            {"language": language, "model": model or DEFAULT_ASR_MODEL, "word_offsets": int(word_offsets)}
+        )
+        request = urllib.request.Request(
+            f"{self.url}/recognize?{query}",
+            data=bytes(audio_content),
+            headers={"Content-Type": "application/octet-stream"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            raise ASRHTTPError.from_response(exc) from exc
+        except urllib.error.URLError as exc:
+            raise ConnectionError(str(exc.reason)) from exc
+        return RecognitionResult(
+            body["transcript"],
+            body["alternatives"],
+            [(word, start_ms, end_ms) for word, start_ms, end_ms in body["words"]],
+        )
+
+    def stream_pcm(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> RecognitionResult:
+        query = urllib.parse.urlencode({"language": language, "model": model or DEFAULT_ASR_MODEL})
+        # An iterable body goes out with chunked transfer encoding as it is produced.
+        request = urllib.request.Request(
+            f"{self.url}/stream?{query}",
+            data=(bytes(chunk) for chunk in chunks),
+            headers={"Content-Type": "application/octet-stream"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                for line in response:
+                    message = json.loads(line)
+                    if message["final"]:
+                        return RecognitionResult(message["transcript"], message["alternatives"])
+                    if on_partial is not None:
+                        on_partial(message["transcript"])
+        except urllib.error.HTTPError as exc:
+            raise ASRHTTPError.from_response(exc) from exc
+        except urllib.error.URLError as exc:
+            raise ConnectionError(str(exc.reason)) from exc
+        raise ConnectionError("ASR stream ended without a final result.")
+
+    def recognizer_name(self, credentials_path: Path | None) -> str:
+        # Every fake server answers the same audio the same way.
+        return "fake"
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, ASRHTTPError):
+            return exc.status == 429 or exc.status >= 500
+        return isinstance(exc, (ConnectionError, TimeoutError))
+
+    def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="time per request")
+    parser.add_argument("--latency-per-s-ms", type=float, default=0.0, help="extra time per second of audio")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random spread of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests failing with 503")
+    parser.add_argument("--rate", type=float, default=0.0, help="requests per second before 429s, 0 for no limit")
+    parser.add_argument("--burst", type=int, default=1, help="requests allowed at once under --rate")
+    parser.add_argument("--max-concurrent", type=int, default=0, help="requests in flight before 429s")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def server_from_arguments(args: argparse.Namespace, host: str = "127.0.0.1", port: int = 0) -> FakeASRServer:
+    return FakeASRServer(
+        host,
+        port,
+        latency_ms=args.latency_ms,
+        latency_per_s_ms=args.latency_per_s_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate=args.rate,
+        burst=args.burst,
+        max_concurrent=args.max_concurrent,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = server_from_arguments(args, args.host, args.port)
+    print(f"Fake ASR server on {server.url}; set TEXTGRID_ASR_BACKEND={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        print(json.dumps(asdict(server.stats)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from bisect import bisect_right
+from typing import Sequence
+
+from textgrid_transcriber.project import Segment
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+
+# Silence between packed segments, so words do not run together across them.
+PACK_GAP_MS = 300
+# Only segments up to this long are packed; longer ones are worth a request of their own.
+PACK_MAX_SEGMENT_MS = 2000
+# Synchronous recognition takes up to a minute of audio; stay clear of the limit.
+PACK_MAX_MS = 55_000
+# How far a word's timestamps may reach past its segment; under half the gap, so no
+# word can fit two segments.
+WORD_TOLERANCE_MS = 120
+
+
+def resolve_asr_packing() -> bool:
+    return os.getenv("TEXTGRID_ASR_PACKING", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def plan_packs(
+    items: Sequence[tuple[int, Segment]],
+    max_segment_ms: int = PACK_MAX_SEGMENT_MS,
+    max_pack_ms: int = PACK_MAX_MS,
+    gap_ms: int = PACK_GAP_MS,
+) -> list[list[tuple[int, Segment]]]:
+    """Group short segments into packs that fit one request, each from a single tier.
+
+    Segments keep their order within a tier, so a pack holds neighbouring intervals
+    even when the tiers are interleaved. Longer segments get packs of their own.
+    """
+    packs: list[list[tuple[int, Segment]]] = []
+    open_packs: dict[str, tuple[list[tuple[int, Segment]], int]] = {}
+    for row, segment in items:
+        duration = segment.end_ms - segment.start_ms
+        if duration > max_segment_ms:
+            packs.append([(row, segment)])
+            continue
+        pack, pack_ms = open_packs.get(segment.tier, (None, 0))
+        if pack is None or pack_ms + gap_ms + duration > max_pack_ms:
+            pack, pack_ms = [], -gap_ms
+            packs.append(pack)
+        pack.append((row, segment))
+        open_packs[segment.tier] = (pack, pack_ms + gap_ms + duration)
+    return packs
+
+
+def pack_audio(
+    audios: Sequence[bytes | memoryview], gap_ms: int = PACK_GAP_MS
+) -> tuple[bytes, list[tuple[int, int]]]:
+    """Join 16 kHz mono 16-bit PCM clips with silence between them.
+
+    Returns the joined PCM and the (start_ms, end_ms) each clip occupies in it.
+    """
+    bytes_per_ms = SAMPLE_RATE * SAMPLE_WIDTH // 1000
+    gap = bytes(gap_ms * bytes_per_ms)
+    parts = []
+    spans = []
+    position = 0
+    for index, audio in enumerate(audios):
+        if index:
+            parts.append(gap)
+            position += len(gap)
+        parts.append(audio)
+        spans.append((position // bytes_per_ms, (position + len(audio)) // bytes_per_ms))
+        position += len(audio)
+    return b"".join(parts), spans
+
+
+def split_words(
+    words: Sequence[tuple[str, int, int]],
+    spans: Sequence[tuple[int, int]],
+    tolerance_ms: int = WORD_TOLERANCE_MS,
+) -> list[str] | None:
+    """Assign recognized words, with their (start_ms, end_ms), to the clips in ``spans``.
+
+    A word belongs to the clip it lies within, give or take ``tolerance_ms``. Returns
+    one transcript per clip, or None when some word fits no clip: it sits in the
+    silence between clips or runs from one into the next.
+    """
+    texts: list[list[str]] = [[] for _ in spans]
+    starts = [span_start for span_start, _ in spans]
+    for word, start_ms, end_ms in words:
+        index = bisect_right(starts, start_ms + tolerance_ms) - 1
+        if index < 0:
+            return None
+        span_start, span_end = spans[index]
+        if start_ms < span_start - tolerance_ms or end_ms > span_end + tolerance_ms:
+            return None
+        texts[index].append(word)
+    return [" ".join(text) for text in texts]
@@ -0,0 +1,207 @@
+"""Offline ASR with faster-whisper (CTranslate2 Whisper models) on a local process pool.
+
+Install the optional dependency with ``pip install 'textgrid-transcriber[offline]'`` and set
+``TEXTGRID_ASR_BACKEND=whisper``. No audio leaves the machine.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Iterable
+
+from textgrid_transcriber.asr_backend import DEFAULT_ASR_LANGUAGE, DEFAULT_ASR_MODEL, RecognitionResult
+
+DEFAULT_WHISPER_MODEL = "small"
+# 8-bit weights roughly double CPU throughput over float32 at a small accuracy cost.
+DEFAULT_WHISPER_COMPUTE_TYPE = "int8"
+WHISPER_BEAM_SIZE = 5
+
+# The model each worker process loaded in ``_load_model``, or why it could not.
+_model = None
+_load_error: str | None = None
+
+
+def resolve_whisper_model() -> str:
+    """A model size such as ``small`` or ``large-v3``, or the path of a converted model."""
+    return os.getenv("TEXTGRID_WHISPER_MODEL", "").strip() or DEFAULT_WHISPER_MODEL
+
+
+def resolve_whisper_compute_type() -> str:
+    return os.getenv("TEXTGRID_WHISPER_COMPUTE_TYPE", "").strip() or DEFAULT_WHISPER_COMPUTE_TYPE
+
+
+def resolve_whisper_workers() -> int:
+    value = os.getenv("TEXTGRID_WHISPER_WORKERS", "").strip()
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return os.cpu_count() or 1
+
+
+def whisper_available() -> bool:
+    return importlib.util.find_spec("faster_whisper") is not None
+
+
+def _load_model(model: str, compute_type: str, cpu_threads: int) -> None:
+    global _model, _load_error
+    # An initializer that raises only breaks the pool, losing the reason; keep it for
+    # ``_check_model`` to report instead.
+    try:
+        from faster_whisper import WhisperModel
+
+        _model = WhisperModel(model, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads)
+    except Exception as exc:
+        _load_error = f"{type(exc).__name__}: {exc}"
+
+
+def _check_model() -> str | None:
+    """Runs in a worker process; why the model failed to load, or None."""
+    return _load_error
+
+
+def _recognize(pcm: bytes, language: str | None, word_offsets: bool) -> tuple[str, list, list]:
+    """Runs in a worker process; returns the fields of a ``RecognitionResult``."""
+    import numpy as np
+
+    # 16 kHz mono 16-bit PCM is what Whisper expects once scaled to [-1, 1), so there is
+    # nothing to decode or resample.
+    audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    segments, _ = _model.transcribe(
+        audio,
+        language=language,
+        beam_size=WHISPER_BEAM_SIZE,
+        word_timestamps=word_offsets,
+        condition_on_previous_text=False,
+    )
+    transcripts = []
+    alternatives = []
+    words = []
+    for segment in segments:
+        text = segment.text.strip()
+        transcripts.append(text)
+        alternatives.append([{"transcript": text, "confidence": math.exp(segment.avg_logprob)}])
+        words.extend(
+            (word.word.strip(), round(word.start * 1000), round(word.end * 1000)) for word in segment.words or ()
+        )
+    return " ".join(transcripts).strip(), alternatives, words
+
+
+class WhisperBackend:
+    """An ``ASRBackend`` running faster-whisper in ``workers`` processes.
+
+    Each process loads the model once, when the pool starts on the first request, and
+    then serves requests one at a time with its share of the CPU threads. Requests from
+    several threads queue for the next free process. A model that fails to load fails
+    every request with the reason, without retrying. A pool that lost a process (e.g.
+    out of memory) is replaced, and the request is retryable once the pool has served
+    one. The ``model`` argument of requests names a Google model and is ignored.
+    """
+
+    requires_credentials = False
+    rate_limited = False
+
+    def __init__(
+        self,
+        model: str | None = None,
+        workers: int | None = None,
+        compute_type: str | None = None,
+    ):
+        self.model = model or resolve_whisper_model()
+        self.workers = workers or resolve_whisper_workers()
+        self.compute_type = compute_type or resolve_whisper_compute_type()
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._load_error: RuntimeError | None = None
+        self._served = False
+
+    @property
+    def concurrency(self) -> int:
+        # One request per process keeps every process busy.
+        return self.workers
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._load_error is not None:
+                raise self._load_error
+            if self._pool is None:
+                if not whisper_available():
+                    raise RuntimeError(
+                        "Offline ASR needs faster-whisper: pip install 'textgrid-transcriber[offline]'."
+                    )
+                cpu_threads = max(1, (os.cpu_count() or 1) // self.workers)
+                # Spawned, not forked: the window's threads must not be copied mid-operation.
+                pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_load_model,
+                    initargs=(self.model, self.compute_type, cpu_threads),
+                )
+                # Every process runs the same initializer, so one that loaded the model
+                # vouches for the rest; other requests wait on the lock meanwhile.
+                try:
+                    error = pool.submit(_check_model).result()
+                except BrokenProcessPool as exc:
+                    error = f"the worker process exited ({exc})"
+                if error is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self._load_error = RuntimeError(f"Whisper model {self.model!r} failed to load: {error}")
+                    raise self._load_error
+                self._pool = pool
+            return self._pool
+
+    def recognize_pcm(
+        self,
+        audio_content: bytes | memoryview,
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        word_offsets: bool = False,
+    ) -> RecognitionResult:
+        pool = self._executor()
+        # Whisper takes ISO 639-1 codes: "en" for "en-US".
+        whisper_language = language.split("-")[0].lower() or None
+        try:
+            transcript, alternatives, words = pool.submit(
+                _recognize, bytes(audio_content), whisper_language, word_offsets
+            ).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        self._served = True
+        return RecognitionResult(transcript, alternatives, words)
+
+    def stream_pcm(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        credentials_path: Path | None,
+        language: str = DEFAULT_ASR_LANGUAGE,
+        model: str | None = DEFAULT_ASR_MODEL,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> RecognitionResult:
+        """Whisper has no length limit, so long audio is joined and recognized in one go."""
+        audio = b"".join(bytes(chunk) for chunk in chunks)
+        return self.recognize_pcm(audio, credentials_path, language, model)
+
+    def recognizer_name(self, credentials_path: Path | None) -> str:
+        return f"whisper:{self.model}:{self.compute_type}"
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        # Until a request has come back, a broken pool more likely means the processes
+        # cannot run at all than that one ran out of memory.
+        return isinstance(exc, BrokenProcessPool) and self._served
+
+    def close(self) -> None:
+        with self._lock:
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
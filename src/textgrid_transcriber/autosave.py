@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
+
+DEFAULT_AUTOSAVE_DELAY_MS = 1000
+
+STATE_SAVED = "Saved"
+STATE_UNSAVED = "Unsaved changes"
+STATE_SAVING = "Saving…"
+STATE_FAILED = "Save failed"
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_autosave_delay() -> int:
+    value = os.getenv("TEXTGRID_AUTOSAVE_MS", "").strip()
+    if value.isdigit():
+        return int(value)
+    return DEFAULT_AUTOSAVE_DELAY_MS
+
+
+class _AutosaveWriter(QObject):
+    finished = Signal()
+    failed = Signal(str)
+
+    def __init__(self, write):
+        super().__init__()
+        self._write = write
+
+    @Slot(int, object)
+    def run(self, sequence, job):
+        try:
+            self._write(sequence, job)
+        except Exception as exc:
+            logger.exception("Autosave failed")
+            self.failed.emit(str(exc))
+            return
+        self.finished.emit()
+
+
+class AutosaveService(QObject):
+    """Coalesces edits into one background save per pause in editing.
+
+    ``snapshot(rows)`` runs on the GUI thread and must copy whatever ``write(job)`` needs;
+    ``rows`` is the set of edited segment rows, or None when the whole project changed.
+    ``write`` runs on a dedicated thread, never concurrently with another write.
+    """
+
+    state_changed = Signal(str)
+    _write_requested = Signal(int, object)
+
+    def __init__(self, snapshot, write, delay_ms: int = DEFAULT_AUTOSAVE_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self._snapshot = snapshot
+        self._write = write
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._written_sequence = 0
+        self._dirty = False
+        self._rows: set[int] | None = set()
+        self._in_flight = False
+        self.state = STATE_SAVED
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._start_write)
+
+        self._thread = QThread(self)
+        self._writer = _AutosaveWriter(self._write_job)
+        self._writer.moveToThread(self._thread)
+        self._write_requested.connect(self._writer.run)
+        self._writer.finished.connect(self._on_write_finished)
+        self._writer.failed.connect(self._on_write_failed)
+        self._thread.start()
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty or self._in_flight
+
+    def mark_dirty(self, rows=None) -> None:
+        """Schedule a save; each call restarts the delay, so a burst of edits saves once."""
+        if rows is None:
+            self._rows = None
+        elif self._rows is not None:
+            self._rows.update(rows)
+        self._dirty = True
+        self._set_state(STATE_UNSAVED)
+        self._timer.start()
+
+    def flush(self) -> bool:
+        """Write pending edits on the calling thread, after any save already in progress."""
+        self._timer.stop()
+        if not self._dirty and not self._in_flight:
+            return self.state != STATE_FAILED
+        if self._in_flight:
+            # The queued write may not have started yet, and quitting the thread would
+            # drop it; a full snapshot written here supersedes it.
+            self._rows = None
+        sequence, job = self._take_job()
+        try:
+            self._write_job(sequence, job)
+        except Exception as exc:
+            logger.exception("Autosave failed")
+            self._fail(str(exc))
+            return False
+        self._set_state(STATE_SAVED)
+        return True
+
+    def shutdown(self) -> bool:
+        saved = self.flush()
+        self._thread.quit()
+        self._thread.wait()
+        return saved
+
+    def _take_job(self):
+        job = self._snapshot(self._rows)
+        self._dirty = False
+        self._rows = set()
+        self._sequence += 1
+        return self._sequence, job
+
+    def _write_job(self, sequence: int, job) -> None:
+        with self._lock:
+            if sequence <= self._written_sequence:
+                return
+            self._write(job)
+            self._written_sequence = sequence
+
+    @Slot()
+    def _start_write(self):
+        if self._in_flight:
+            # Picked up again when the current write finishes.
+            return
+        if not self._dirty:
+            return
+        self._in_flight = True
+        self._set_state(STATE_SAVING)
+        self._write_requested.emit(*self._take_job())
+
+    @Slot()
+    def _on_write_finished(self):
+        self._in_flight = False
+        if self._dirty:
+            if not self._timer.isActive():
+                self._start_write()
+            return
+        self._set_state(STATE_SAVED)
+
+    @Slot(str)
+    def _on_write_failed(self, message):
+        self._in_flight = False
+        self._fail(message)
+
+    def _fail(self, message: str) -> None:
+        # Keep the edits dirty so the next pause (or closing the window) retries them in full.
+        self._dirty = True
+        self._rows = None
+        self.state = STATE_FAILED
+        self.state_changed.emit(f"{STATE_FAILED}: {message}")
+
+    def _set_state(self, state: str) -> None:
+        if state == self.state:
+            return
+        self.state = state
+        self.state_changed.emit(state)
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from textgrid_transcriber.ffmpeg import get_ffmpeg_version
+
+DEFAULT_NORMALIZATION_CACHE_BYTES = 4 * 1024**3
+DEFAULT_ASR_CACHE_BYTES = 64 * 1024**2
+DEFAULT_ASR_CACHE_MAX_AGE_DAYS = 180
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_cache_limit(env_key: str, default_bytes: int) -> int:
+    value = os.getenv(env_key, "").strip()
+    if value.isdigit():
+        return int(value) * 1024**2
+    return default_bytes
+
+
+def resolve_cache_max_age(env_key: str, default_days: int) -> float:
+    """Maximum entry age in seconds, configured in days."""
+    value = os.getenv(env_key, "").strip()
+    days = int(value) if value.isdigit() else default_days
+    return days * 24 * 60 * 60
+
+
+def evict_lru(directory: Path, pattern: str, max_bytes: int, keep: Path | None = None) -> int:
+    """Delete the least recently used files matching ``pattern`` until the total fits ``max_bytes``."""
+    entries = []
+    for path in directory.glob(pattern):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        if keep is not None and path == keep:
+            continue
+        path.unlink(missing_ok=True)
+        total -= size
+        evicted += 1
+    return evicted
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    partial = target.with_name(f"{target.name}.part")
+    partial.unlink(missing_ok=True)
+    try:
+        os.link(source, partial)
+    except OSError:
+        shutil.copyfile(source, partial)
+    os.replace(partial, target)
+
+
+class NormalizationCache:
+    """Working WAVs keyed by source file identity, conversion parameters and ffmpeg version."""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_NORMALIZATION_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def key(self, ffmpeg_path: Path, audio_path: Path, params: dict) -> str:
+        stat = Path(audio_path).stat()
+        payload = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "inode": stat.st_ino,
+            "device": stat.st_dev,
+            "params": params,
+            "ffmpeg": get_ffmpeg_version(ffmpeg_path),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}.wav"
+
+    def fetch(self, key: str, target: Path) -> bool:
+        """Place the cached WAV for ``key`` at ``target``; return False on a miss."""
+        entry = self._entry(key)
+        if not entry.exists():
+            logger.info("Normalization cache miss for %s", target.name)
+            return False
+        os.utime(entry)
+        try:
+            same = target.exists() and os.path.samefile(entry, target)
+        except OSError:
+            same = False
+        if not same:
+            _link_or_copy(entry, target)
+        logger.info("Normalization cache hit for %s", target.name)
+        return True
+
+    def store(self, key: str, wav_path: Path) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = self._entry(key)
+        try:
+            _link_or_copy(wav_path, entry)
+        except OSError as exc:
+            logger.warning("Could not cache normalized audio %s: %s", wav_path.name, exc)
+            return
+        evicted = evict_lru(self.directory, "*.wav", self.max_bytes, keep=entry)
+        if evicted:
+            logger.info("Normalization cache evicted %d entries", evicted)
+
+
+_ASR_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    transcript TEXT NOT NULL,
+    alternatives TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+"""
+
+
+@dataclass(frozen=True)
+class ASRCacheStats:
+    entries: int
+    size_bytes: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ASRCache:
+    """ASR results keyed by audio content, model, language and recognizer.
+
+    One SQLite database in the user cache directory, shared by every project, so
+    transcribing the same audio again costs no request. Entries older than ``max_age``
+    seconds are dropped, then the least recently used ones until the total fits
+    ``max_bytes``. Safe to use from several threads.
+    """
+
+    # Trim after this many stores rather than after every one.
+    _EVICT_EVERY = 100
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_ASR_CACHE_BYTES,
+        max_age: float = DEFAULT_ASR_CACHE_MAX_AGE_DAYS * 24 * 60 * 60,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @staticmethod
+    def key(
+        audio_content: bytes | memoryview | Iterable[bytes | memoryview],
+        model: str,
+        language: str,
+        recognizer: str,
+        packed: bool = False,
+    ) -> str:
+        """``audio_content`` may also come in chunks; the key is the same as for the joined audio.
+
+        A transcript split out of a packed request has no alternatives and may differ from
+        one recognized alone, so it is stored under a ``packed`` key of its own.
+        """
+        if isinstance(audio_content, (bytes, memoryview)):
+            audio_content = (audio_content,)
+        digest = hashlib.sha256()
+        for chunk in audio_content:
+            digest.update(chunk)
+        payload = {"audio": digest.hexdigest(), "model": model, "language": language, "recognizer": recognizer}
+        if packed:
+            payload["packed"] = True
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened on first use, so a window that never runs ASR never creates the file.
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_ASR_CACHE_SCHEMA)
+            except Exception:
+                conn.close()
+                raise
+            self._conn = conn
+            self._evict()
+        return self._conn
+
+    def get(self, key: str, *fallbacks: str) -> tuple[str, list] | None:
+        """Return ``(transcript, alternatives)`` for ``key``, else for the first of ``fallbacks``
+        cached, or None on a miss."""
+        try:
+            with self._lock:
+                conn = self._connection()
+                for key in (key, *fallbacks):
+                    row = conn.execute(
+                        "SELECT transcript, alternatives, created FROM results WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None and time.time() - row[2] < self.max_age:
+                        with conn:
+                            conn.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+                        self.hits += 1
+                        return row[0], json.loads(row[1])
+                self.misses += 1
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            logger.warning("ASR cache lookup failed: %s", exc)
+        return None
+
+    def put(self, key: str, transcript: str, alternatives: list) -> None:
+        data = json.dumps(alternatives)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (key, transcript, alternatives, size, created, used) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, transcript, data, len(key) + len(transcript.encode("utf-8")) + len(data), now, now),
+                    )
+                self._stores += 1
+                if self._stores % self._EVICT_EVERY == 0:
+                    self._evict()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Could not cache ASR result: %s", exc)
+
+    def _evict(self) -> None:
+        conn = self._conn
+        with conn:
+            expired = conn.execute("DELETE FROM results WHERE created < ?", (time.time() - self.max_age,)).rowcount
+            (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+            evicted = 0
+            if total > self.max_bytes:
+                for key, size in conn.execute("SELECT key, size FROM results ORDER BY used").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                    total -= size
+                    evicted += 1
+        if expired or evicted:
+            logger.info("ASR cache dropped %d expired and %d least recently used entries", expired, evicted)
+
+    def stats(self) -> ASRCacheStats:
+        with self._lock:
+            entries = size = 0
+            try:
+                entries, size = self._connection().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+                ).fetchone()
+            except (sqlite3.Error, OSError) as exc:
+                logger.warning("ASR cache stats failed: %s", exc)
+            return ASRCacheStats(entries, size, self.hits, self.misses)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
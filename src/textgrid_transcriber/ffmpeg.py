@@ -1,3 +1,6 @@
+import os
+import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 import imageio_ffmpeg
@@ -6,3 +9,19 @@ import imageio_ffmpeg
 def get_ffmpeg_path() -> Path:
     """Return the bundled ffmpeg executable path from imageio-ffmpeg."""
     return Path(imageio_ffmpeg.get_ffmpeg_exe())
+
+
+@lru_cache(maxsize=8)
+def get_ffmpeg_version(ffmpeg_path: Path) -> str:
+    """Return the first line of ``ffmpeg -version``, e.g. for cache keys."""
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    result = subprocess.run(
+        [str(ffmpeg_path), "-version"],
+        check=True,
+        capture_output=True,
+        text=True,
+        **kwargs,
+    )
+    return result.stdout.splitlines()[0].strip() if result.stdout else ""
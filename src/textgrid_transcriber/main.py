@@ -1,10 +1,13 @@
 import json
 import logging
+import multiprocessing
 import os
+import re
 import sys
 from pathlib import Path
+from typing import Iterator
 
-from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot, QUrl, QStandardPaths
+from PySide6.QtCore import QIODevice, QObject, Qt, QThread, QTimer, Signal, Slot, QUrl, QStandardPaths
 from PySide6.QtGui import QAction, QFont
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtWidgets import (
@@ -20,8 +23,12 @@ from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
     QListView,
+    QListWidget,
+    QListWidgetItem,
     QPlainTextEdit,
+    QProgressBar,
     QSlider,
+    QSpinBox,
     QStackedWidget,
     QMessageBox,
     QDialog,
@@ -32,8 +39,41 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from textgrid_transcriber.asr import DEFAULT_ASR_MODEL, transcribe_wav
+from textgrid_transcriber.autosave import STATE_SAVED, AutosaveService, resolve_autosave_delay
+from textgrid_transcriber.asr_backend import (
+    DEFAULT_ASR_LANGUAGE,
+    DEFAULT_ASR_MODEL,
+    STREAM_CHUNK_MS,
+    STREAMING_MIN_MS,
+    ASRBackend,
+    create_asr_backend,
+)
+from textgrid_transcriber.asr_batch import (
+    BatchTranscriber,
+    RateLimiter,
+    resolve_asr_concurrency,
+    resolve_asr_rate,
+    resolve_asr_retries,
+)
+from textgrid_transcriber.asr_packing import (
+    PACK_MAX_SEGMENT_MS,
+    pack_audio,
+    plan_packs,
+    resolve_asr_packing,
+    split_words,
+)
+from textgrid_transcriber.cache import (
+    DEFAULT_ASR_CACHE_BYTES,
+    DEFAULT_ASR_CACHE_MAX_AGE_DAYS,
+    DEFAULT_NORMALIZATION_CACHE_BYTES,
+    ASRCache,
+    NormalizationCache,
+    resolve_cache_limit,
+    resolve_cache_max_age,
+)
 from textgrid_transcriber.ffmpeg import get_ffmpeg_path
+from textgrid_transcriber.playback import WavRangeDevice
+from textgrid_transcriber.segment_table import copy_segment, copy_segments
 from textgrid_transcriber.segments_delegate import SegmentListDelegate
 from textgrid_transcriber.segments_model import (
     STATUS_EMPTY,
@@ -41,14 +81,35 @@ from textgrid_transcriber.segments_model import (
     STATUS_VERIFIED,
     SegmentFilterProxy,
     SegmentListModel,
-    segment_status,
 )
-from textgrid_transcriber.project import PROJECT_FILENAME, PROJECT_VERSION, Project, Segment, load_project, save_project
-from textgrid_transcriber.splitter import split_audio_with_ffmpeg
+from textgrid_transcriber.project import PROJECT_VERSION, Project, Segment, SplitPlan
+from textgrid_transcriber.project_store import (
+    PROJECT_DB_SUFFIX,
+    ProjectStore,
+    default_project_path,
+    find_project_file,
+    is_project_db,
+    open_project_stream,
+    read_project,
+    write_project,
+)
+from textgrid_transcriber.splitter import (
+    export_segments,
+    resolve_split_engine,
+    resolve_split_workers,
+    resplit_incremental,
+    split_audio_with_ffmpeg,
+    working_wav_path,
+)
+from textgrid_transcriber.textgrid_parser import TextGridParseError, read_tier_names
+from textgrid_transcriber.wav import PcmWav, iter_pcm, read_pcm
 
 
 AUDIO_FILTER = "Audio Files (*.mp3 *.wav *.flac *.mpg *.mpeg *.mp4 *.m4a *.aac *.ogg);;All Files (*)"
 TEXTGRID_FILTER = "TextGrid Files (*.TextGrid *.textgrid);;All Files (*)"
+PROJECT_OPEN_FILTER = f"TextGrid Project (*.json *{PROJECT_DB_SUFFIX});;All Files (*)"
+PROJECT_SAVE_FILTER = f"TextGrid Project (*.json);;TextGrid Project Database (*{PROJECT_DB_SUFFIX});;All Files (*)"
+ASR_REFRESH_MS = 250
 
 
 class MainWindow(QMainWindow):
@@ -61,6 +122,12 @@ class MainWindow(QMainWindow):
         self.credentials_path: Path | None = None
         self.asr_model = DEFAULT_ASR_MODEL
         self.recent_projects: list[Path] = []
+        self.virtual_split = False
+        self.working_wav_path: Path | None = None
+        self._working_wav: PcmWav | None = None
+        self._segment_device: WavRangeDevice | None = None
+        self.split_plan = SplitPlan()
+        self._project_store: ProjectStore | None = None
 
         # --- Headers
         setup_title = QLabel("New Project")
@@ -107,6 +174,34 @@ class MainWindow(QMainWindow):
         form.setVerticalSpacing(10)
         form.addRow("Audio", audio_row)
         form.addRow("TextGrid", textgrid_row)
+        self.virtual_split_checkbox = QCheckBox("Virtual split (no per-segment files until exported)")
+        self.virtual_split_checkbox.setToolTip(
+            "Play and transcribe segments straight from one working WAV. "
+            "Use File → Export Segment Files… to write them out later."
+        )
+        form.addRow("", self.virtual_split_checkbox)
+
+        self.split_tiers_list = QListWidget()
+        self.split_tiers_list.setToolTip("Only checked tiers are cut.")
+        self.split_tiers_list.setFixedHeight(88)
+        self.split_mark_pattern = QLineEdit()
+        self.split_mark_pattern.setPlaceholderText("Regular expression matched against labels (optional)")
+        self.split_min_duration = QSpinBox()
+        self.split_max_duration = QSpinBox()
+        for spin_box in (self.split_min_duration, self.split_max_duration):
+            spin_box.setRange(0, 3_600_000)
+            spin_box.setSingleStep(50)
+            spin_box.setSuffix(" ms")
+        self.split_max_duration.setSpecialValueText("No limit")
+        duration_row = QHBoxLayout()
+        duration_row.addWidget(QLabel("Min"))
+        duration_row.addWidget(self.split_min_duration)
+        duration_row.addWidget(QLabel("Max"))
+        duration_row.addWidget(self.split_max_duration)
+        duration_row.addStretch(1)
+        form.addRow("Tiers", self.split_tiers_list)
+        form.addRow("Labels", self.split_mark_pattern)
+        form.addRow("Duration", duration_row)
 
         self.batch_asr_button = QPushButton("Run batch ASR transcription")
         self.batch_asr_button.setEnabled(False)
@@ -115,7 +210,6 @@ class MainWindow(QMainWindow):
         self.segment_model = SegmentListModel()
         self.segment_proxy = SegmentFilterProxy()
         self.segment_proxy.setSourceModel(self.segment_model)
-        self.segment_proxy.setSortCaseSensitivity(Qt.CaseInsensitive)
 
         self.filter_tier = QComboBox()
         self.filter_status = QComboBox()
@@ -123,8 +217,14 @@ class MainWindow(QMainWindow):
         self.filter_tier.addItem("All")
         self.filter_status.addItems(["All", STATUS_EMPTY, STATUS_UNVERIFIED, STATUS_VERIFIED])
         self.filter_sort.addItems(["Status", "Duration", "Name"])
+        self.filter_search = QLineEdit()
+        self.filter_search.setPlaceholderText('Search words, "a phrase" or /regex/')
+        self.filter_search.setClearButtonEnabled(True)
+        self.filter_substring = QCheckBox("Substring")
 
         filters_row = QHBoxLayout()
+        filters_row.addWidget(self.filter_search, 1)
+        filters_row.addWidget(self.filter_substring)
         filters_row.addWidget(QLabel("Tier"))
         filters_row.addWidget(self.filter_tier)
         filters_row.addWidget(QLabel("Status"))
@@ -193,6 +293,9 @@ class MainWindow(QMainWindow):
         self.project_textgrid_value = QLabel("—")
         self.project_status_label = QLabel("Status:")
         self.project_status_value = QLabel("Not started")
+        self.project_tiers_label = QLabel("Tiers:")
+        self.project_tiers_value = QLabel("—")
+        self.project_tiers_value.setWordWrap(True)
 
         project_header_layout = QGridLayout()
         project_header_layout.setColumnStretch(1, 1)
@@ -205,6 +308,8 @@ class MainWindow(QMainWindow):
         project_header_layout.addWidget(self.project_audio_value, 1, 1)
         project_header_layout.addWidget(self.project_textgrid_label, 1, 2)
         project_header_layout.addWidget(self.project_textgrid_value, 1, 3)
+        project_header_layout.addWidget(self.project_tiers_label, 2, 0)
+        project_header_layout.addWidget(self.project_tiers_value, 2, 1, 1, 3)
         self.project_header_group.setLayout(project_header_layout)
 
         self.welcome_title = QLabel("TextGrid Transcriber")
@@ -287,6 +392,20 @@ class MainWindow(QMainWindow):
 
         # Status bar (useful later for progress / ffmpeg messages)
         self.setStatusBar(QStatusBar())
+        self.save_state_label = QLabel(STATE_SAVED)
+        self.save_state_label.setVisible(False)
+        self.statusBar().addPermanentWidget(self.save_state_label)
+        self.load_progress = QProgressBar()
+        self.load_progress.setMaximumWidth(160)
+        self.load_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.load_progress)
+        self.autosave = AutosaveService(
+            self._autosave_snapshot,
+            self._autosave_write,
+            resolve_autosave_delay(),
+            self,
+        )
+        self.autosave.state_changed.connect(self.save_state_label.setText)
         self._logger = logging.getLogger("textgrid_transcriber")
         log_dir = Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -297,6 +416,18 @@ class MainWindow(QMainWindow):
                 level=logging.INFO,
                 format="%(asctime)s %(levelname)s %(message)s",
             )
+        cache_dir = Path(QStandardPaths.writableLocation(QStandardPaths.CacheLocation))
+        self.normalization_cache = NormalizationCache(
+            cache_dir / "normalized",
+            resolve_cache_limit("TEXTGRID_NORMALIZE_CACHE_MB", DEFAULT_NORMALIZATION_CACHE_BYTES),
+        )
+        # Every ASR request shares the backend's clients; they are closed with the window.
+        self.asr_backend = create_asr_backend(cache_dir)
+        self.asr_cache = ASRCache(
+            cache_dir / "asr_results.sqlite",
+            resolve_cache_limit("TEXTGRID_ASR_CACHE_MB", DEFAULT_ASR_CACHE_BYTES),
+            resolve_cache_max_age("TEXTGRID_ASR_CACHE_DAYS", DEFAULT_ASR_CACHE_MAX_AGE_DAYS),
+        )
 
         file_menu = self.menuBar().addMenu("File")
         edit_menu = self.menuBar().addMenu("Edit")
@@ -304,6 +435,8 @@ class MainWindow(QMainWindow):
         self.save_project_action = file_menu.addAction("Save Project")
         self.save_project_as_action = file_menu.addAction("Save Project As…")
         self.save_project_action.setEnabled(False)
+        self.export_segments_action = file_menu.addAction("Export Segment Files…")
+        self.export_segments_action.setEnabled(False)
         self.recent_menu = file_menu.addMenu("Recent Projects")
         log_menu = self.menuBar().addMenu("Logs")
         self.view_log_action = log_menu.addAction("View Logs…")
@@ -315,17 +448,21 @@ class MainWindow(QMainWindow):
         textgrid_browse.clicked.connect(self.pick_textgrid_file)
         self.audio_path.textChanged.connect(self.update_state)
         self.textgrid_path.textChanged.connect(self.update_state)
+        self.textgrid_path.textChanged.connect(self.refresh_split_tiers)
         self.split_btn.clicked.connect(self.split_audio)
         self.open_project_action.triggered.connect(self.open_project)
         self.save_project_action.triggered.connect(self.save_project_file)
         self.save_project_as_action.triggered.connect(self.save_project_as)
         self.view_log_action.triggered.connect(self.open_log_window)
+        self.export_segments_action.triggered.connect(self.export_segment_files)
         self.credentials_action.triggered.connect(self.set_credentials)
         self.new_project_button.clicked.connect(self.start_new_project)
         self.open_project_button.clicked.connect(self.open_project_from_welcome)
         self.filter_tier.currentTextChanged.connect(self.on_filter_tier_changed)
         self.filter_status.currentTextChanged.connect(self.on_filter_status_changed)
         self.filter_sort.currentTextChanged.connect(self.on_sort_changed)
+        self.filter_search.textChanged.connect(self.on_search_changed)
+        self.filter_substring.toggled.connect(self.on_substring_search_toggled)
         self.segments_list.selectionModel().selectionChanged.connect(self.on_segment_selection_changed)
         self.segment_play_button.clicked.connect(self.play_selected_segment)
         self.segment_stop_button.clicked.connect(self.stop_selected_segment)
@@ -348,6 +485,28 @@ class MainWindow(QMainWindow):
 
         self.asr_worker = None
         self.asr_thread = None
+        self._asr_updated_rows: set[int] = set()
+        self._asr_partial_row: int | None = None
+        # Rows whose transcript was edited while ASR ran; interim text no longer replaces it.
+        self._asr_edited_rows: set[int] = set()
+        self._asr_refresh_timer = QTimer(self)
+        self._asr_refresh_timer.setSingleShot(True)
+        self._asr_refresh_timer.setInterval(ASR_REFRESH_MS)
+        self._asr_refresh_timer.timeout.connect(self.apply_asr_updates)
+        self.export_worker = None
+        self.export_thread = None
+        self._split_output_dir: Path | None = None
+        self._split_project_path: Path | None = None
+        self._split_streamed = False
+        self._split_updating = False
+        self._splitting = False
+        self.load_worker = None
+        self.load_thread = None
+        self._loading = False
+        self._load_opened = False
+        # Shown instead of the usual message once the current load finishes.
+        self._load_status: str | None = None
+        self._deferred_rows: set[int] = set()
         self.show_welcome()
         self.load_recent_projects()
 
@@ -397,17 +556,23 @@ class MainWindow(QMainWindow):
         project_name = self.current_project_path.stem if self.current_project_path else "Untitled"
         audio_name = Path(self.audio_path.text().strip()).name if self.audio_path.text().strip() else "—"
         textgrid_name = Path(self.textgrid_path.text().strip()).name if self.textgrid_path.text().strip() else "—"
-        total = len(self.current_segments)
-        verified = sum(1 for segment in self.current_segments if segment_status(segment) == STATUS_VERIFIED)
-        if total:
-            status = f"{verified}/{total} verified"
+        counts = self.segment_model.counts()
+        if counts.total:
+            status = f"{counts.verified}/{counts.total} verified"
+            if counts.asr_generated:
+                status += f", {counts.asr_generated} from ASR"
         else:
             status = "Not started"
+        tiers = []
+        for tier in self.segment_model.tier_names():
+            tier_counts = self.segment_model.counts(tier)
+            tiers.append(f"{tier} {tier_counts.verified}/{tier_counts.total}")
 
         self.project_name_value.setText(project_name)
         self.project_audio_value.setText(audio_name)
         self.project_textgrid_value.setText(textgrid_name)
         self.project_status_value.setText(status)
+        self.project_tiers_value.setText(", ".join(tiers) or "—")
 
     def recent_projects_path(self) -> Path:
         base = Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
@@ -456,11 +621,19 @@ class MainWindow(QMainWindow):
         self.open_project_path(path)
 
     def start_new_project(self):
+        self.cancel_project_load()
+        self.autosave.flush()
         self.current_project_path = None
+        self.close_project_store()
+        self.save_state_label.setVisible(False)
         self.current_output_dir = None
         self.current_segments = []
+        self.set_working_wav(None, False)
+        self.virtual_split_checkbox.setChecked(False)
+        self.split_plan = SplitPlan()
         self.audio_path.setText("")
         self.textgrid_path.setText("")
+        self.apply_split_plan()
         self.batch_asr_button.setEnabled(False)
         self.segment_asr_button.setEnabled(False)
         self.segment_model.set_segments([])
@@ -478,12 +651,56 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select audio file", "", AUDIO_FILTER)
         if file_path:
             self.audio_path.setText(file_path)
+            self.adopt_existing_split_plan(Path(file_path))
 
     def pick_textgrid_file(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select TextGrid file", "", TEXTGRID_FILTER)
         if file_path:
             self.textgrid_path.setText(file_path)
 
+    def adopt_existing_split_plan(self, audio_path: Path):
+        # Re-splitting an existing project starts from the plan it was split with.
+        project_path = find_project_file(audio_path.parent / "splits")
+        if project_path is None:
+            return
+        try:
+            self.split_plan = read_project(project_path).split_plan
+        except Exception:
+            return
+        self.apply_split_plan()
+
+    def apply_split_plan(self):
+        self.split_mark_pattern.setText(self.split_plan.mark_pattern)
+        self.split_min_duration.setValue(self.split_plan.min_duration_ms)
+        self.split_max_duration.setValue(self.split_plan.max_duration_ms)
+        self.refresh_split_tiers()
+
+    def refresh_split_tiers(self):
+        textgrid_path = Path(self.textgrid_path.text().strip())
+        try:
+            names = read_tier_names(textgrid_path) if textgrid_path.is_file() else []
+        except (OSError, TextGridParseError):
+            names = []
+        selected = set(self.split_plan.tiers)
+        self.split_tiers_list.clear()
+        for name in names:
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if not selected or name in selected else Qt.Unchecked)
+            self.split_tiers_list.addItem(item)
+
+    def current_split_plan(self) -> SplitPlan | None:
+        items = [self.split_tiers_list.item(row) for row in range(self.split_tiers_list.count())]
+        checked = [item.text() for item in items if item.checkState() == Qt.Checked]
+        if items and not checked:
+            return None
+        return SplitPlan(
+            tiers=[] if len(checked) == len(items) else checked,
+            mark_pattern=self.split_mark_pattern.text().strip(),
+            min_duration_ms=self.split_min_duration.value(),
+            max_duration_ms=self.split_max_duration.value(),
+        )
+
     def update_state(self):
         a = Path(self.audio_path.text().strip())
         t = Path(self.textgrid_path.text().strip())
@@ -511,31 +728,74 @@ class MainWindow(QMainWindow):
             self.show_status("Select valid audio and TextGrid files.")
             return
 
+        plan = self.current_split_plan()
+        if plan is None:
+            self.show_status("Select at least one tier to split.")
+            return
+        if plan.mark_pattern:
+            try:
+                re.compile(plan.mark_pattern)
+            except re.error as exc:
+                self.show_status(f"Invalid label pattern: {exc}")
+                return
+        if plan.max_duration_ms and plan.max_duration_ms < plan.min_duration_ms:
+            self.show_status("Maximum duration is shorter than the minimum.")
+            return
+
         output_dir = audio_path.parent / "splits"
         ffmpeg_path = get_ffmpeg_path()
 
-        project_path = output_dir / PROJECT_FILENAME
-        if project_path.exists():
-            choice = QMessageBox.warning(
-                self,
-                "Project already exists",
-                "A project file already exists for this audio. Resplitting can overwrite "
-                "saved transcripts and status. Do you want to continue?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No,
+        project_path = find_project_file(output_dir)
+        existing_segments = None
+        if project_path is not None:
+            prompt = QMessageBox(self)
+            prompt.setIcon(QMessageBox.Warning)
+            prompt.setWindowTitle("Project already exists")
+            prompt.setText(
+                "A project file already exists for this audio. Update only the intervals that "
+                "changed in the TextGrid, keeping transcripts of unchanged segments, or re-split "
+                "everything and discard saved transcripts and status?"
             )
-            if choice != QMessageBox.Yes:
+            update_button = prompt.addButton("Update Changed Intervals", QMessageBox.AcceptRole)
+            resplit_button = prompt.addButton("Re-split Everything", QMessageBox.DestructiveRole)
+            prompt.addButton(QMessageBox.Cancel)
+            prompt.setDefaultButton(update_button)
+            prompt.exec()
+            clicked = prompt.clickedButton()
+            if clicked == update_button:
+                try:
+                    existing_segments = read_project(project_path).segments
+                except Exception as exc:
+                    self.show_status(f"Failed to load existing project: {exc}")
+                    return
+            elif clicked != resplit_button:
                 self.show_status("Split canceled.")
                 return
 
         self.split_btn.setEnabled(False)
         self.show_status("Splitting audio...")
-
-        self.worker = SplitWorker(ffmpeg_path, audio_path, textgrid_path, output_dir)
+        self.set_working_wav(None, False)
+
+        self.worker = SplitWorker(
+            ffmpeg_path,
+            audio_path,
+            textgrid_path,
+            output_dir,
+            virtual=self.virtual_split_checkbox.isChecked(),
+            existing_segments=existing_segments,
+            normalization_cache=self.normalization_cache,
+            plan=plan,
+        )
         self.worker_thread = QThread(self)
         self.worker.moveToThread(self.worker_thread)
 
+        self._split_output_dir = output_dir
+        self._split_project_path = project_path or default_project_path(output_dir)
+        self._split_streamed = False
+        self._split_updating = existing_segments is not None
+        self._splitting = True
         self.worker.progress.connect(self.on_split_progress)
+        self.worker.segments_ready.connect(self.on_split_segments_ready)
         self.worker.finished.connect(self.on_split_finished)
         self.worker.failed.connect(self.on_split_failed)
         self.worker_thread.started.connect(self.worker.run)
@@ -551,8 +811,36 @@ class MainWindow(QMainWindow):
     def on_split_progress(self, done, total, output_name):
         self.show_status(f"Split {done}/{total}: {output_name}")
 
+    @Slot(object)
+    def on_split_segments_ready(self, batch):
+        if not self._split_streamed:
+            # First finished segments: open the project page so work can start right away.
+            self._split_streamed = True
+            self.current_output_dir = self._split_output_dir
+            self.current_project_path = self._split_project_path
+            self.current_segments = []
+            self.segment_model.set_segments([])
+            self.clear_segment_details()
+            self.update_project_info()
+            self.show_project()
+
+        known_tiers = set(self.segment_model.tier_names())
+        self.current_segments.extend(batch)
+        self.segment_model.append_segments(batch)
+        if any(segment.tier not in known_tiers for segment in batch):
+            self.refresh_filters()
+        self.update_segments_header()
+        self.update_project_info()
+
     @Slot(str)
     def on_split_failed(self, message):
+        self._splitting = False
+        if self._split_streamed and self._split_updating:
+            # The re-split put the previous files back; show the project that matches them.
+            self._load_status = f"Split failed: {message}"
+            if self.open_project_path(self._split_project_path):
+                return
+            self._load_status = None
         self.show_status(f"Split failed: {message}")
         self.update_state()
 
@@ -561,16 +849,43 @@ class MainWindow(QMainWindow):
         output_dir = Path(result["output_dir"])
         self.current_output_dir = output_dir
         self.current_segments = result["segments"]
+        self.set_working_wav(Path(result["wav_path"]) if result["wav_path"] else None, result["virtual"])
+        self.split_plan = result["plan"]
 
-        self.current_project_path = output_dir / PROJECT_FILENAME
+        self.current_project_path = self._split_project_path
+        self._splitting = False
         self.save_project_file()
         self.batch_asr_button.setEnabled(True)
-        self.show_status(f"Split complete. Files saved to {output_dir}")
-        self.populate_segments()
+        if result.get("diff"):
+            self.show_status(f"Re-split complete: {result['diff']}", 10000)
+        else:
+            self.show_status(f"Split complete. Files saved to {output_dir}")
+        if self._split_streamed:
+            self.reorder_streamed_segments()
+        else:
+            self.populate_segments()
         self.update_state()
         self.update_project_info()
         self.show_project()
 
+    def reorder_streamed_segments(self):
+        # Streamed rows arrive in completion order; switch to TextGrid order, keeping the selection.
+        selected = None
+        if self.current_segment_row is not None:
+            selected = self.segment_model.segment_at(self.current_segment_row)
+        self.segment_model.set_segments(self.current_segments)
+        self.refresh_filters()
+        self.update_segments_header()
+        if selected is None:
+            self.clear_segment_details()
+            return
+        row = next((row for row, segment in enumerate(self.current_segments) if segment is selected), None)
+        if row is None:
+            self.clear_segment_details()
+            return
+        proxy_index = self.segment_proxy.mapFromSource(self.segment_model.index(row, 0))
+        self.segments_list.setCurrentIndex(proxy_index)
+
     def _build_project(self) -> Project:
         audio_path = Path(self.audio_path.text().strip())
         textgrid_path = Path(self.textgrid_path.text().strip())
@@ -587,26 +902,35 @@ class MainWindow(QMainWindow):
             credentials_path=str(self.credentials_path) if self.credentials_path else "",
             asr_model=self.asr_model,
             segments=self.current_segments,
+            virtual_split=self.virtual_split,
+            wav_path=str(self.working_wav_path) if self.working_wav_path else "",
+            split_plan=self.split_plan,
         )
 
     def save_project_file(self, show_status=True, force_dialog=False):
         if self.current_project_path is None or force_dialog:
-            default_path = PROJECT_FILENAME
+            default_path = default_project_path(Path()).name
             if self.current_project_path is not None:
                 default_path = str(self.current_project_path)
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "Save project",
                 default_path,
-                "TextGrid Project (*.json);;All Files (*)",
+                PROJECT_SAVE_FILTER,
             )
             if not file_path:
                 self.show_status("Save canceled.")
                 return
             self.current_project_path = Path(file_path)
 
-        project = self._build_project()
-        save_project(self.current_project_path, project)
+        if self._loading:
+            self.show_status("The project is still loading.")
+            return
+        self.autosave.mark_dirty()
+        if not self.autosave.flush():
+            self.show_status(f"Failed to save project to {self.current_project_path}", 10000)
+            return
+        self.save_state_label.setVisible(True)
         self.remember_project(self.current_project_path)
         self.save_project_action.setEnabled(True)
         if show_status:
@@ -615,6 +939,52 @@ class MainWindow(QMainWindow):
     def save_project_as(self):
         self.save_project_file(force_dialog=True)
 
+    def save_segments(self, rows: list[int]):
+        """Schedule an autosave of edits to the given model rows."""
+        if self.current_project_path is None or self._splitting:
+            # Mid-split the file still holds the previous project; the final save writes everything.
+            return
+        if self._loading:
+            # A full save now would write a partly loaded project; these are saved once loading ends.
+            self._deferred_rows.update(rows)
+            return
+        self.autosave.mark_dirty(rows)
+
+    def _autosave_snapshot(self, rows):
+        path = self.current_project_path
+        store = self.project_store()
+        if store is not None and rows is not None:
+            return path, store, [(row, copy_segment(self.segment_model.segment_at(row))) for row in sorted(rows)], None
+        project = self._build_project()
+        project.segments = copy_segments(project.segments)
+        return path, store, None, project
+
+    @staticmethod
+    def _autosave_write(job):
+        # Runs on the autosave thread with copies taken by _autosave_snapshot.
+        path, store, rows, project = job
+        if store is None:
+            write_project(path, project)
+        elif project is None:
+            store.update_segments(rows)
+        else:
+            store.save(project)
+
+    def project_store(self) -> ProjectStore | None:
+        path = self.current_project_path
+        if path is None or not is_project_db(path):
+            self.close_project_store()
+            return None
+        if self._project_store is None or self._project_store.path != path:
+            self.close_project_store()
+            self._project_store = ProjectStore(path)
+        return self._project_store
+
+    def close_project_store(self):
+        if self._project_store is not None:
+            self._project_store.close()
+            self._project_store = None
+
     def open_project_path(self, project_path: Path) -> bool:
         return self._load_project_from_path(project_path)
 
@@ -623,7 +993,7 @@ class MainWindow(QMainWindow):
             self,
             "Open project",
             "",
-            "TextGrid Project (*.json);;All Files (*)",
+            PROJECT_OPEN_FILTER,
         )
         if not file_path:
             self.show_status("Open project canceled.")
@@ -631,32 +1001,152 @@ class MainWindow(QMainWindow):
         return self._load_project_from_path(Path(file_path))
 
     def _load_project_from_path(self, path: Path) -> bool:
-        try:
-            project = load_project(path)
-        except Exception as exc:
-            self.show_status(f"Failed to load project: {exc}")
-            return False
+        self.cancel_project_load()
+        self.autosave.flush()
+
+        self.load_worker = ProjectLoadWorker(path)
+        self.load_thread = QThread(self)
+        self.load_worker.moveToThread(self.load_thread)
+
+        self._loading = True
+        self._load_opened = False
+        self._deferred_rows = set()
+        self.load_worker.opened.connect(self.on_project_opened)
+        self.load_worker.segments_ready.connect(self.on_project_segments_ready)
+        self.load_worker.progress.connect(self.on_project_load_progress)
+        self.load_worker.finished.connect(self.on_project_load_finished)
+        self.load_worker.failed.connect(self.on_project_load_failed)
+        self.load_thread.started.connect(self.load_worker.run)
+
+        self.load_worker.finished.connect(self.load_thread.quit)
+        self.load_worker.failed.connect(self.load_thread.quit)
+        self.load_thread.finished.connect(self.load_worker.deleteLater)
+        self.load_thread.finished.connect(self.load_thread.deleteLater)
+
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setVisible(True)
+        self.show_status(f"Loading project from {path}...", None)
+        self.load_thread.start()
+        return True
+
+    def cancel_project_load(self):
+        if self.load_worker is None:
+            return
+        # The worker may still deliver queued chunks; handlers ignore senders other than load_worker.
+        self.load_worker.cancel()
+        self.load_thread.quit()
+        self.load_thread.wait()
+        self.load_worker = None
+        self.load_thread = None
+        self._loading = False
+        self.load_progress.setVisible(False)
+
+    def _is_current_load(self) -> bool:
+        return self.load_worker is not None and self.sender() is self.load_worker
 
-        self.current_project_path = path
+    @Slot(object)
+    def on_project_opened(self, project):
+        if not self._is_current_load():
+            return
+        self._load_opened = True
+        self.current_project_path = self.load_worker.project_path
         self.current_output_dir = Path(project.output_dir)
+        # Chunks extend this table in place; the model shares it.
         self.current_segments = project.segments
+        self.set_working_wav(Path(project.wav_path) if project.wav_path else None, project.virtual_split)
+        self.split_plan = project.split_plan
 
         self.audio_path.setText(project.audio_path)
         self.textgrid_path.setText(project.textgrid_path)
+        self.apply_split_plan()
         self.credentials_path = Path(project.credentials_path) if project.credentials_path else None
         if self.credentials_path:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(self.credentials_path)
+
+        self.batch_asr_button.setEnabled(False)
+        self.populate_segments()
+        self.update_project_info()
+        self.show_project()
+
+    @Slot(object)
+    def on_project_segments_ready(self, chunk):
+        if not self._is_current_load():
+            return
+        known_tiers = set(self.current_segments.tier_names())
+        self.segment_model.append_segments(chunk)
+        if not known_tiers.issuperset(chunk.tier_names()):
+            self.refresh_filters()
+
+    @Slot(int, int)
+    def on_project_load_progress(self, done, total):
+        if not self._is_current_load():
+            return
+        self.load_progress.setRange(0, total)
+        self.load_progress.setValue(done)
+        self.segments_header.setText(f"Segments (loading {done}/{total})")
+
+    @Slot()
+    def on_project_load_finished(self):
+        if not self._is_current_load():
+            return
+        self.load_worker = None
+        self.load_thread = None
+        self._loading = False
+        self.load_progress.setVisible(False)
         self.set_asr_model(DEFAULT_ASR_MODEL)
+        if self._deferred_rows:
+            self.save_segments(sorted(self._deferred_rows))
+            self._deferred_rows = set()
 
         self.save_project_action.setEnabled(True)
         self.batch_asr_button.setEnabled(True)
-        self.show_status(f"Project loaded from {self.current_project_path}", 3000)
-        self.populate_segments()
+        if self._load_status:
+            self.show_status(self._load_status)
+            self._load_status = None
+        else:
+            self.show_status(f"Project loaded from {self.current_project_path}", 3000)
+        self.refresh_filters()
+        self.update_segments_header()
         self.update_state()
         self.update_project_info()
         self.remember_project(self.current_project_path)
-        self.show_project()
-        return True
+
+    @Slot(str)
+    def on_project_load_failed(self, message):
+        if not self._is_current_load():
+            return
+        self.load_worker = None
+        self.load_thread = None
+        self._loading = False
+        self.load_progress.setVisible(False)
+        if self._load_opened:
+            # Never leave a partly loaded project open where autosave could overwrite the file.
+            self.start_new_project()
+        self._load_status = None
+        self.show_status(f"Failed to load project: {message}")
+
+    def set_working_wav(self, wav_path: Path | None, virtual: bool):
+        self._release_segment_device()
+        if self._working_wav is not None:
+            self._working_wav.close()
+            self._working_wav = None
+        self.working_wav_path = wav_path
+        self.virtual_split = virtual and wav_path is not None
+        self.export_segments_action.setEnabled(self.virtual_split)
+
+    def working_wav(self) -> PcmWav:
+        if self._working_wav is None:
+            self._working_wav = PcmWav(self.working_wav_path)
+        return self._working_wav
+
+    def _release_segment_device(self):
+        if self._segment_device is None:
+            return
+        self.player.stop()
+        self.player.setSource(QUrl())
+        self._segment_device.close()
+        self._segment_device.deleteLater()
+        self._segment_device = None
 
     def populate_segments(self):
         self.segment_model.set_segments(self.current_segments)
@@ -665,7 +1155,7 @@ class MainWindow(QMainWindow):
         self.clear_segment_details()
 
     def refresh_filters(self):
-        tiers = sorted({segment.tier for segment in self.current_segments})
+        tiers = self.segment_model.tier_names()
         current_tier = self.filter_tier.currentText()
         self.filter_tier.blockSignals(True)
         self.filter_tier.clear()
@@ -681,9 +1171,8 @@ class MainWindow(QMainWindow):
         self.segment_proxy.invalidateFilter()
 
     def update_segments_header(self):
-        total = len(self.current_segments)
-        verified = sum(1 for segment in self.current_segments if segment_status(segment) == STATUS_VERIFIED)
-        self.segments_header.setText(f"Segments ({total} total, {verified} verified)")
+        counts = self.segment_model.counts()
+        self.segments_header.setText(f"Segments ({counts.total} total, {counts.verified} verified)")
 
     def on_filter_tier_changed(self, text):
         self.segment_proxy.set_filter_tier(text)
@@ -695,6 +1184,22 @@ class MainWindow(QMainWindow):
         self.update_segments_header()
         self.show_status(f"Filter status: {text}")
 
+    def on_search_changed(self, text):
+        try:
+            self.segment_proxy.set_filter_text(text)
+        except re.error as exc:
+            self.show_status(f"Invalid search pattern: {exc}")
+            return
+        self.update_segments_header()
+
+    def on_substring_search_toggled(self, checked):
+        try:
+            self.segment_proxy.set_substring_search(checked)
+        except re.error as exc:
+            self.show_status(f"Invalid search pattern: {exc}")
+            return
+        self.update_segments_header()
+
     def on_sort_changed(self, text):
         if text == "Duration":
             self.segment_proxy.set_sort_mode(SegmentFilterProxy.SORT_DURATION)
@@ -747,7 +1252,17 @@ class MainWindow(QMainWindow):
         self.segment_verified_checkbox.setChecked(segment.verified)
         self._updating_transcript = False
 
-        self.player.setSource(QUrl.fromLocalFile(segment.path))
+        self._release_segment_device()
+        if self.virtual_split:
+            try:
+                self._segment_device = WavRangeDevice(self.working_wav(), segment.start_ms, segment.end_ms, self)
+            except OSError as exc:
+                self.show_status(f"Working audio unavailable: {exc}")
+                return
+            self._segment_device.open(QIODevice.ReadOnly)
+            self.player.setSourceDevice(self._segment_device)
+        else:
+            self.player.setSource(QUrl.fromLocalFile(segment.path))
         self.show_status(f"Selected segment: {Path(segment.path).name}")
 
     def play_selected_segment(self):
@@ -777,16 +1292,17 @@ class MainWindow(QMainWindow):
     def on_transcript_changed(self):
         if self._updating_transcript or self.current_segment_row is None:
             return
+        if self.asr_thread is not None:
+            self._asr_edited_rows.add(self.current_segment_row)
+            if self._asr_partial_row == self.current_segment_row:
+                # The interim text became the user's; keep what they typed.
+                self._asr_partial_row = None
         segment = self.segment_model.segment_at(self.current_segment_row)
         segment.transcript = self.transcript_editor.toPlainText()
         self.segment_model.update_segment(self.current_segment_row)
-        self.segment_proxy.invalidate()
-        self.segment_proxy.sort(0, Qt.AscendingOrder)
         self.update_segments_header()
         self.show_status("Transcript updated.")
-        if self.current_project_path is not None:
-            self.save_project_file(show_status=False)
-            self.show_status("Transcript saved.")
+        self.save_segments([self.current_segment_row])
 
     def on_verified_toggled(self, checked):
         if self._updating_transcript or self.current_segment_row is None:
@@ -794,16 +1310,14 @@ class MainWindow(QMainWindow):
         segment = self.segment_model.segment_at(self.current_segment_row)
         segment.verified = checked
         self.segment_model.update_segment(self.current_segment_row)
-        self.segment_proxy.invalidate()
-        self.segment_proxy.sort(0, Qt.AscendingOrder)
         self.update_segments_header()
         self.update_project_info()
         self.show_status(f"Verified set to {checked}.")
-        if self.current_project_path is not None:
-            self.save_project_file(show_status=False)
-            self.show_status("Verification saved.")
+        self.save_segments([self.current_segment_row])
 
     def ensure_credentials(self) -> bool:
+        if not self.asr_backend.requires_credentials:
+            return True
         if self.credentials_path and self.credentials_path.exists():
             return True
         env_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
@@ -820,7 +1334,7 @@ class MainWindow(QMainWindow):
             return
 
         segment = self.segment_model.segment_at(self.current_segment_row)
-        items = [(self.current_segment_row, Path(segment.path))]
+        items = [(self.current_segment_row, segment)]
         self.start_asr_worker(items, "ASR started for selected segment.")
 
     def run_batch_asr(self):
@@ -830,7 +1344,7 @@ class MainWindow(QMainWindow):
         for row, segment in enumerate(self.current_segments):
             if segment.verified:
                 continue
-            items.append((row, Path(segment.path)))
+            items.append((row, segment))
         if not items:
             self.show_status("No segments available for batch ASR.")
             return
@@ -844,12 +1358,21 @@ class MainWindow(QMainWindow):
         self.batch_asr_button.setEnabled(False)
         self.show_status(status_message)
 
-        self.asr_worker = ASRWorker(items, self.credentials_path, self.asr_model)
+        self.asr_worker = ASRWorker(
+            items,
+            self.asr_backend,
+            self.asr_cache,
+            self.credentials_path,
+            self.asr_model,
+            self.working_wav_path if self.virtual_split else None,
+        )
         self.asr_thread = QThread(self)
         self.asr_worker.moveToThread(self.asr_thread)
 
         self.asr_worker.progress.connect(self.on_asr_progress)
         self.asr_worker.segment_done.connect(self.on_asr_segment_done)
+        self.asr_worker.partial.connect(self.on_asr_partial)
+        self.asr_worker.partial_ended.connect(self.on_asr_partial_ended)
         self.asr_worker.failed.connect(self.on_asr_failed)
         self.asr_worker.finished.connect(self.on_asr_finished)
         self.asr_thread.started.connect(self.asr_worker.run)
@@ -866,16 +1389,41 @@ class MainWindow(QMainWindow):
         self.show_status(f"ASR {done}/{total}: {name}")
 
     @Slot(int, str)
+    def on_asr_partial(self, row, transcript):
+        # Interim text only goes into the editor; the segment keeps its transcript until
+        # the final result arrives.
+        if self.current_segment_row != row or row in self._asr_edited_rows:
+            return
+        self._asr_partial_row = row
+        self._updating_transcript = True
+        self.transcript_editor.setPlainText(transcript)
+        self._updating_transcript = False
+
+    @Slot(int)
+    def on_asr_partial_ended(self, row):
+        if row == self._asr_partial_row:
+            self.restore_asr_partial()
+
+    def restore_asr_partial(self):
+        """Put the segment's own transcript back if a stream ended without a final result."""
+        row = self._asr_partial_row
+        self._asr_partial_row = None
+        if row is None or row != self.current_segment_row:
+            return
+        self._updating_transcript = True
+        self.transcript_editor.setPlainText(self.segment_model.segment_at(row).transcript)
+        self._updating_transcript = False
+
     def on_asr_segment_done(self, row, transcript):
+        if row == self._asr_partial_row:
+            self._asr_partial_row = None
+        if row in self._asr_edited_rows:
+            # Typed text wins over the result; it stays in the ASR cache for a later run.
+            return
         segment = self.segment_model.segment_at(row)
         segment.transcript = transcript
         segment.asr_generated = True
         segment.verified = False
-        self.segment_model.update_segment(row)
-        self.segment_proxy.invalidate()
-        self.segment_proxy.sort(0, Qt.AscendingOrder)
-        self.update_segments_header()
-        self.update_project_info()
 
         if self.current_segment_row == row:
             self._updating_transcript = True
@@ -883,11 +1431,27 @@ class MainWindow(QMainWindow):
             self.segment_verified_checkbox.setChecked(False)
             self._updating_transcript = False
 
-        if self.current_project_path is not None:
-            self.save_project_file(show_status=False)
+        # Batch results are applied to the list together, a few times a second.
+        self._asr_updated_rows.add(row)
+        if not self._asr_refresh_timer.isActive():
+            self._asr_refresh_timer.start()
+
+    def apply_asr_updates(self):
+        self._asr_refresh_timer.stop()
+        if not self._asr_updated_rows:
+            return
+        rows = sorted(self._asr_updated_rows)
+        self._asr_updated_rows = set()
+        self.segment_model.update_segments(rows)
+        self.update_segments_header()
+        self.update_project_info()
+        self.save_segments(rows)
 
     @Slot(str)
     def on_asr_failed(self, message):
+        self.apply_asr_updates()
+        self.restore_asr_partial()
+        self._asr_edited_rows = set()
         self.show_status(f"ASR failed: {message}")
         self.asr_thread = None
         self.asr_worker = None
@@ -897,9 +1461,28 @@ class MainWindow(QMainWindow):
         if self.current_segment_row is not None:
             self.segment_asr_button.setEnabled(True)
 
-    @Slot()
-    def on_asr_finished(self):
-        self.show_status("ASR complete.")
+    @Slot(object)
+    def on_asr_finished(self, summary):
+        self.apply_asr_updates()
+        self.restore_asr_partial()
+        self._asr_edited_rows = set()
+        for failure in summary.failures:
+            self._logger.warning(
+                "ASR failed for %s after %d attempt(s): %s", failure.name, failure.attempts, failure.error
+            )
+        self._logger.info(
+            "ASR sent %d requests (%d retries) for %d segments", summary.requests, summary.retries, summary.total
+        )
+        stats = self.asr_cache.stats()
+        self._logger.info(
+            "ASR cache: %d entries, %.1f MiB, %d hits, %d misses (%.0f%% hit rate)",
+            stats.entries,
+            stats.size_bytes / 1024**2,
+            stats.hits,
+            stats.misses,
+            stats.hit_rate * 100,
+        )
+        self.show_status(summary.message(), 10000 if summary.failures else 3000)
         self.asr_thread = None
         self.asr_worker = None
         self.update_state()
@@ -908,6 +1491,65 @@ class MainWindow(QMainWindow):
         if self.current_segment_row is not None:
             self.segment_asr_button.setEnabled(True)
 
+    def export_segment_files(self):
+        if not self.virtual_split or self.working_wav_path is None:
+            self.show_status("Segment files are already written for this project.")
+            return
+        if self.export_thread is not None:
+            self.show_status("Export already running.")
+            return
+        self.export_segments_action.setEnabled(False)
+        self.show_status("Exporting segment files...")
+
+        self.export_worker = ExportWorker(self.working_wav_path, list(self.current_segments))
+        self.export_thread = QThread(self)
+        self.export_worker.moveToThread(self.export_thread)
+
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.failed.connect(self.on_export_finished)
+        self.export_thread.started.connect(self.export_worker.run)
+
+        self.export_worker.finished.connect(self.export_thread.quit)
+        self.export_worker.failed.connect(self.export_thread.quit)
+        self.export_thread.finished.connect(self.export_worker.deleteLater)
+        self.export_thread.finished.connect(self.export_thread.deleteLater)
+
+        self.export_thread.start()
+
+    @Slot(int, int, str)
+    def on_export_progress(self, done, total, output_name):
+        self.show_status(f"Export {done}/{total}: {output_name}")
+
+    @Slot(str)
+    def on_export_finished(self, message):
+        self.show_status(message)
+        self.export_thread = None
+        self.export_worker = None
+        self.export_segments_action.setEnabled(self.virtual_split)
+
+    def closeEvent(self, event):
+        self.cancel_project_load()
+        self.apply_asr_updates()
+        if not self.autosave.flush():
+            answer = QMessageBox.warning(
+                self,
+                "Unsaved changes",
+                "The project could not be saved. Close anyway and lose the latest edits?",
+                QMessageBox.Close | QMessageBox.Cancel,
+                QMessageBox.Cancel,
+            )
+            if answer != QMessageBox.Close:
+                event.ignore()
+                return
+        if self.asr_worker is not None:
+            self.asr_worker.cancel()
+        self.asr_backend.close()
+        self.asr_cache.close()
+        self.autosave.shutdown()
+        self.close_project_store()
+        super().closeEvent(event)
+
     def show_status(self, message: str, timeout: int | None = 3000):
         if timeout is None:
             self.statusBar().showMessage(message)
@@ -962,63 +1604,297 @@ class MainWindow(QMainWindow):
 
 class SplitWorker(QObject):
     progress = Signal(int, int, str)
+    segments_ready = Signal(object)
     finished = Signal(object)
     failed = Signal(str)
 
-    def __init__(self, ffmpeg_path: Path, audio_path: Path, textgrid_path: Path, output_dir: Path):
+    def __init__(
+        self,
+        ffmpeg_path: Path,
+        audio_path: Path,
+        textgrid_path: Path,
+        output_dir: Path,
+        virtual: bool = False,
+        existing_segments: list[Segment] | None = None,
+        normalization_cache: NormalizationCache | None = None,
+        plan: SplitPlan | None = None,
+    ):
         super().__init__()
         self.ffmpeg_path = ffmpeg_path
         self.audio_path = audio_path
         self.textgrid_path = textgrid_path
         self.output_dir = output_dir
+        self.virtual = virtual
+        self.existing_segments = existing_segments
+        self.normalization_cache = normalization_cache
+        self.plan = plan or SplitPlan()
 
     @Slot()
     def run(self):
+        diff = None
         try:
-            output_dir, segments = split_audio_with_ffmpeg(
-                self.ffmpeg_path,
-                self.audio_path,
-                self.textgrid_path,
-                self.output_dir,
-                progress_cb=self._on_progress,
-            )
+            if self.existing_segments is not None:
+                output_dir, segments, diff = resplit_incremental(
+                    self.ffmpeg_path,
+                    self.audio_path,
+                    self.textgrid_path,
+                    self.output_dir,
+                    self.existing_segments,
+                    progress_cb=self._on_progress,
+                    workers=resolve_split_workers(),
+                    virtual=self.virtual,
+                    normalization_cache=self.normalization_cache,
+                    plan=self.plan,
+                    segments_cb=self.segments_ready.emit,
+                )
+            else:
+                output_dir, segments = split_audio_with_ffmpeg(
+                    self.ffmpeg_path,
+                    self.audio_path,
+                    self.textgrid_path,
+                    self.output_dir,
+                    progress_cb=self._on_progress,
+                    engine=resolve_split_engine(),
+                    workers=resolve_split_workers(),
+                    virtual=self.virtual,
+                    normalization_cache=self.normalization_cache,
+                    segments_cb=self.segments_ready.emit,
+                    plan=self.plan,
+                )
         except Exception as exc:
             self.failed.emit(str(exc))
             return
 
-        self.finished.emit({"output_dir": str(output_dir), "segments": segments})
+        wav_path = working_wav_path(self.audio_path, output_dir)
+        self.finished.emit(
+            {
+                "output_dir": str(output_dir),
+                "segments": segments,
+                "virtual": self.virtual,
+                "wav_path": str(wav_path) if wav_path.exists() else "",
+                "diff": diff.summary() if diff is not None else "",
+                "plan": self.plan,
+            }
+        )
 
     def _on_progress(self, done, total, output_path):
         self.progress.emit(done, total, output_path.name)
 
 
+class ProjectLoadWorker(QObject):
+    opened = Signal(object)
+    segments_ready = Signal(object)
+    progress = Signal(int, int)
+    finished = Signal()
+    failed = Signal(str)
+
+    def __init__(self, project_path: Path):
+        super().__init__()
+        self.project_path = project_path
+        self._canceled = False
+
+    def cancel(self):
+        self._canceled = True
+
+    @Slot()
+    def run(self):
+        try:
+            project, total, chunks = open_project_stream(self.project_path)
+            self.opened.emit(project)
+            done = 0
+            for chunk in chunks:
+                if self._canceled:
+                    chunks.close()
+                    break
+                done += len(chunk)
+                self.segments_ready.emit(chunk)
+                self.progress.emit(done, total)
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        self.finished.emit()
+
+
 class ASRWorker(QObject):
     progress = Signal(int, int, str)
     segment_done = Signal(int, str)
-    finished = Signal()
+    # Interim transcript of a streamed segment, by row.
+    partial = Signal(int, str)
+    # A streamed segment's interim transcript is void: its stream failed, by row.
+    partial_ended = Signal(int)
+    finished = Signal(object)
     failed = Signal(str)
 
-    def __init__(self, items: list[tuple[int, Path]], credentials_path: Path | None, model: str):
+    def __init__(
+        self,
+        items: list[tuple[int, Segment]],
+        backend: ASRBackend,
+        cache: ASRCache | None,
+        credentials_path: Path | None,
+        model: str,
+        working_wav_path: Path | None = None,
+    ):
         super().__init__()
         self.items = items
+        self.backend = backend
+        self._rows = {id(segment): row for row, segment in items}
+        self.cache = cache
+        self.packing = resolve_asr_packing()
         self.credentials_path = credentials_path
         self.model = model
+        self.working_wav_path = working_wav_path
+        self._source: PcmWav | None = None
+        workers = max(resolve_asr_concurrency(), backend.concurrency)
+        self._batch = BatchTranscriber(
+            self._transcribe,
+            workers,
+            RateLimiter(resolve_asr_rate() if backend.rate_limited else 0, burst=workers),
+            resolve_asr_retries(),
+            backend.is_retryable,
+            cached=self._cached if cache is not None else None,
+        )
+
+    def cancel(self):
+        """Stop starting requests; callable from any thread."""
+        self._batch.cancel()
+
+    def _audio(self, segment: Segment) -> bytes | memoryview:
+        if self._source is None:
+            return read_pcm(Path(segment.path))
+        return self._source.frames_for_ms(segment.start_ms, segment.end_ms)
+
+    def _chunks(self, segment: Segment) -> Iterator[bytes | memoryview]:
+        """The segment's audio in streaming-sized chunks, read as they are needed."""
+        frames = 16000 * STREAM_CHUNK_MS // 1000
+        if self._source is None:
+            yield from iter_pcm(Path(segment.path), frames)
+            return
+        audio = self._source.frames_for_ms(segment.start_ms, segment.end_ms)
+        try:
+            step = frames * self._source.block_align
+            for start in range(0, len(audio), step):
+                yield audio[start : start + step]
+        finally:
+            audio.release()
+
+    def _cache_key(self, audio: bytes | memoryview | Iterator[bytes | memoryview], packed: bool = False) -> str:
+        recognizer = self.backend.recognizer_name(self.credentials_path)
+        return ASRCache.key(audio, self.model, DEFAULT_ASR_LANGUAGE, recognizer, packed)
+
+    def _cached(self, segment: Segment) -> str | None:
+        keys = [self._cache_key(self._chunks(segment))]
+        # A segment short enough to be packed may have been transcribed in a pack before.
+        if self.packing and segment.end_ms - segment.start_ms <= PACK_MAX_SEGMENT_MS:
+            keys.append(self._cache_key(self._chunks(segment), packed=True))
+        entry = self.cache.get(*keys)
+        return entry[0] if entry is not None else None
+
+    def _transcribe(self, segments: list[Segment]) -> list[str | None]:
+        if len(segments) == 1:
+            return [self._transcribe_one(segments[0])]
+        audios = [self._audio(segment) for segment in segments]
+        try:
+            pcm, spans = pack_audio(audios)
+            keys = [self._cache_key(audio, packed=True) for audio in audios] if self.cache is not None else []
+        finally:
+            for audio in audios:
+                if isinstance(audio, memoryview):
+                    audio.release()
+        result = self.backend.recognize_pcm(
+            pcm, self.credentials_path, DEFAULT_ASR_LANGUAGE, self.model, word_offsets=True
+        )
+        if result.transcript and not result.words:
+            return [None] * len(segments)
+        transcripts = split_words(result.words, spans)
+        if transcripts is None:
+            return [None] * len(segments)
+        for key, transcript in zip(keys, transcripts):
+            self.cache.put(key, transcript, [])
+        return transcripts
+
+    def _transcribe_one(self, segment: Segment) -> str:
+        if segment.end_ms - segment.start_ms > STREAMING_MIN_MS:
+            return self._stream_one(segment)
+        audio = self._audio(segment)
+        try:
+            result = self.backend.recognize_pcm(audio, self.credentials_path, DEFAULT_ASR_LANGUAGE, self.model)
+            if self.cache is not None:
+                self.cache.put(self._cache_key(audio), result.transcript, result.alternatives)
+        finally:
+            if isinstance(audio, memoryview):
+                audio.release()
+        return result.transcript
+
+    def _stream_one(self, segment: Segment) -> str:
+        row = self._rows.get(id(segment))
+        on_partial = None if row is None else lambda transcript: self.partial.emit(row, transcript)
+        try:
+            result = self.backend.stream_pcm(
+                self._chunks(segment), self.credentials_path, DEFAULT_ASR_LANGUAGE, self.model, on_partial
+            )
+        except BaseException:
+            # Put the editor back now; a retry or the end of the batch may be far off.
+            if row is not None:
+                self.partial_ended.emit(row)
+            raise
+        if self.cache is not None:
+            self.cache.put(self._cache_key(self._chunks(segment)), result.transcript, result.alternatives)
+        return result.transcript
 
     @Slot()
     def run(self):
-        total = len(self.items)
-        for index, (row, audio_path) in enumerate(self.items, start=1):
-            try:
-                transcript = transcribe_wav(audio_path, self.credentials_path, model=self.model)
-            except Exception as exc:
-                self.failed.emit(str(exc))
-                return
-            self.segment_done.emit(row, transcript)
-            self.progress.emit(index, total, audio_path.name)
-        self.finished.emit()
+        try:
+            self._source = PcmWav(self.working_wav_path) if self.working_wav_path else None
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        try:
+            if self.packing:
+                jobs = plan_packs(self.items)
+            else:
+                jobs = [[item] for item in self.items]
+            summary = self._batch.run(jobs, self.segment_done.emit, self.progress.emit)
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        finally:
+            if self._source is not None:
+                self._source.close()
+                self._source = None
+        self.finished.emit(summary)
+
+
+class ExportWorker(QObject):
+    progress = Signal(int, int, str)
+    finished = Signal(str)
+    failed = Signal(str)
+
+    def __init__(self, wav_path: Path, segments: list[Segment]):
+        super().__init__()
+        self.wav_path = wav_path
+        self.segments = segments
+
+    @Slot()
+    def run(self):
+        try:
+            export_segments(
+                self.wav_path,
+                self.segments,
+                progress_cb=self._on_progress,
+                workers=resolve_split_workers(),
+            )
+        except Exception as exc:
+            self.failed.emit(f"Export failed: {exc}")
+            return
+        self.finished.emit(f"Exported {len(self.segments)} segment files.")
+
+    def _on_progress(self, done, total, output_path):
+        self.progress.emit(done, total, output_path.name)
 
 
 def main():
+    # Offline ASR spawns worker processes, which re-enter here in frozen builds.
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
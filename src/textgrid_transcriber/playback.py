@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QIODevice
+
+from textgrid_transcriber.wav import PcmWav, wav_header
+
+
+class WavRangeDevice(QIODevice):
+    """Read-only WAV stream over a sample range of a memory-mapped working WAV.
+
+    Bytes are served straight from the mapping as the player asks for them, so a
+    virtual segment is never copied into its own buffer or file.
+    """
+
+    def __init__(self, source: PcmWav, start_ms: int, end_ms: int, parent=None):
+        super().__init__(parent)
+        self._pcm = source.frames_for_ms(start_ms, end_ms)
+        self._header = wav_header(len(self._pcm), source.sample_rate, source.channels, source.sample_width)
+
+    def isSequential(self) -> bool:
+        return False
+
+    def size(self) -> int:
+        return len(self._header) + len(self._pcm)
+
+    def bytesAvailable(self) -> int:
+        return self.size() - self.pos() + super().bytesAvailable()
+
+    def readData(self, maxlen: int) -> bytes:
+        pos = self.pos()
+        header_len = len(self._header)
+        chunk = b""
+        if pos < header_len:
+            chunk = self._header[pos : pos + maxlen]
+            pos += len(chunk)
+            maxlen -= len(chunk)
+        if maxlen > 0:
+            offset = pos - header_len
+            chunk += self._pcm[offset : offset + maxlen].tobytes()
+        return chunk
+
+    def writeData(self, data) -> int:
+        return -1
+
+    def close(self) -> None:
+        super().close()
+        self._pcm.release()
@@ -1,24 +1,27 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterable, Sequence
+
+from textgrid_transcriber.segment_table import Segment, SegmentTable
 
 PROJECT_VERSION = 1
 PROJECT_FILENAME = "textgrid_project.json"
 
 
 @dataclass
-class Segment:
-    tier: str
-    index: int
-    start_ms: int
-    end_ms: int
-    path: str
-    mark: str
-    transcript: str
-    asr_generated: bool
-    verified: bool
+class SplitPlan:
+    """Which labeled intervals get cut: an empty ``tiers`` means every tier, and a zero
+    ``max_duration_ms`` means no upper bound."""
+
+    tiers: list[str] = field(default_factory=list)
+    mark_pattern: str = ""
+    min_duration_ms: int = 0
+    max_duration_ms: int = 0
 
 
 @dataclass
@@ -28,9 +31,12 @@ class Project:
     textgrid_path: str
     output_dir: str
     batch_asr: bool
-    segments: list[Segment]
+    segments: Sequence[Segment]
     credentials_path: str
     asr_model: str
+    virtual_split: bool = False
+    wav_path: str = ""
+    split_plan: SplitPlan = field(default_factory=SplitPlan)
 
 
 def _rel_path(path: Path, base: Path) -> str:
@@ -47,9 +53,41 @@ def _abs_path(path_str: str, base: Path) -> Path:
     return (base / path).resolve()
 
 
-def save_project(project_path: Path, project: Project) -> None:
-    base = project_path.parent
-    data = {
+def segment_to_dict(segment: Segment, base: Path) -> dict:
+    return {
+        "tier": segment.tier,
+        "index": segment.index,
+        "start_ms": segment.start_ms,
+        "end_ms": segment.end_ms,
+        "path": _rel_path(Path(segment.path), base),
+        "mark": segment.mark,
+        "transcript": segment.transcript,
+        "asr_generated": segment.asr_generated,
+        "verified": segment.verified,
+    }
+
+
+def segments_from_dicts(segments: Iterable[dict], base: Path) -> SegmentTable:
+    # Paths stay as written and are joined to ``base`` only when a segment's path is read.
+    table = SegmentTable(base=str(base))
+    for segment in segments:
+        table.append_values(
+            segment["tier"],
+            segment["index"],
+            segment["start_ms"],
+            segment["end_ms"],
+            segment["path"],
+            segment.get("mark", ""),
+            segment.get("transcript", ""),
+            segment.get("asr_generated", False),
+            segment.get("verified", False),
+        )
+    return table
+
+
+def project_settings_to_dict(project: Project, base: Path) -> dict:
+    """Everything in the project file except its segments."""
+    return {
         "version": project.version,
         "audio_path": _rel_path(Path(project.audio_path), base),
         "textgrid_path": _rel_path(Path(project.textgrid_path), base),
@@ -59,43 +97,19 @@ def save_project(project_path: Path, project: Project) -> None:
         if project.credentials_path
         else "",
         "asr_model": project.asr_model,
-        "segments": [
-            {
-                "tier": segment.tier,
-                "index": segment.index,
-                "start_ms": segment.start_ms,
-                "end_ms": segment.end_ms,
-                "path": _rel_path(Path(segment.path), base),
-                "mark": segment.mark,
-                "transcript": segment.transcript,
-                "asr_generated": segment.asr_generated,
-                "verified": segment.verified,
-            }
-            for segment in project.segments
-        ],
+        "virtual_split": project.virtual_split,
+        "wav_path": _rel_path(Path(project.wav_path), base) if project.wav_path else "",
+        "split_plan": {
+            "tiers": project.split_plan.tiers,
+            "mark_pattern": project.split_plan.mark_pattern,
+            "min_duration_ms": project.split_plan.min_duration_ms,
+            "max_duration_ms": project.split_plan.max_duration_ms,
+        },
     }
-    project_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-
 
-def load_project(project_path: Path) -> Project:
-    base = project_path.parent
-    data = json.loads(project_path.read_text(encoding="utf-8"))
-
-    segments = [
-        Segment(
-            tier=segment["tier"],
-            index=segment["index"],
-            start_ms=segment["start_ms"],
-            end_ms=segment["end_ms"],
-            path=str(_abs_path(segment["path"], base)),
-            mark=segment.get("mark", ""),
-            transcript=segment.get("transcript", ""),
-            asr_generated=segment.get("asr_generated", False),
-            verified=segment.get("verified", False),
-        )
-        for segment in data.get("segments", [])
-    ]
 
+def project_from_dict(data: dict, base: Path, segments: list[Segment]) -> Project:
+    plan = data.get("split_plan", {})
     return Project(
         version=data.get("version", PROJECT_VERSION),
         audio_path=str(_abs_path(data["audio_path"], base)),
@@ -107,4 +121,39 @@ def load_project(project_path: Path) -> Project:
         else "",
         asr_model=data.get("asr_model", "chirp_3"),
         segments=segments,
+        virtual_split=data.get("virtual_split", False),
+        wav_path=str(_abs_path(data["wav_path"], base)) if data.get("wav_path") else "",
+        split_plan=SplitPlan(
+            tiers=list(plan.get("tiers", [])),
+            mark_pattern=plan.get("mark_pattern", ""),
+            min_duration_ms=plan.get("min_duration_ms", 0),
+            max_duration_ms=plan.get("max_duration_ms", 0),
+        ),
     )
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    # Write beside the target and rename over it, so a crash leaves the old file or the new one.
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def save_project(project_path: Path, project: Project) -> None:
+    base = project_path.parent
+    data = project_settings_to_dict(project, base)
+    data["segments"] = [segment_to_dict(segment, base) for segment in project.segments]
+    _write_atomic(project_path, json.dumps(data, indent=2))
+
+
+def load_project(project_path: Path) -> Project:
+    base = project_path.parent.resolve()
+    data = json.loads(project_path.read_text(encoding="utf-8"))
+    return project_from_dict(data, base, segments_from_dicts(data.get("segments", []), base))
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from textgrid_transcriber.project import (
+    PROJECT_FILENAME,
+    Project,
+    Segment,
+    load_project,
+    project_from_dict,
+    project_settings_to_dict,
+    save_project,
+    segment_to_dict,
+    segments_from_dicts,
+)
+from textgrid_transcriber.segment_table import SegmentTable
+
+PROJECT_DB_SUFFIX = ".tgproj"
+PROJECT_DB_FILENAME = f"textgrid_project{PROJECT_DB_SUFFIX}"
+PROJECT_FORMAT_JSON = "json"
+PROJECT_FORMAT_SQLITE = "sqlite"
+PROJECT_FORMATS = (PROJECT_FORMAT_JSON, PROJECT_FORMAT_SQLITE)
+
+# The first chunk is small so a progressively loaded list shows rows right away.
+_FIRST_CHUNK_ROWS = 500
+_CHUNK_ROWS = 20000
+
+_SCHEMA_VERSION = 1
+_SEGMENT_COLUMNS = (
+    "tier",
+    "index",
+    "start_ms",
+    "end_ms",
+    "path",
+    "mark",
+    "transcript",
+    "asr_generated",
+    "verified",
+)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    position INTEGER PRIMARY KEY,
+    tier TEXT NOT NULL,
+    "index" INTEGER NOT NULL,
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    mark TEXT NOT NULL,
+    transcript TEXT NOT NULL,
+    asr_generated INTEGER NOT NULL,
+    verified INTEGER NOT NULL
+);
+"""
+
+
+def resolve_project_format() -> str:
+    project_format = os.getenv("TEXTGRID_PROJECT_FORMAT", "").strip().lower()
+    return project_format if project_format in PROJECT_FORMATS else PROJECT_FORMAT_JSON
+
+
+def is_project_db(path: Path) -> bool:
+    return Path(path).suffix.lower() == PROJECT_DB_SUFFIX
+
+
+def default_project_path(output_dir: Path, project_format: str | None = None) -> Path:
+    if (project_format or resolve_project_format()) == PROJECT_FORMAT_SQLITE:
+        return output_dir / PROJECT_DB_FILENAME
+    return output_dir / PROJECT_FILENAME
+
+
+def find_project_file(output_dir: Path) -> Path | None:
+    """Return the project file a split wrote to ``output_dir``, in either format."""
+    for name in (PROJECT_DB_FILENAME, PROJECT_FILENAME):
+        if (output_dir / name).exists():
+            return output_dir / name
+    return None
+
+
+class ProjectStore:
+    """A project kept in SQLite (WAL mode), one row per segment.
+
+    ``update_segments`` rewrites only the rows it is given, so an edit costs the same
+    however large the project is. Writes may come from any thread; they are serialized.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode this still never corrupts the database; a crash can only lose the last commits.
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version > _SCHEMA_VERSION:
+                raise ValueError(f"Project database {self.path.name} was written by a newer version.")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        except Exception:
+            self._conn.close()
+            raise
+
+    def load(self) -> Project:
+        project, _ = self.load_settings()
+        for chunk in self.iter_segment_chunks():
+            project.segments.extend(chunk)
+        return project
+
+    def load_settings(self) -> tuple[Project, int]:
+        """Return the project with no segments yet, and how many segments it has."""
+        base = self.path.parent.resolve()
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM settings WHERE id = 0").fetchone()
+            if row is None:
+                raise ValueError(f"Project database {self.path.name} has no project settings.")
+            (total,) = self._conn.execute("SELECT COUNT(*) FROM segments").fetchone()
+        return project_from_dict(json.loads(row[0]), base, SegmentTable(base=str(base))), total
+
+    def iter_segment_chunks(self) -> Iterator[SegmentTable]:
+        base = self.path.parent.resolve()
+        columns = ", ".join(f'"{column}"' for column in _SEGMENT_COLUMNS)
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT {columns} FROM segments ORDER BY position")
+        size = _FIRST_CHUNK_ROWS
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(size)
+            if not rows:
+                return
+            yield segments_from_dicts((dict(zip(_SEGMENT_COLUMNS, values)) for values in rows), base)
+            size = _CHUNK_ROWS
+
+    def save(self, project: Project) -> None:
+        """Replace the whole project in one transaction."""
+        base = self.path.parent
+        columns = ", ".join(f'"{column}"' for column in ("position", *_SEGMENT_COLUMNS))
+        placeholders = ", ".join("?" for _ in range(len(_SEGMENT_COLUMNS) + 1))
+        rows = (
+            (position, *segment_to_dict(segment, base).values())
+            for position, segment in enumerate(project.segments)
+        )
+        with self._lock, self._conn:
+            self._write_settings(project)
+            self._conn.execute("DELETE FROM segments")
+            self._conn.executemany(f"INSERT INTO segments ({columns}) VALUES ({placeholders})", rows)
+
+    def save_settings(self, project: Project) -> None:
+        with self._lock, self._conn:
+            self._write_settings(project)
+
+    def update_segments(self, rows: Iterable[tuple[int, Segment]]) -> None:
+        """Persist the editable fields of the segments at the given positions."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE segments SET transcript = ?, asr_generated = ?, verified = ? WHERE position = ?",
+                (
+                    (segment.transcript, segment.asr_generated, segment.verified, position)
+                    for position, segment in rows
+                ),
+            )
+
+    def _write_settings(self, project: Project) -> None:
+        data = json.dumps(project_settings_to_dict(project, self.path.parent))
+        self._conn.execute("INSERT OR REPLACE INTO settings (id, data) VALUES (0, ?)", (data,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> ProjectStore:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def read_project(project_path: Path) -> Project:
+    """Load a project from either a JSON file or a project database."""
+    if is_project_db(project_path):
+        if not project_path.exists():
+            raise FileNotFoundError(project_path)
+        with ProjectStore(project_path) as store:
+            return store.load()
+    return load_project(project_path)
+
+
+def open_project_stream(project_path: Path) -> tuple[Project, int, Iterator[SegmentTable]]:
+    """Read a project's settings now and its segments as a series of tables.
+
+    Returns the project with an empty segment table, the total segment count and an
+    iterator of chunks to ``extend`` that table with, first a small one, in file order.
+    """
+    if is_project_db(project_path):
+        if not project_path.exists():
+            raise FileNotFoundError(project_path)
+        store = ProjectStore(project_path)
+        try:
+            project, total = store.load_settings()
+        except Exception:
+            store.close()
+            raise
+
+        def chunks():
+            with store:
+                yield from store.iter_segment_chunks()
+
+        return project, total, chunks()
+
+    base = project_path.parent.resolve()
+    data = json.loads(project_path.read_text(encoding="utf-8"))
+    rows = data.get("segments", [])
+    project = project_from_dict(data, base, SegmentTable(base=str(base)))
+
+    def chunks():
+        start = 0
+        size = _FIRST_CHUNK_ROWS
+        while start < len(rows):
+            yield segments_from_dicts(rows[start : start + size], base)
+            start += size
+            size = _CHUNK_ROWS
+
+    return project, len(rows), chunks()
+
+
+def write_project(project_path: Path, project: Project) -> None:
+    """Save a project in the format its file suffix selects, e.g. to import or export JSON."""
+    if is_project_db(project_path):
+        with ProjectStore(project_path) as store:
+            store.save(project)
+        return
+    save_project(project_path, project)
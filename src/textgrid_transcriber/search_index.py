@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+
+QUERY_TERMS = "terms"
+QUERY_PHRASE = "phrase"
+QUERY_REGEX = "regex"
+QUERY_SUBSTRING = "substring"
+
+# Regex literals shorter than this narrow the candidates too little to be worth a lookup.
+_MIN_LITERAL = 3
+
+# One-letter escapes that stand for a class or an anchor and end after the letter.
+_CLASS_ESCAPES = frozenset("dDwWsSbBAZ")
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """A parsed search box query; ``matches`` takes lowercased name and transcript.
+
+    ``hello wor`` matches segments where every word starts a word of the transcript or
+    file name, ``"hello world"`` the words in sequence, and ``/h.llo/`` a regular
+    expression (case-insensitive). Substring queries keep the plain ``in`` test.
+    """
+
+    kind: str
+    text: str
+    terms: tuple[str, ...] = ()
+    pattern: re.Pattern | None = None
+    literals: tuple[str, ...] = ()
+
+    def matches(self, name: str, transcript: str) -> bool:
+        if self.kind == QUERY_SUBSTRING:
+            return self.text in name or self.text in transcript
+        if self.kind in (QUERY_REGEX, QUERY_PHRASE):
+            return bool(self.pattern.search(name) or self.pattern.search(transcript))
+        tokens = _TOKEN_RE.findall(name) + _TOKEN_RE.findall(transcript)
+        return all(any(token.startswith(term) for token in tokens) for term in self.terms)
+
+
+def parse_query(text: str, substring: bool = False) -> SearchQuery | None:
+    """Parse search box text; raises ``re.error`` for an invalid ``/regex/``."""
+    text = text.strip()
+    if not text:
+        return None
+    if substring:
+        return SearchQuery(QUERY_SUBSTRING, text.lower())
+    if len(text) > 2 and text.startswith("/") and text.endswith("/"):
+        source = text[1:-1]
+        return SearchQuery(
+            QUERY_REGEX,
+            text,
+            pattern=re.compile(source, re.IGNORECASE),
+            literals=tuple(literal.lower() for literal in _required_literals(source)),
+        )
+    terms = tuple(tokenize(text))
+    if not terms:
+        # Only punctuation: nothing to look up, so fall back to a plain substring test.
+        return SearchQuery(QUERY_SUBSTRING, text.lower())
+    if len(text) > 1 and text.startswith('"') and text.endswith('"'):
+        return SearchQuery(QUERY_PHRASE, text.lower(), terms, pattern=_phrase_pattern(terms))
+    return SearchQuery(QUERY_TERMS, text.lower(), terms)
+
+
+def _phrase_pattern(terms: tuple[str, ...]) -> re.Pattern:
+    """Match ``terms`` as consecutive whole tokens, whatever separates them."""
+    first = terms[0]
+    # Leading with the literal lets the regex engine skip ahead to it.
+    source = re.escape(first) + r"(?<![^\W_].{%d})" % len(first)
+    source += "".join(r"[\W_]+" + re.escape(term) for term in terms[1:])
+    return re.compile(source + r"(?![^\W_])", re.DOTALL)
+
+
+def _required_literals(source: str) -> list[str]:
+    """Runs of word characters every match of the regex must contain.
+
+    Deliberately conservative: alternation, groups and escapes other than one-letter
+    classes end the analysis, classes end the run, and a quantifier that allows zero
+    repeats drops the character before it.
+    """
+    if "|" in source or "(" in source:
+        return []
+    literals = []
+    run = ""
+    position = 0
+    while position < len(source):
+        char = source[position]
+        if char == "\\":
+            literals.append(run)
+            run = ""
+            escaped = source[position + 1 : position + 2]
+            if escaped.isalnum() and escaped not in _CLASS_ESCAPES:
+                # \x41, \u00e9, \N{...}, octal and backreferences run on past two
+                # characters; what follows is not safe to read as literals.
+                break
+            position += 2
+            continue
+        if char in "[{":
+            if char == "{":
+                run = run[:-1]
+            closing = source.find("]" if char == "[" else "}", position + 1)
+            position = len(source) if closing < 0 else closing + 1
+            literals.append(run)
+            run = ""
+            continue
+        if char in "?*":
+            run = run[:-1]
+        if _TOKEN_RE.fullmatch(char):
+            run += char
+        else:
+            literals.append(run)
+            run = ""
+        position += 1
+    literals.append(run)
+    return [literal for literal in literals if len(literal) >= _MIN_LITERAL]
+
+
+class SearchIndex:
+    """Finds the rows matching a ``SearchQuery`` without testing every row.
+
+    Transcript words are kept in an inverted index (word -> rows) with a sorted
+    vocabulary for prefix lookups; ``add_rows`` and ``update`` keep it current.
+    File names never change and share most of their words (tier, ``wav``), so postings
+    for them would cost more than they save; they are scanned instead, which is a tight
+    loop over short strings. Regex queries first narrow the transcripts to rows holding
+    the literal runs the pattern requires.
+
+    ``names`` and ``transcripts`` must be lowercased. They are read, never copied, so
+    callers must update them in place.
+    """
+
+    def __init__(self, names: list[str], transcripts: list[str]):
+        self._names = names
+        self._transcripts = transcripts
+        self.clear()
+
+    def clear(self) -> None:
+        self._postings: dict[str, set[int]] = {}
+        self._vocabulary: list[str] | None = []
+
+    def add_rows(self, start: int) -> None:
+        """Index the transcripts of rows from ``start`` on, which must be new."""
+        postings = self._postings
+        for row in range(start, len(self._transcripts)):
+            for token in set(_TOKEN_RE.findall(self._transcripts[row])):
+                rows = postings.get(token)
+                if rows is None:
+                    postings[token] = {row}
+                    self._vocabulary = None
+                else:
+                    rows.add(row)
+
+    def update(self, row: int, previous_transcript: str) -> None:
+        """Re-index one row whose transcript changed from ``previous_transcript``."""
+        previous = set(_TOKEN_RE.findall(previous_transcript))
+        current = set(_TOKEN_RE.findall(self._transcripts[row]))
+        postings = self._postings
+        for token in previous - current:
+            rows = postings[token]
+            rows.discard(row)
+            if not rows:
+                del postings[token]
+                self._vocabulary = None
+        for token in current - previous:
+            rows = postings.get(token)
+            if rows is None:
+                postings[token] = {row}
+                self._vocabulary = None
+            else:
+                rows.add(row)
+
+    def matches(self, query: SearchQuery, row: int) -> bool:
+        return query.matches(self._names[row], self._transcripts[row])
+
+    def search(self, query: SearchQuery) -> set[int]:
+        if query.kind == QUERY_TERMS:
+            found = None
+            for term in query.terms:
+                rows = self._transcript_rows_with_prefix(term) | self._name_rows(term, word_start=True)
+                found = rows if found is None else found & rows
+                if not found:
+                    break
+            return found or set()
+
+        if query.kind == QUERY_PHRASE:
+            candidates = self._transcript_rows_with_words(query.terms)
+            candidates |= self._name_rows(query.terms[0], word_start=True)
+        elif query.kind == QUERY_REGEX and query.literals:
+            candidates = self._transcript_rows_with_words(query.literals, fragments=True)
+            candidates |= self._name_rows(max(query.literals, key=len))
+        elif query.kind == QUERY_REGEX:
+            candidates = set(self._regex_name_rows(query.pattern))
+            candidates.update(row for row, text in enumerate(self._transcripts) if query.pattern.search(text))
+            return candidates
+        else:
+            words = _TOKEN_RE.findall(query.text)
+            if words:
+                candidates = self._transcript_rows_with_words((max(words, key=len),), fragments=True)
+            else:
+                candidates = {row for row, text in enumerate(self._transcripts) if query.text in text}
+            candidates |= self._name_rows(query.text)
+        return {row for row in candidates if self.matches(query, row)}
+
+    def _vocabulary_sorted(self) -> list[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        return self._vocabulary
+
+    def _transcript_rows_with_prefix(self, prefix: str) -> set[int]:
+        vocabulary = self._vocabulary_sorted()
+        rows = set()
+        for position in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            token = vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            rows |= self._postings[token]
+        return rows
+
+    def _transcript_rows_with_words(self, words, fragments: bool = False) -> set[int]:
+        """Rows whose transcript has every word, or with ``fragments`` a word containing each."""
+        found = None
+        for word in words:
+            if fragments:
+                rows = set()
+                for token, token_rows in self._postings.items():
+                    if word in token:
+                        rows |= token_rows
+            else:
+                rows = set(self._postings.get(word, ()))
+            found = rows if found is None else found & rows
+            if not found:
+                break
+        return found or set()
+
+    def _name_rows(self, text: str, word_start: bool = False) -> set[int]:
+        if not word_start:
+            return {row for row, name in enumerate(self._names) if text in name}
+        # The literal comes first so the regex engine can skip ahead to it; the
+        # lookbehind then rejects hits that continue a word.
+        search = re.compile(re.escape(text) + r"(?<![^\W_].{%d})" % len(text), re.DOTALL).search
+        return {row for row, name in enumerate(self._names) if search(name)}
+
+    def _regex_name_rows(self, pattern: re.Pattern) -> set[int]:
+        return {row for row, name in enumerate(self._names) if pattern.search(name)}
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import os
+import sys
+from array import array
+from dataclasses import dataclass, fields, replace
+from typing import Iterable, Iterator, Sequence
+
+
+@dataclass
+class Segment:
+    tier: str
+    index: int
+    start_ms: int
+    end_ms: int
+    path: str
+    mark: str
+    transcript: str
+    asr_generated: bool
+    verified: bool
+
+
+_ASR_GENERATED = 1
+_VERIFIED = 2
+_SEGMENT_FIELDS = tuple(field.name for field in fields(Segment))
+
+
+class SegmentTable:
+    """Columnar storage for segments, read and written through ``SegmentView`` rows.
+
+    Numbers and flags live in ``array`` columns, tier names are stored once and referenced
+    by id, and marks are interned. A path is not stored when it follows the splitter's
+    ``<tier dir>/<tier>_<index>_<start>_<end>.wav`` layout; it is rebuilt from the tier's
+    directory and index padding on access. Only paths that break the layout are kept.
+
+    Stored paths may be relative to ``base``; they are joined to it only when a row's
+    ``path`` is read, without touching the filesystem.
+    """
+
+    def __init__(self, segments: Iterable[Segment] = (), base: str = ""):
+        self.base = base
+        self._tier_ids: dict[str, int] = {}
+        self._tier_names: list[str] = []
+        self._tier_dirs: list[str | None] = []
+        self._tier_padding: list[int] = []
+        self._tier = array("I")
+        self._index = array("i")
+        self._start_ms = array("i")
+        self._end_ms = array("i")
+        self._flags = array("B")
+        self._marks: list[str] = []
+        self._transcripts: list[str] = []
+        self._paths: dict[int, str] = {}
+        self.extend(segments)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, row: int) -> SegmentView:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("segment row out of range")
+        return SegmentView(self, row)
+
+    def __iter__(self) -> Iterator[SegmentView]:
+        for row in range(len(self)):
+            yield SegmentView(self, row)
+
+    def append(self, segment: Segment) -> None:
+        self.append_values(
+            segment.tier,
+            segment.index,
+            segment.start_ms,
+            segment.end_ms,
+            segment.path,
+            segment.mark,
+            segment.transcript,
+            segment.asr_generated,
+            segment.verified,
+        )
+
+    def extend(self, segments: Iterable[Segment]) -> None:
+        if isinstance(segments, SegmentTable) and segments.base == self.base and segments is not self:
+            self._extend_table(segments)
+            return
+        for segment in segments:
+            self.append(segment)
+
+    def _extend_table(self, other: SegmentTable) -> None:
+        offset = len(self)
+        pinned_tiers = set()
+        tier_map = []
+        for other_id, name in enumerate(other._tier_names):
+            tier_id = self._intern_tier(name)
+            tier_map.append(tier_id)
+            other_dir = other._tier_dirs[other_id]
+            if self._tier_dirs[tier_id] is None:
+                self._tier_dirs[tier_id] = other_dir
+                self._tier_padding[tier_id] = other._tier_padding[other_id]
+            elif other_dir is not None and (
+                other_dir != self._tier_dirs[tier_id]
+                or other._tier_padding[other_id] != self._tier_padding[tier_id]
+            ):
+                pinned_tiers.add(other_id)
+
+        self._tier.extend(array("I", (tier_map[tier_id] for tier_id in other._tier)))
+        self._index.extend(other._index)
+        self._start_ms.extend(other._start_ms)
+        self._end_ms.extend(other._end_ms)
+        self._flags.extend(other._flags)
+        self._marks.extend(other._marks)
+        self._transcripts.extend(other._transcripts)
+        self._paths.update((offset + row, path) for row, path in other._paths.items())
+        if pinned_tiers:
+            for row in range(len(other)):
+                if other._tier[row] in pinned_tiers and row not in other._paths:
+                    self._paths[offset + row] = other._derived_path(row)
+
+    def append_values(
+        self,
+        tier: str,
+        index: int,
+        start_ms: int,
+        end_ms: int,
+        path: str,
+        mark: str,
+        transcript: str,
+        asr_generated: bool,
+        verified: bool,
+    ) -> None:
+        row = len(self)
+        tier_id = self._intern_tier(tier)
+        self._tier.append(tier_id)
+        self._index.append(index)
+        self._start_ms.append(start_ms)
+        self._end_ms.append(end_ms)
+        self._flags.append((_ASR_GENERATED if asr_generated else 0) | (_VERIFIED if verified else 0))
+        self._marks.append(sys.intern(mark))
+        self._transcripts.append(transcript or "")
+        if self._tier_dirs[tier_id] is None:
+            self._learn_layout(tier_id, path)
+        if path != self._derived_path(row):
+            self._paths[row] = path
+
+    def copy(self) -> SegmentTable:
+        table = SegmentTable(base=self.base)
+        table._tier_ids = dict(self._tier_ids)
+        table._tier_names = list(self._tier_names)
+        table._tier_dirs = list(self._tier_dirs)
+        table._tier_padding = list(self._tier_padding)
+        for name in ("_tier", "_index", "_start_ms", "_end_ms", "_flags"):
+            setattr(table, name, array(getattr(self, name).typecode, getattr(self, name)))
+        table._marks = list(self._marks)
+        table._transcripts = list(self._transcripts)
+        table._paths = dict(self._paths)
+        return table
+
+    def tier_names(self) -> list[str]:
+        return list(self._tier_names)
+
+    def file_names(self) -> list[str]:
+        """Base name of every row's path, without building the full paths."""
+        names = []
+        for row in range(len(self)):
+            path = self._paths.get(row)
+            if path is None:
+                tier_id = self._tier[row]
+                if self._tier_dirs[tier_id] is not None:
+                    names.append(
+                        f"{self._tier_names[tier_id]}_{self._index[row]:0{self._tier_padding[tier_id]}d}"
+                        f"_{self._start_ms[row]}_{self._end_ms[row]}.wav"
+                    )
+                    continue
+                path = ""
+            names.append(os.path.basename(path))
+        return names
+
+    def _intern_tier(self, tier: str) -> int:
+        tier_id = self._tier_ids.get(tier)
+        if tier_id is None:
+            tier_id = len(self._tier_names)
+            self._tier_ids[tier] = tier_id
+            self._tier_names.append(tier)
+            self._tier_dirs.append(None)
+            self._tier_padding.append(1)
+        return tier_id
+
+    def _learn_layout(self, tier_id: int, path: str) -> None:
+        directory, name = os.path.split(path)
+        prefix = f"{self._tier_names[tier_id]}_"
+        if not name.startswith(prefix):
+            return
+        index_text = name[len(prefix) :].split("_", 1)[0]
+        if index_text.isdigit():
+            self._tier_dirs[tier_id] = directory
+            self._tier_padding[tier_id] = len(index_text)
+
+    def _derived_path(self, row: int) -> str | None:
+        tier_id = self._tier[row]
+        directory = self._tier_dirs[tier_id]
+        if directory is None:
+            return None
+        name = (
+            f"{self._tier_names[tier_id]}_{self._index[row]:0{self._tier_padding[tier_id]}d}"
+            f"_{self._start_ms[row]}_{self._end_ms[row]}.wav"
+        )
+        return os.path.join(directory, name)
+
+    def _path(self, row: int) -> str:
+        path = self._paths.get(row)
+        if path is None:
+            path = self._derived_path(row)
+        return os.path.normpath(os.path.join(self.base, path)) if self.base else path
+
+    def _pin_path(self, row: int) -> None:
+        # Keep the stored path when a field it is derived from changes.
+        self._paths.setdefault(row, self._derived_path(row))
+
+
+class SegmentView:
+    """A ``Segment``-compatible row of a ``SegmentTable``; attribute writes go to the table."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: SegmentTable, row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def tier(self) -> str:
+        return self._table._tier_names[self._table._tier[self._row]]
+
+    @tier.setter
+    def tier(self, value: str) -> None:
+        self._table._pin_path(self._row)
+        self._table._tier[self._row] = self._table._intern_tier(value)
+
+    @property
+    def index(self) -> int:
+        return self._table._index[self._row]
+
+    @index.setter
+    def index(self, value: int) -> None:
+        self._table._pin_path(self._row)
+        self._table._index[self._row] = value
+
+    @property
+    def start_ms(self) -> int:
+        return self._table._start_ms[self._row]
+
+    @start_ms.setter
+    def start_ms(self, value: int) -> None:
+        self._table._pin_path(self._row)
+        self._table._start_ms[self._row] = value
+
+    @property
+    def end_ms(self) -> int:
+        return self._table._end_ms[self._row]
+
+    @end_ms.setter
+    def end_ms(self, value: int) -> None:
+        self._table._pin_path(self._row)
+        self._table._end_ms[self._row] = value
+
+    @property
+    def path(self) -> str:
+        return self._table._path(self._row)
+
+    @path.setter
+    def path(self, value: str) -> None:
+        self._table._paths[self._row] = value
+
+    @property
+    def mark(self) -> str:
+        return self._table._marks[self._row]
+
+    @mark.setter
+    def mark(self, value: str) -> None:
+        self._table._marks[self._row] = sys.intern(value)
+
+    @property
+    def transcript(self) -> str:
+        return self._table._transcripts[self._row]
+
+    @transcript.setter
+    def transcript(self, value: str) -> None:
+        self._table._transcripts[self._row] = value
+
+    @property
+    def asr_generated(self) -> bool:
+        return bool(self._table._flags[self._row] & _ASR_GENERATED)
+
+    @asr_generated.setter
+    def asr_generated(self, value: bool) -> None:
+        self._set_flag(_ASR_GENERATED, value)
+
+    @property
+    def verified(self) -> bool:
+        return bool(self._table._flags[self._row] & _VERIFIED)
+
+    @verified.setter
+    def verified(self, value: bool) -> None:
+        self._set_flag(_VERIFIED, value)
+
+    def _set_flag(self, flag: int, value: bool) -> None:
+        flags = self._table._flags[self._row]
+        self._table._flags[self._row] = (flags | flag) if value else (flags & ~flag)
+
+    def to_segment(self) -> Segment:
+        return Segment(**{name: getattr(self, name) for name in _SEGMENT_FIELDS})
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SegmentView):
+            return self._table is other._table and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self._row))
+
+    def __repr__(self) -> str:
+        return f"SegmentView({self.to_segment()!r})"
+
+
+def copy_segments(segments: Sequence[Segment]) -> Sequence[Segment]:
+    """Detached copy of a segment list or table, safe to hand to another thread."""
+    if isinstance(segments, SegmentTable):
+        return segments.copy()
+    return [copy_segment(segment) for segment in segments]
+
+
+def copy_segment(segment) -> Segment:
+    if isinstance(segment, SegmentView):
+        return segment.to_segment()
+    return replace(segment)
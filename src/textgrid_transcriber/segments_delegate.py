@@ -1,13 +1,30 @@
 from __future__ import annotations
 
 from PySide6.QtCore import QRect, Qt
-from PySide6.QtGui import QColor, QFontMetrics, QPainter, QPalette
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPixmap
 from PySide6.QtWidgets import QStyle, QStyledItemDelegate
 
 from textgrid_transcriber.segments_model import STATUS_EMPTY, STATUS_UNVERIFIED, STATUS_VERIFIED
 
+BADGE_PADDING_X = 8
+BADGE_PADDING_Y = 2
+# Room around a cached badge for the half of its antialiased border outside the rect.
+BADGE_MARGIN = 1
+
 
 class SegmentListDelegate(QStyledItemDelegate):
+    """Paints a segment row: its file name and a status badge.
+
+    Badges are drawn once per (status, selected, font, device pixel ratio) into a pixmap
+    and blitted afterwards, and font metrics are measured once per font, so a repaint
+    costs two text draws per row rather than an antialiased rounded rect as well.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._metrics: dict[str, QFontMetrics] = {}
+        self._badges: dict[tuple[str, bool, str, float], QPixmap] = {}
+
     @staticmethod
     def _badge_colors(status: str, is_selected: bool) -> tuple[QColor, QColor, QColor]:
         if status == STATUS_VERIFIED:
@@ -25,9 +42,46 @@ class SegmentListDelegate(QStyledItemDelegate):
         text_color = QColor(0, 0, 0) if luminance > 160 else QColor(255, 255, 255)
         return badge_color, border_color, text_color
 
+    def _font_metrics(self, font: QFont) -> QFontMetrics:
+        key = font.key()
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = QFontMetrics(font)
+        return metrics
+
+    def _badge(self, status: str, is_selected: bool, font: QFont, ratio: float) -> QPixmap:
+        key = (status, is_selected, font.key(), ratio)
+        pixmap = self._badges.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        fm = self._font_metrics(font)
+        width = fm.horizontalAdvance(status) + (BADGE_PADDING_X * 2)
+        height = fm.height() + (BADGE_PADDING_Y * 2)
+        pixmap = QPixmap(
+            round((width + 2 * BADGE_MARGIN) * ratio),
+            round((height + 2 * BADGE_MARGIN) * ratio),
+        )
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        badge_color, border_color, text_color = self._badge_colors(status, is_selected)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setFont(font)
+        painter.setPen(border_color)
+        painter.setBrush(badge_color)
+        badge_rect = QRect(BADGE_MARGIN, BADGE_MARGIN, width, height)
+        painter.drawRoundedRect(badge_rect, 8, 8)
+        painter.setPen(text_color)
+        painter.drawText(badge_rect, Qt.AlignCenter, status)
+        painter.end()
+
+        self._badges[key] = pixmap
+        return pixmap
+
     def paint(self, painter: QPainter, option, index):
         painter.save()
-        painter.setRenderHint(QPainter.Antialiasing, True)
 
         is_selected = bool(option.state & QStyle.State_Selected)
         if is_selected:
@@ -40,33 +94,19 @@ class SegmentListDelegate(QStyledItemDelegate):
         text_color = palette.highlightedText().color() if is_selected else palette.text().color()
 
         rect = option.rect.adjusted(8, 2, -8, -2)
-        badge_text = status
-        badge_padding_x = 8
-        badge_padding_y = 2
-        fm = QFontMetrics(option.font)
-        badge_width = fm.horizontalAdvance(badge_text) + (badge_padding_x * 2)
-        badge_height = fm.height() + (badge_padding_y * 2)
-
-        badge_rect = QRect(
-            rect.right() - badge_width,
-            rect.center().y() - (badge_height // 2),
-            badge_width,
-            badge_height,
+        badge = self._badge(status, is_selected, option.font, painter.device().devicePixelRatioF())
+        badge_width = round(badge.width() / badge.devicePixelRatio()) - 2 * BADGE_MARGIN
+        badge_height = round(badge.height() / badge.devicePixelRatio()) - 2 * BADGE_MARGIN
+        painter.drawPixmap(
+            rect.right() - badge_width - BADGE_MARGIN,
+            rect.center().y() - (badge_height // 2) - BADGE_MARGIN,
+            badge,
         )
 
-        badge_color, border_color, badge_text_color = self._badge_colors(status, is_selected)
-
-        painter.setPen(border_color)
-        painter.setBrush(badge_color)
-        painter.drawRoundedRect(badge_rect, 8, 8)
-
         painter.setPen(text_color)
         text_rect = QRect(rect.left(), rect.top(), rect.width() - badge_width - 8, rect.height())
         painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, text)
 
-        painter.setPen(badge_text_color)
-        painter.drawText(badge_rect, Qt.AlignCenter, badge_text)
-
         painter.restore()
 
     def sizeHint(self, option, index):
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
 from typing import Iterable
 
-from PySide6.QtCore import QAbstractListModel, QSortFilterProxyModel, Qt
+from PySide6.QtCore import QAbstractListModel, QAbstractProxyModel, QModelIndex, Qt
 
 from textgrid_transcriber.project import Segment
+from textgrid_transcriber.search_index import SearchIndex, SearchQuery, parse_query
+from textgrid_transcriber.segment_table import SegmentTable
 
 STATUS_EMPTY = "Empty"
 STATUS_UNVERIFIED = "Unverified"
 STATUS_VERIFIED = "Verified"
+STATUSES = (STATUS_EMPTY, STATUS_UNVERIFIED, STATUS_VERIFIED)
 
 
 def segment_status(segment: Segment) -> str:
@@ -28,10 +34,40 @@ def status_rank(status: str) -> int:
     return 2
 
 
+@dataclass(frozen=True)
+class SegmentCounts:
+    total: int = 0
+    empty: int = 0
+    unverified: int = 0
+    verified: int = 0
+    asr_generated: int = 0
+
+
 class SegmentListModel(QAbstractListModel):
+    """Segments plus per-row sort and filter keys, kept in step with them.
+
+    The key columns are recomputed only for rows that are added or passed to
+    ``update_segment``, so segments edited elsewhere must be reported there. The column
+    objects are updated in place, never replaced, so a proxy may keep references to them.
+    ``search_index`` covers the file names and transcripts and is kept current the same way,
+    as are the per-tier status counts behind ``counts``.
+    """
+
     def __init__(self, segments: Iterable[Segment] | None = None):
         super().__init__()
+        self._segments = []
+        self.tiers: list[str] = []
+        self.names: list[str] = []
+        self.names_lower: list[str] = []
+        self.transcripts_lower: list[str] = []
+        self.ranks = array("B")
+        self.durations = array("i")
+        self.asr_flags = array("B")
+        # Per tier: rows by status rank, then ASR-generated rows.
+        self._tier_counts: dict[str, list[int]] = {}
+        self.search_index = SearchIndex(self.names_lower, self.transcripts_lower)
         self._segments = list(segments or [])
+        self._append_keys(self._segments)
 
     def rowCount(self, parent=None):
         return len(self._segments)
@@ -39,66 +75,192 @@ class SegmentListModel(QAbstractListModel):
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
-        segment = self._segments[index.row()]
-        status = segment_status(segment)
-        name = Path(segment.path).name
+        row = index.row()
 
         if role == Qt.DisplayRole:
-            return name
+            return self.names[row]
         if role == Qt.UserRole:
-            return segment
+            return self._segments[row]
         if role == Qt.UserRole + 1:
-            return status
+            return STATUSES[self.ranks[row]]
         if role == Qt.UserRole + 2:
-            return status_rank(status)
+            return self.ranks[row]
         if role == Qt.UserRole + 3:
-            return segment.end_ms - segment.start_ms
+            return self.durations[row]
         if role == Qt.UserRole + 4:
-            return segment.tier
+            return self.tiers[row]
         if role == Qt.UserRole + 5:
-            return segment.transcript
+            return self._segments[row].transcript
         return None
 
     def set_segments(self, segments: list[Segment]) -> None:
         self.beginResetModel()
-        self._segments = list(segments)
+        # A table is shared as-is; copying it would materialize a view per row.
+        self._segments = segments if isinstance(segments, SegmentTable) else list(segments)
+        for column in (self.tiers, self.names, self.names_lower, self.transcripts_lower):
+            column.clear()
+        del self.ranks[:]
+        del self.durations[:]
+        del self.asr_flags[:]
+        self._tier_counts.clear()
+        self.search_index.clear()
+        self._append_keys(self._segments)
         self.endResetModel()
 
+    def append_segments(self, segments: list[Segment]) -> None:
+        if not segments:
+            return
+        first = len(self._segments)
+        self.beginInsertRows(QModelIndex(), first, first + len(segments) - 1)
+        self._append_keys(segments)
+        self._segments.extend(segments)
+        self.endInsertRows()
+
     def segment_at(self, row: int) -> Segment:
         return self._segments[row]
 
+    def tier_names(self) -> list[str]:
+        return sorted(self._tier_counts)
+
+    def counts(self, tier: str | None = None) -> SegmentCounts:
+        """Status and ASR counts for one tier, or for all segments."""
+        if tier is not None:
+            tallies = self._tier_counts.get(tier, [0, 0, 0, 0])
+        else:
+            tallies = [sum(column) for column in zip(*self._tier_counts.values())] or [0, 0, 0, 0]
+        empty, unverified, verified, asr_generated = tallies
+        return SegmentCounts(empty + unverified + verified, empty, unverified, verified, asr_generated)
+
+    def _append_keys(self, segments: Iterable[Segment]) -> None:
+        first = len(self.names)
+        if isinstance(segments, SegmentTable):
+            names = segments.file_names()
+        else:
+            segments = list(segments)
+            names = [os.path.basename(segment.path) for segment in segments]
+        for segment, name in zip(segments, names):
+            name_lower = name.lower()
+            self.tiers.append(segment.tier)
+            self.names.append(name)
+            # Most generated names are lowercase already; share the string rather than copy it.
+            self.names_lower.append(name if name_lower == name else name_lower)
+            self.transcripts_lower.append(segment.transcript.lower())
+            rank = status_rank(segment_status(segment))
+            asr_generated = segment.asr_generated
+            self.ranks.append(rank)
+            self.durations.append(segment.end_ms - segment.start_ms)
+            self.asr_flags.append(asr_generated)
+            tallies = self._tier_counts.get(segment.tier)
+            if tallies is None:
+                tallies = self._tier_counts[segment.tier] = [0, 0, 0, 0]
+            tallies[rank] += 1
+            tallies[3] += asr_generated
+        self.search_index.add_rows(first)
+
+    def _update_keys(self, row: int) -> None:
+        segment = self._segments[row]
+        previous = self.transcripts_lower[row]
+        self.transcripts_lower[row] = segment.transcript.lower()
+        if self.transcripts_lower[row] != previous:
+            self.search_index.update(row, previous)
+        rank = status_rank(segment_status(segment))
+        asr_generated = segment.asr_generated
+        tallies = self._tier_counts[self.tiers[row]]
+        tallies[self.ranks[row]] -= 1
+        tallies[rank] += 1
+        tallies[3] += asr_generated - self.asr_flags[row]
+        self.ranks[row] = rank
+        self.asr_flags[row] = asr_generated
+
     def update_segment(self, row: int) -> None:
-        if 0 <= row < len(self._segments):
-            index = self.index(row, 0)
-            self.dataChanged.emit(
-                index,
-                index,
-                [
-                    Qt.DisplayRole,
-                    Qt.UserRole,
-                    Qt.UserRole + 1,  # status
-                    Qt.UserRole + 2,  # status rank
-                    Qt.UserRole + 5,  # transcript
-                ],
-            )
-
-
-class SegmentFilterProxy(QSortFilterProxyModel):
+        self.update_segments((row,))
+
+    def update_segments(self, rows: Iterable[int]) -> None:
+        """Refresh edited rows, reporting each run of consecutive rows as one change."""
+        rows = sorted({row for row in rows if 0 <= row < len(self._segments)})
+        for row in rows:
+            self._update_keys(row)
+        roles = [
+            Qt.DisplayRole,
+            Qt.UserRole,
+            Qt.UserRole + 1,  # status
+            Qt.UserRole + 2,  # status rank
+            Qt.UserRole + 5,  # transcript
+        ]
+        start = 0
+        for end in range(1, len(rows) + 1):
+            if end == len(rows) or rows[end] != rows[end - 1] + 1:
+                self.dataChanged.emit(self.index(rows[start], 0), self.index(rows[end - 1], 0), roles)
+                start = end
+
+
+class SegmentFilterProxy(QAbstractProxyModel):
+    """Sorts and filters a ``SegmentListModel`` against its precomputed key columns.
+
+    Rows are ordered with Python's ``sort`` on those columns instead of a ``lessThan``
+    callback per comparison, which dominates sorting large lists through
+    ``QSortFilterProxyModel``. Like that class, ``sort`` and ``invalidate`` report a new
+    ordering with ``layoutChanged``, keeping the selection on the same segments.
+    A change to a few segments instead moves, inserts or removes just those rows.
+    """
+
     SORT_STATUS = "status"
     SORT_DURATION = "duration"
     SORT_NAME = "name"
 
+    # Larger source changes re-sort everything, which is cheaper than moving each row.
+    INCREMENTAL_LIMIT = 256
+
     def __init__(self):
         super().__init__()
         self._filter_text = ""
+        self._substring_search = False
+        self._query: SearchQuery | None = None
         self._filter_tier = "All"
         self._filter_status = "All"
         self._sort_mode = self.SORT_STATUS
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        # Source rows in ascending order; descending order reads them back to front.
+        self._rows = array("i")
+        self._positions = array("i")
+        self._persistent = []
+        self._persistent_rows: list[int] = []
+
+    def setSourceModel(self, model):
+        self.beginResetModel()
+        previous = self.sourceModel()
+        if previous is not None:
+            for signal, slot in self._source_connections(previous):
+                signal.disconnect(slot)
+        super().setSourceModel(model)
+        if model is not None:
+            for signal, slot in self._source_connections(model):
+                signal.connect(slot)
+        self._rebuild()
+        self.endResetModel()
+
+    def _source_connections(self, model):
+        return (
+            (model.modelAboutToBeReset, self._on_source_about_to_reset),
+            (model.modelReset, self._on_source_reset),
+            (model.rowsAboutToBeRemoved, self._on_source_about_to_reset),
+            (model.rowsRemoved, self._on_source_reset),
+            (model.rowsInserted, self._on_source_rows_inserted),
+            (model.dataChanged, self._on_source_data_changed),
+        )
 
     def set_filter_text(self, text: str) -> None:
-        self._filter_text = text.strip().lower()
+        """Filter by a search query (see ``SearchQuery``); raises ``re.error`` for a bad regex."""
+        self._query = parse_query(text, self._substring_search)
+        self._filter_text = text
         self.invalidateFilter()
 
+    def set_substring_search(self, enabled: bool) -> None:
+        """Match the search text as a plain substring of the name or transcript."""
+        self._substring_search = enabled
+        self.set_filter_text(self._filter_text)
+
     def set_filter_tier(self, tier: str) -> None:
         self._filter_tier = tier
         self.invalidateFilter()
@@ -111,42 +273,230 @@ class SegmentFilterProxy(QSortFilterProxyModel):
         self._sort_mode = mode
         self.invalidate()
 
-    def filterAcceptsRow(self, source_row, source_parent):
-        model = self.sourceModel()
-        segment = model.segment_at(source_row)
-
-        if self._filter_tier != "All" and segment.tier != self._filter_tier:
-            return False
-
-        status = segment_status(segment)
-        if self._filter_status != "All" and status != self._filter_status:
-            return False
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        self._begin_layout_change()
+        self._sort_column = column
+        self._sort_order = order
+        self._rebuild()
+        self._end_layout_change()
 
-        if self._filter_text:
-            name = Path(segment.path).name.lower()
-            transcript = segment.transcript.lower()
-            if self._filter_text not in name and self._filter_text not in transcript:
-                return False
+    def invalidate(self) -> None:
+        self._begin_layout_change()
+        self._rebuild()
+        self._end_layout_change()
 
-        return True
+    def invalidateFilter(self) -> None:
+        self.invalidate()
 
-    def lessThan(self, left, right):
+    def filter_accepts_row(self, source_row: int) -> bool:
+        return bool(self._filter_rows((source_row,)))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        if parent.isValid() or not 0 <= row < len(self._rows) or column != 0:
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        if index is None:
+            return super().parent()
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self._source_row(proxy_index.row()), 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid() or source_index.row() >= len(self._positions):
+            return QModelIndex()
+        position = self._positions[source_index.row()]
+        if position < 0:
+            return QModelIndex()
+        return self.createIndex(self._proxy_row(position), 0)
+
+    def _source_row(self, proxy_row: int) -> int:
+        if self._sort_order == Qt.DescendingOrder:
+            proxy_row = len(self._rows) - 1 - proxy_row
+        return self._rows[proxy_row]
+
+    def _proxy_row(self, position: int) -> int:
+        if self._sort_order == Qt.DescendingOrder:
+            return len(self._rows) - 1 - position
+        return position
+
+    def _filter_rows(self, rows: Iterable[int]) -> list[int]:
+        model = self.sourceModel()
+        rows = list(rows)
+        if self._filter_tier != "All":
+            tiers = model.tiers
+            rows = [row for row in rows if tiers[row] == self._filter_tier]
+        if self._filter_status != "All":
+            ranks = model.ranks
+            rank = status_rank(self._filter_status)
+            rows = [row for row in rows if ranks[row] == rank]
+        if self._query is not None:
+            index = model.search_index
+            if len(rows) > self.INCREMENTAL_LIMIT:
+                found = index.search(self._query)
+                rows = [row for row in rows if row in found]
+            else:
+                rows = [row for row in rows if index.matches(self._query, row)]
+        return rows
+
+    def _sort_keys(self):
         model = self.sourceModel()
-        left_segment = model.segment_at(left.row())
-        right_segment = model.segment_at(right.row())
-
         if self._sort_mode == self.SORT_DURATION:
-            left_value = left_segment.end_ms - left_segment.start_ms
-            right_value = right_segment.end_ms - right_segment.start_ms
-        elif self._sort_mode == self.SORT_NAME:
-            left_value = Path(left_segment.path).name
-            right_value = Path(right_segment.path).name
-        else:
-            left_value = status_rank(segment_status(left_segment))
-            right_value = status_rank(segment_status(right_segment))
+            return model.durations
+        if self._sort_mode == self.SORT_NAME:
+            return model.names
+        return model.ranks
+
+    def _sort_key(self):
+        if self._sort_column < 0:
+            return lambda row: row
+        keys = self._sort_keys()
+        names = self.sourceModel().names
+        return lambda row: (keys[row], names[row])
+
+    def _sort_rows(self, rows: list[int]) -> list[int]:
+        if self._sort_column < 0:
+            return rows
+        model = self.sourceModel()
+        # Two stable passes give (key, name) order without building a tuple per row.
+        rows.sort(key=model.names.__getitem__)
+        keys = self._sort_keys()
+        if keys is not model.names:
+            rows.sort(key=keys.__getitem__)
+        return rows
+
+    def _rebuild(self) -> None:
+        model = self.sourceModel()
+        count = model.rowCount() if model is not None else 0
+        rows = self._sort_rows(self._filter_rows(range(count))) if count else []
+        self._rows = array("i", rows)
+        self._positions = array("i", [-1]) * count
+        self._update_positions(0)
+
+    def _update_positions(self, start: int, end: int | None = None) -> None:
+        positions = self._positions
+        rows = self._rows
+        for position in range(start, len(rows) if end is None else end):
+            positions[rows[position]] = position
+
+    def _begin_layout_change(self) -> None:
+        self.layoutAboutToBeChanged.emit()
+        self._persistent = self.persistentIndexList()
+        self._persistent_rows = [self._source_row(index.row()) for index in self._persistent]
+
+    def _end_layout_change(self) -> None:
+        model = self.sourceModel()
+        self.changePersistentIndexList(
+            self._persistent,
+            [self.mapFromSource(model.index(row, 0)) for row in self._persistent_rows],
+        )
+        self._persistent = []
+        self._persistent_rows = []
+        self.layoutChanged.emit()
+
+    def _on_source_about_to_reset(self, *_):
+        self.beginResetModel()
 
-        if left_value == right_value:
-            left_value = Path(left_segment.path).name
-            right_value = Path(right_segment.path).name
+    def _on_source_reset(self, *_):
+        self._rebuild()
+        self.endResetModel()
 
-        return left_value < right_value
+    def _on_source_rows_inserted(self, parent, first, last):
+        self._positions.extend(array("i", [-1]) * (last - first + 1))
+        added = self._sort_rows(self._filter_rows(range(first, last + 1)))
+        if not added:
+            return
+        key = self._sort_key()
+        insert_at = [bisect_right(self._rows, key(row), key=key) for row in added]
+
+        if insert_at[0] == len(self._rows) and self._sort_order == Qt.AscendingOrder:
+            # Everything sorts after the current rows, the usual case while a list fills.
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            self._rows.extend(added)
+            self._update_positions(start)
+            self.endInsertRows()
+            return
+
+        self._begin_layout_change()
+        rows = self._rows
+        merged = array("i")
+        previous = 0
+        for position, row in zip(insert_at, added):
+            merged.extend(rows[previous:position])
+            merged.append(row)
+            previous = position
+        merged.extend(rows[previous:])
+        self._rows = merged
+        self._update_positions(insert_at[0])
+        self._end_layout_change()
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()):
+        first = top_left.row()
+        last = bottom_right.row()
+        if last - first >= self.INCREMENTAL_LIMIT:
+            self.invalidate()
+            return
+        for row in range(first, last + 1):
+            self._update_row(row, list(roles))
+
+    def _update_row(self, source_row: int, roles: list) -> None:
+        rows = self._rows
+        position = self._positions[source_row]
+        accepted = self.filter_accepts_row(source_row)
+        if position < 0:
+            if accepted:
+                self._insert_row(source_row)
+            return
+        if not accepted:
+            proxy_row = self._proxy_row(position)
+            self.beginRemoveRows(QModelIndex(), proxy_row, proxy_row)
+            del rows[position]
+            self._positions[source_row] = -1
+            self._update_positions(position)
+            self.endRemoveRows()
+            return
+
+        key = self._sort_key()
+        value = key(source_row)
+        in_order = (position == 0 or key(rows[position - 1]) <= value) and (
+            position == len(rows) - 1 or value <= key(rows[position + 1])
+        )
+        if in_order:
+            index = self.index(self._proxy_row(position), 0)
+            self.dataChanged.emit(index, index, roles)
+            return
+
+        if position + 1 < len(rows) and value > key(rows[position + 1]):
+            # Index the row will have once it is taken out of its current place.
+            target = bisect_right(rows, value, position + 1, key=key) - 1
+        else:
+            target = bisect_right(rows, value, 0, position, key=key)
+        old_row = self._proxy_row(position)
+        new_row = self._proxy_row(target)
+        self.beginMoveRows(QModelIndex(), old_row, old_row, QModelIndex(), new_row + 1 if new_row > old_row else new_row)
+        del rows[position]
+        rows.insert(target, source_row)
+        self._update_positions(min(position, target), max(position, target) + 1)
+        self.endMoveRows()
+        index = self.index(new_row, 0)
+        self.dataChanged.emit(index, index, roles)
+
+    def _insert_row(self, source_row: int) -> None:
+        key = self._sort_key()
+        position = bisect_right(self._rows, key(source_row), key=key)
+        proxy_row = len(self._rows) - position if self._sort_order == Qt.DescendingOrder else position
+        self.beginInsertRows(QModelIndex(), proxy_row, proxy_row)
+        self._rows.insert(position, source_row)
+        self._update_positions(position)
+        self.endInsertRows()
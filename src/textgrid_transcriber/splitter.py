@@ -3,12 +3,42 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import time
+import wave
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from math import ceil, floor
 from pathlib import Path
 
-from textgrid import TextGrid
+from textgrid_transcriber.cache import NormalizationCache
+from textgrid_transcriber.project import Segment, SplitPlan
+from textgrid_transcriber.textgrid_parser import iter_labeled_tiers
+from textgrid_transcriber.wav import PcmWav, write_wav
 
-from textgrid_transcriber.project import Segment
+SPLIT_ENGINE_NATIVE = "native"
+SPLIT_ENGINE_FFMPEG = "ffmpeg"
+SPLIT_ENGINE_MULTI_OUTPUT = "multi-output"
+SPLIT_ENGINE_STREAMING = "streaming"
+SPLIT_ENGINES = (
+    SPLIT_ENGINE_NATIVE,
+    SPLIT_ENGINE_FFMPEG,
+    SPLIT_ENGINE_MULTI_OUTPUT,
+    SPLIT_ENGINE_STREAMING,
+)
+
+_NORMALIZE_PARAMS = {"codec": "pcm_s16le", "channels": 1, "sample_rate": 16000}
+
+# Streamed splits hand segments to the UI in batches of at most this size / age.
+_SEGMENT_BATCH_SIZE = 50
+_SEGMENT_BATCH_SECONDS = 0.5
+_STREAM_CHUNK_BYTES = 64 * 1024
+# Streamed intervals longer than this are read back from the working WAV when cut
+# instead of holding all the audio since their start in memory.
+_STREAM_BUFFER_MAX_MS = 5 * 60 * 1000
+
+# Windows caps a command line at 32,767 characters; stay well below it.
+_MAX_COMMAND_CHARS = 30000
+_MULTI_OUTPUT_CHARS_PER_SEGMENT = 96
 
 
 def _sanitize_label(label: str) -> str:
@@ -16,6 +46,47 @@ def _sanitize_label(label: str) -> str:
     return cleaned or "tier"
 
 
+class SplitError(RuntimeError):
+    pass
+
+
+@dataclass
+class SplitDiff:
+    unchanged: int = 0
+    relabeled: int = 0
+    retimed: int = 0
+    added: int = 0
+    removed: int = 0
+    renamed: int = 0
+    recut: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.added} added, {self.retimed} retimed, {self.removed} removed, "
+            f"{self.relabeled} relabeled, {self.unchanged} unchanged ({self.recut} re-cut)"
+        )
+
+
+def resolve_split_engine() -> str:
+    engine = os.getenv("TEXTGRID_SPLIT_ENGINE", "").strip().lower()
+    return engine if engine in SPLIT_ENGINES else SPLIT_ENGINE_NATIVE
+
+
+def resolve_split_workers() -> int:
+    value = os.getenv("TEXTGRID_SPLIT_WORKERS", "").strip()
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return os.cpu_count() or 1
+
+
+def _partial_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.part")
+
+
+def _backup_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.bak")
+
+
 def _run_ffmpeg(args: list[str]) -> None:
     kwargs = {}
     if os.name == "nt":
@@ -23,94 +94,657 @@ def _run_ffmpeg(args: list[str]) -> None:
     subprocess.run(args, check=True, **kwargs)
 
 
-def split_audio_with_ffmpeg(
+def _normalize_audio(
     ffmpeg_path: Path,
     audio_path: Path,
-    textgrid_path: Path,
-    output_dir: Path,
-    progress_cb=None,
-) -> tuple[Path, list[Segment]]:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    wav_path = output_dir / f"{audio_path.stem}.wav"
+    wav_path: Path,
+    cache: NormalizationCache | None = None,
+) -> None:
+    key = None
+    if cache is not None:
+        key = cache.key(ffmpeg_path, audio_path, _NORMALIZE_PARAMS)
+        if cache.fetch(key, wav_path):
+            return
+
+    # Always write a fresh file: wav_path may be a hard link into the cache.
+    partial_path = _partial_path(wav_path)
+    try:
+        _run_ffmpeg(
+            [
+                str(ffmpeg_path),
+                "-y",
+                "-i",
+                str(audio_path),
+                "-acodec",
+                _NORMALIZE_PARAMS["codec"],
+                "-ac",
+                str(_NORMALIZE_PARAMS["channels"]),
+                "-ar",
+                str(_NORMALIZE_PARAMS["sample_rate"]),
+                "-f",
+                "wav",
+                str(partial_path),
+            ]
+        )
+        os.replace(partial_path, wav_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+    if cache is not None:
+        cache.store(key, wav_path)
+
+
+def _labeled_intervals_by_tier(textgrid_path: Path, tiers: list[str] | None = None) -> list:
+    return [(tier_name, list(intervals)) for tier_name, intervals in iter_labeled_tiers(textgrid_path, tiers)]
+
 
+def _plan_matcher(plan: SplitPlan):
+    pattern = re.compile(plan.mark_pattern) if plan.mark_pattern else None
+
+    def matches(segment: Segment) -> bool:
+        duration_ms = segment.end_ms - segment.start_ms
+        if duration_ms < plan.min_duration_ms:
+            return False
+        if plan.max_duration_ms and duration_ms > plan.max_duration_ms:
+            return False
+        return pattern is None or pattern.search(segment.mark) is not None
+
+    return matches
+
+
+def _planned_segments(textgrid_path: Path, output_dir: Path, plan: SplitPlan | None) -> list[Segment]:
+    plan = plan or SplitPlan()
+    # Number against every labeled interval of a tier so file names don't shift when the plan changes.
+    segments = _plan_segments(_labeled_intervals_by_tier(textgrid_path, plan.tiers or None), output_dir)
+    matches = _plan_matcher(plan)
+    return [segment for segment in segments if matches(segment)]
+
+
+def _cut_with_ffmpeg(ffmpeg_path: Path, wav_path: Path, start_ms: int, end_ms: int, output_path: Path) -> None:
     _run_ffmpeg(
         [
             str(ffmpeg_path),
             "-y",
+            "-ss",
+            f"{start_ms / 1000:.3f}",
+            "-to",
+            f"{end_ms / 1000:.3f}",
             "-i",
-            str(audio_path),
+            str(wav_path),
             "-acodec",
             "pcm_s16le",
             "-ac",
             "1",
             "-ar",
             "16000",
-            str(wav_path),
+            "-f",
+            "wav",
+            str(output_path),
         ]
     )
 
-    tg = TextGrid()
-    tg.read(textgrid_path)
 
-    labeled_intervals_by_tier = []
-    for tier in tg.tiers:
-        labeled_intervals = [
-            interval
-            for interval in tier
-            if (getattr(interval, "mark", "") or "").strip()
-        ]
-        labeled_intervals_by_tier.append((tier, labeled_intervals))
-
-    total = sum(len(intervals) for _, intervals in labeled_intervals_by_tier)
-    completed = 0
+def _plan_segments(labeled_intervals_by_tier: list, output_dir: Path) -> list[Segment]:
     segments: list[Segment] = []
-
-    for tier, labeled_intervals in labeled_intervals_by_tier:
-        tier_dir = output_dir / _sanitize_label(tier.name)
-        tier_dir.mkdir(parents=True, exist_ok=True)
+    for tier_name, labeled_intervals in labeled_intervals_by_tier:
+        tier_dir = output_dir / _sanitize_label(tier_name)
         padding = max(1, len(str(len(labeled_intervals))))
 
         for index, interval in enumerate(labeled_intervals, start=1):
-            start_ms = int(floor(interval.minTime * 1000))
-            end_ms = int(ceil(interval.maxTime * 1000))
-            output_name = f"{tier.name}_{index:0{padding}d}_{start_ms}_{end_ms}.wav"
-            output_path = tier_dir / output_name
-            mark = (getattr(interval, "mark", "") or "").strip()
-
-            _run_ffmpeg(
-                [
-                    str(ffmpeg_path),
-                    "-y",
-                    "-ss",
-                    f"{start_ms / 1000:.3f}",
-                    "-to",
-                    f"{end_ms / 1000:.3f}",
-                    "-i",
-                    str(wav_path),
-                    "-acodec",
-                    "pcm_s16le",
-                    "-ac",
-                    "1",
-                    "-ar",
-                    "16000",
-                    str(output_path),
-                ]
-            )
+            start_ms = int(floor(interval.min_time * 1000))
+            end_ms = int(ceil(interval.max_time * 1000))
+            output_name = f"{tier_name}_{index:0{padding}d}_{start_ms}_{end_ms}.wav"
             segments.append(
                 Segment(
-                    tier=str(tier.name),
+                    tier=tier_name,
                     index=index,
                     start_ms=start_ms,
                     end_ms=end_ms,
-                    path=str(output_path),
-                    mark=mark,
+                    path=str(tier_dir / output_name),
+                    mark=interval.mark.strip(),
                     transcript="",
                     asr_generated=False,
                     verified=False,
                 )
             )
-            completed += 1
-            if progress_cb:
-                progress_cb(completed, total, output_path)
+    return segments
+
+
+def _multi_output_batches(ffmpeg_path: Path, audio_path: Path, segments: list[Segment]):
+    """Group segments (sorted by start) into ffmpeg invocations that stay under the command limit."""
+    ordered = sorted(segments, key=lambda segment: (segment.start_ms, segment.end_ms))
+    base_chars = len(str(ffmpeg_path)) + len(str(audio_path)) + 64
+    batch: list[Segment] = []
+    batch_chars = base_chars
+    for segment in ordered:
+        segment_chars = len(segment.path) + _MULTI_OUTPUT_CHARS_PER_SEGMENT
+        if batch and batch_chars + segment_chars > _MAX_COMMAND_CHARS:
+            yield batch
+            batch = []
+            batch_chars = base_chars
+        batch.append(segment)
+        batch_chars += segment_chars
+    if batch:
+        yield batch
+
+
+def _cut_batch_with_ffmpeg(ffmpeg_path: Path, audio_path: Path, batch: list[Segment]) -> None:
+    # Seek the input once to the earliest interval; every output then trims its own
+    # range from the single decoded stream, so the source is read front to back once.
+    batch_start_ms = batch[0].start_ms
+    args = [
+        str(ffmpeg_path),
+        "-y",
+        "-ss",
+        f"{batch_start_ms / 1000:.3f}",
+        "-i",
+        str(audio_path),
+    ]
+    for segment in batch:
+        args += [
+            "-map",
+            "0:a:0",
+            "-ss",
+            f"{(segment.start_ms - batch_start_ms) / 1000:.3f}",
+            "-to",
+            f"{(segment.end_ms - batch_start_ms) / 1000:.3f}",
+            "-acodec",
+            "pcm_s16le",
+            "-ac",
+            "1",
+            "-ar",
+            "16000",
+            "-f",
+            "wav",
+            str(_partial_path(Path(segment.path))),
+        ]
+    _run_ffmpeg(args)
+
+
+def _write_segments(segments: list[Segment], write) -> None:
+    """Run ``write`` against ``.part`` files and publish them only once all succeeded."""
+    partial_paths = [_partial_path(Path(segment.path)) for segment in segments]
+    try:
+        write()
+        for segment, partial_path in zip(segments, partial_paths):
+            os.replace(partial_path, segment.path)
+    except BaseException as exc:
+        for partial_path in partial_paths:
+            partial_path.unlink(missing_ok=True)
+        names = ", ".join(Path(segment.path).name for segment in segments[:3])
+        if len(segments) > 3:
+            names += f" (+{len(segments) - 3} more)"
+        raise SplitError(f"Failed to cut {names}: {exc}") from exc
+
+
+def _run_jobs(jobs: list[tuple[list[Segment], object]], workers: int, report) -> None:
+    for tier_dir in {Path(segment.path).parent for job_segments, _ in jobs for segment in job_segments}:
+        tier_dir.mkdir(parents=True, exist_ok=True)
+
+    if workers <= 1 or len(jobs) <= 1:
+        for job_segments, write in jobs:
+            _write_segments(job_segments, write)
+            for segment in job_segments:
+                report(segment)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="split") as pool:
+        futures = [pool.submit(_write_segments, job_segments, write) for job_segments, write in jobs]
+        pending = set(futures)
+        # Jobs are reported in plan order, each as soon as it and every job before it finished.
+        next_position = 0
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                while next_position < len(futures) and futures[next_position].done():
+                    for segment in jobs[next_position][0]:
+                        report(segment)
+                    next_position += 1
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+class _Reporter:
+    """Counts finished segments for ``progress_cb`` and hands them to ``segments_cb`` in batches."""
+
+    def __init__(self, total: int, progress_cb=None, segments_cb=None):
+        self.total = total
+        self.completed = 0
+        self.progress_cb = progress_cb
+        self.segments_cb = segments_cb
+        self._batch: list[Segment] = []
+        self._last_flush = time.monotonic()
+
+    def __call__(self, segment: Segment) -> None:
+        self.completed += 1
+        if self.progress_cb:
+            self.progress_cb(self.completed, self.total, Path(segment.path))
+        if self.segments_cb:
+            self._batch.append(segment)
+            if (
+                len(self._batch) >= _SEGMENT_BATCH_SIZE
+                or time.monotonic() - self._last_flush >= _SEGMENT_BATCH_SECONDS
+            ):
+                self.flush()
+
+    def flush(self) -> None:
+        if self._batch:
+            self.segments_cb(self._batch)
+            self._batch = []
+        self._last_flush = time.monotonic()
+
+
+def _stream_split(ffmpeg_path: Path, audio_path: Path, wav_path: Path, segments: list[Segment], report) -> None:
+    """Decode once to a PCM pipe, cutting each interval as soon as its last sample arrives.
+
+    The decoded stream is also written to ``wav_path`` so the working WAV exists afterwards.
+    Only audio from the earliest interval that is still waiting to be cut is kept in memory;
+    intervals longer than ``_STREAM_BUFFER_MAX_MS`` are copied from the working WAV instead.
+    """
+    sample_rate = _NORMALIZE_PARAMS["sample_rate"]
+    frame_bytes = 2
+    by_end = sorted(segments, key=lambda segment: (segment.end_ms, segment.start_ms))
+    by_start = sorted(segments, key=lambda segment: segment.start_ms)
+    cut_ids: set[int] = set()
+    from_disk = {id(segment) for segment in segments if segment.end_ms - segment.start_ms > _STREAM_BUFFER_MAX_MS}
+    for tier_dir in {Path(segment.path).parent for segment in segments}:
+        tier_dir.mkdir(parents=True, exist_ok=True)
+
+    buffer = bytearray()
+    buffer_start = 0
+    received = 0
+
+    def cut(segment: Segment) -> None:
+        end = min((segment.end_ms * sample_rate) // 1000, received)
+        start = min((segment.start_ms * sample_rate) // 1000, end)
+        if id(segment) in from_disk:
+            working_file.flush()
+            _write_segments(
+                [segment],
+                lambda: _copy_pcm_to_wav(
+                    partial_wav,
+                    data_offset + start * frame_bytes,
+                    (end - start) * frame_bytes,
+                    _partial_path(Path(segment.path)),
+                    sample_rate,
+                ),
+            )
+        else:
+            pcm = memoryview(buffer)[(start - buffer_start) * frame_bytes : (end - buffer_start) * frame_bytes]
+            try:
+                _write_segments(
+                    [segment],
+                    lambda: write_wav(_partial_path(Path(segment.path)), pcm, sample_rate),
+                )
+            finally:
+                pcm.release()
+        cut_ids.add(id(segment))
+        report(segment)
+
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    process = subprocess.Popen(
+        [
+            str(ffmpeg_path),
+            "-i",
+            str(audio_path),
+            "-acodec",
+            _NORMALIZE_PARAMS["codec"],
+            "-ac",
+            str(_NORMALIZE_PARAMS["channels"]),
+            "-ar",
+            str(sample_rate),
+            "-f",
+            "s16le",
+            "pipe:1",
+        ],
+        stdout=subprocess.PIPE,
+        **kwargs,
+    )
+    partial_wav = _partial_path(wav_path)
+    try:
+        next_end = 0
+        start_cursor = 0
+        with open(partial_wav, "wb") as working_file, wave.open(working_file, "wb") as working:
+            working.setnchannels(_NORMALIZE_PARAMS["channels"])
+            working.setsampwidth(frame_bytes)
+            working.setframerate(sample_rate)
+            # Writing no frames writes the header, so the audio starts at the current offset.
+            working.writeframes(b"")
+            data_offset = working_file.tell()
+            while True:
+                chunk = process.stdout.read(_STREAM_CHUNK_BYTES)
+                if not chunk:
+                    break
+                working.writeframes(chunk)
+                buffer += chunk
+                received = buffer_start + (len(buffer) // frame_bytes)
+
+                while next_end < len(by_end) and (by_end[next_end].end_ms * sample_rate) // 1000 <= received:
+                    cut(by_end[next_end])
+                    next_end += 1
+
+                while start_cursor < len(by_start) and (
+                    id(by_start[start_cursor]) in cut_ids or id(by_start[start_cursor]) in from_disk
+                ):
+                    start_cursor += 1
+                if start_cursor < len(by_start):
+                    keep_from = min((by_start[start_cursor].start_ms * sample_rate) // 1000, received)
+                else:
+                    keep_from = received
+                if keep_from > buffer_start:
+                    del buffer[: (keep_from - buffer_start) * frame_bytes]
+                    buffer_start = keep_from
+
+            # Intervals running past the end of the audio get whatever was decoded.
+            for segment in by_end[next_end:]:
+                cut(segment)
+        if process.wait() != 0:
+            raise SplitError(f"ffmpeg exited with status {process.returncode} while decoding {audio_path.name}")
+        os.replace(partial_wav, wav_path)
+    except BaseException:
+        process.kill()
+        process.wait()
+        partial_wav.unlink(missing_ok=True)
+        raise
+    finally:
+        process.stdout.close()
+
+
+def _copy_pcm_to_wav(source: Path, offset: int, size: int, output: Path, sample_rate: int) -> None:
+    """Write ``size`` bytes of 16-bit mono PCM from ``offset`` in ``source`` as a WAV, a chunk at a time."""
+    with open(source, "rb") as reader, wave.open(str(output), "wb") as writer:
+        writer.setnchannels(_NORMALIZE_PARAMS["channels"])
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        reader.seek(offset)
+        while size > 0:
+            chunk = reader.read(min(size, _STREAM_CHUNK_BYTES))
+            if not chunk:
+                break
+            writer.writeframes(chunk)
+            size -= len(chunk)
+
+
+def _write_from_working_wav(wav_path: Path, segments: list[Segment], workers: int, report) -> None:
+    with PcmWav(wav_path) as source:
+
+        def write_native(segment: Segment) -> None:
+            pcm = source.frames_for_ms(segment.start_ms, segment.end_ms)
+            try:
+                write_wav(
+                    _partial_path(Path(segment.path)),
+                    pcm,
+                    source.sample_rate,
+                    source.channels,
+                    source.sample_width,
+                )
+            finally:
+                pcm.release()
+
+        jobs = [([segment], lambda segment=segment: write_native(segment)) for segment in segments]
+        _run_jobs(jobs, workers, report)
+
+
+def working_wav_path(audio_path: Path, output_dir: Path) -> Path:
+    return output_dir / f"{audio_path.stem}.wav"
+
+
+def export_segments(
+    wav_path: Path,
+    segments: list[Segment],
+    progress_cb=None,
+    workers: int = 1,
+) -> None:
+    """Write the file for each segment from the working WAV, e.g. to materialize a virtual split."""
+    _write_from_working_wav(wav_path, segments, workers, _Reporter(len(segments), progress_cb))
+
+
+def split_audio_with_ffmpeg(
+    ffmpeg_path: Path,
+    audio_path: Path,
+    textgrid_path: Path,
+    output_dir: Path,
+    progress_cb=None,
+    engine: str = SPLIT_ENGINE_NATIVE,
+    workers: int = 1,
+    virtual: bool = False,
+    normalization_cache: NormalizationCache | None = None,
+    segments_cb=None,
+    plan: SplitPlan | None = None,
+) -> tuple[Path, list[Segment]]:
+    """Cut one 16 kHz mono WAV per labeled interval of every tier in ``textgrid_path``.
+
+    ``engine`` selects how intervals are cut: ``SPLIT_ENGINE_NATIVE`` normalizes the
+    source once and slices the memory-mapped working WAV in-process,
+    ``SPLIT_ENGINE_FFMPEG`` normalizes and then runs one ffmpeg process per interval,
+    ``SPLIT_ENGINE_MULTI_OUTPUT`` skips normalization and decodes the source in
+    a few multi-output ffmpeg invocations, and ``SPLIT_ENGINE_STREAMING`` decodes once
+    through a pipe and cuts each interval as soon as its audio has arrived. Cuts run
+    on up to ``workers`` threads; the returned segments keep TextGrid order and
+    ``progress_cb`` is always called from the calling thread with a monotonically
+    increasing count. ``segments_cb``, if given, receives finished segments in small
+    batches while the split is still running.
+
+    With ``virtual`` set, only the working WAV is written: segments keep the path their
+    file would have, and callers read their sample range from the working WAV instead.
+    A ``normalization_cache`` hit places a previous conversion of the same source at the
+    working WAV path without running ffmpeg. A ``plan`` limits the cut to the tiers,
+    labels and durations it selects; segment indices still count every labeled interval.
+    """
+    if engine not in SPLIT_ENGINES:
+        raise ValueError(f"Unknown split engine: {engine}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    segments = _planned_segments(textgrid_path, output_dir, plan)
+    report = _Reporter(len(segments), progress_cb, segments_cb)
+
+    if engine == SPLIT_ENGINE_MULTI_OUTPUT and not virtual:
+        jobs = [
+            (batch, lambda batch=batch: _cut_batch_with_ffmpeg(ffmpeg_path, audio_path, batch))
+            for batch in _multi_output_batches(ffmpeg_path, audio_path, segments)
+        ]
+        _run_jobs(jobs, workers, report)
+        report.flush()
+        return output_dir, segments
+
+    wav_path = working_wav_path(audio_path, output_dir)
+    if engine == SPLIT_ENGINE_STREAMING and not virtual:
+        key = normalization_cache.key(ffmpeg_path, audio_path, _NORMALIZE_PARAMS) if normalization_cache else None
+        if key is None or not normalization_cache.fetch(key, wav_path):
+            _stream_split(ffmpeg_path, audio_path, wav_path, segments, report)
+            if normalization_cache is not None:
+                normalization_cache.store(key, wav_path)
+            report.flush()
+            return output_dir, segments
+        # A cached working WAV is already complete, so slicing it beats re-decoding.
+    else:
+        _normalize_audio(ffmpeg_path, audio_path, wav_path, normalization_cache)
+
+    if virtual:
+        return output_dir, segments
+
+    if engine == SPLIT_ENGINE_FFMPEG:
+        jobs = [
+            (
+                [segment],
+                lambda segment=segment: _cut_with_ffmpeg(
+                    ffmpeg_path,
+                    wav_path,
+                    segment.start_ms,
+                    segment.end_ms,
+                    _partial_path(Path(segment.path)),
+                ),
+            )
+            for segment in segments
+        ]
+        _run_jobs(jobs, workers, report)
+        report.flush()
+        return output_dir, segments
 
+    _write_from_working_wav(wav_path, segments, workers, report)
+    report.flush()
     return output_dir, segments
+
+
+def _overlaps(left: Segment, right: Segment) -> bool:
+    return left.start_ms < right.end_ms and right.start_ms < left.end_ms
+
+
+def resplit_incremental(
+    ffmpeg_path: Path,
+    audio_path: Path,
+    textgrid_path: Path,
+    output_dir: Path,
+    existing: list[Segment],
+    progress_cb=None,
+    workers: int = 1,
+    virtual: bool = False,
+    normalization_cache: NormalizationCache | None = None,
+    plan: SplitPlan | None = None,
+    segments_cb=None,
+) -> tuple[Path, list[Segment], SplitDiff]:
+    """Re-split against ``existing`` segments, re-cutting only intervals whose audio changed.
+
+    Intervals with the same tier and boundaries keep their transcript, ``verified`` and
+    ``asr_generated`` flags (a changed label only updates ``mark``); their files are
+    renamed when their index shifts. An interval whose boundaries moved but still
+    overlaps a removed interval with the same label keeps that transcript as an
+    unverified draft. Everything else is cut from scratch, and files of intervals
+    that disappeared, or that ``plan`` no longer selects, are deleted.
+
+    As in ``split_audio_with_ffmpeg``, ``segments_cb`` receives segments in batches as
+    soon as their files are in place. Old files are only moved aside until the re-split
+    succeeds; if anything fails, every move is undone and the new files are removed.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    planned = _planned_segments(textgrid_path, output_dir, plan)
+    diff = SplitDiff()
+
+    by_bounds: dict[tuple[str, int, int], list[Segment]] = {}
+    for segment in existing:
+        by_bounds.setdefault((segment.tier, segment.start_ms, segment.end_ms), []).append(segment)
+
+    kept: list[tuple[Segment, Segment]] = []
+    unmatched: list[Segment] = []
+    for segment in planned:
+        previous_list = by_bounds.get((segment.tier, segment.start_ms, segment.end_ms))
+        if not previous_list:
+            unmatched.append(segment)
+            continue
+        previous = previous_list.pop(0)
+        segment.transcript = previous.transcript
+        segment.verified = previous.verified
+        segment.asr_generated = previous.asr_generated
+        if previous.mark != segment.mark:
+            diff.relabeled += 1
+        else:
+            diff.unchanged += 1
+        kept.append((previous, segment))
+
+    removed = [segment for segments in by_bounds.values() for segment in segments]
+    stale_files = [Path(segment.path) for segment in removed]
+    for segment in unmatched:
+        draft = next(
+            (
+                previous
+                for previous in removed
+                if previous.tier == segment.tier
+                and previous.mark == segment.mark
+                and previous.transcript
+                and _overlaps(previous, segment)
+            ),
+            None,
+        )
+        if draft is None:
+            diff.added += 1
+            continue
+        removed.remove(draft)
+        segment.transcript = draft.transcript
+        segment.asr_generated = draft.asr_generated
+        diff.retimed += 1
+    diff.removed = len(removed)
+
+    to_cut = list(unmatched)
+    in_place: list[Segment] = []
+    renames: list[tuple[Segment, Segment]] = []
+    if not virtual:
+        for previous, segment in kept:
+            if not Path(previous.path).exists():
+                to_cut.append(segment)
+            elif previous.path != segment.path:
+                renames.append((previous, segment))
+            else:
+                in_place.append(segment)
+
+    wav_path = working_wav_path(audio_path, output_dir)
+
+    def normalize_if_needed() -> None:
+        if not wav_path.exists() or wav_path.stat().st_mtime < Path(audio_path).stat().st_mtime:
+            _normalize_audio(ffmpeg_path, audio_path, wav_path, normalization_cache)
+
+    if virtual:
+        normalize_if_needed()
+        return output_dir, planned, diff
+
+    report = _Reporter(len(planned), progress_cb, segments_cb)
+    # (source, destination) of every move, undone in reverse if the re-split fails.
+    moves: list[tuple[Path, Path]] = []
+    created: list[Path] = []
+
+    def move(source: Path, destination: Path) -> None:
+        os.replace(source, destination)
+        moves.append((source, destination))
+
+    def set_aside(path: Path) -> None:
+        if path.exists():
+            move(path, _backup_path(path))
+
+    try:
+        for segment in in_place:
+            report(segment)
+        for stale_file in stale_files:
+            set_aside(stale_file)
+        # Two-phase rename so a file moving into a name another file is leaving never clobbers it.
+        for previous, _ in renames:
+            move(Path(previous.path), _backup_path(Path(previous.path)))
+        for previous, segment in renames:
+            destination = Path(segment.path)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            set_aside(destination)
+            move(_backup_path(Path(previous.path)), destination)
+            report(segment)
+
+        if to_cut:
+            normalize_if_needed()
+            for segment in to_cut:
+                set_aside(Path(segment.path))
+            created.extend(Path(segment.path) for segment in to_cut)
+            _write_from_working_wav(wav_path, to_cut, workers, report)
+        report.flush()
+    except BaseException:
+        # Put the previous split back: drop the new cuts, then undo the moves newest first.
+        for path in created:
+            path.unlink(missing_ok=True)
+        for source, destination in reversed(moves):
+            try:
+                os.replace(destination, source)
+            except OSError:
+                pass
+        raise
+
+    # Only now are the files set aside really gone; the re-split itself is already complete.
+    for _, destination in moves:
+        if destination.suffix == ".bak":
+            try:
+                destination.unlink(missing_ok=True)
+            except OSError:
+                pass
+    diff.renamed = len(renames)
+    diff.recut = len(to_cut)
+    return output_dir, planned, diff
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import codecs
+import mmap
+import re
+import struct
+import tempfile
+from pathlib import Path
+from typing import Collection, Iterator, NamedTuple
+
+# Matches the textgrid package, which rounds every time it reads to this many digits.
+TIME_PRECISION = 5
+
+_TEXT_TOKEN = r"""
+    (?P<string>"(?:[^"]|"")*")
+  | (?P<skip>\[[^\]]*\]|![^\n]*)
+  | (?P<flag><exists>|<absent>)
+  | (?P<number>(?<![\w.])[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+"""
+_TEXT_TOKEN_BYTES = re.compile(_TEXT_TOKEN.encode("ascii"), re.VERBOSE)
+_BINARY_MAGIC = b"ooBinaryFile"
+_TRANSCODE_CHUNK_BYTES = 1 << 20
+
+
+class TextGridParseError(ValueError):
+    pass
+
+
+class LabeledInterval(NamedTuple):
+    min_time: float
+    max_time: float
+    mark: str
+
+
+class _TextReader:
+    """Pulls values out of UTF-8 long or short text format, ignoring labels and comments."""
+
+    def __init__(self, data):
+        self._tokens = (
+            match for match in _TEXT_TOKEN_BYTES.finditer(data) if match.lastgroup != "skip"
+        )
+
+    def _next(self, kind: str):
+        try:
+            match = next(self._tokens)
+        except StopIteration:
+            raise TextGridParseError(f"Unexpected end of TextGrid while reading a {kind}.") from None
+        if match.lastgroup != kind:
+            raise TextGridParseError(f"Expected a {kind} in TextGrid, found {match.group(0)[:40]!r}.")
+        return match.group(0)
+
+    def text(self) -> str:
+        raw = self._next("string")[1:-1].decode("utf-8", errors="replace")
+        return raw.replace('""', '"')
+
+    def skip_text(self) -> None:
+        self._next("string")
+
+    def time(self) -> float:
+        return round(float(self._next("number")), TIME_PRECISION)
+
+    def count(self) -> int:
+        return int(float(self._next("number")))
+
+    def flag(self) -> bool:
+        return self._next("flag") == b"<exists>"
+
+
+class _BinaryReader:
+    """Reads Praat's ``ooBinaryFile`` layout: big-endian doubles/ints and length-prefixed strings."""
+
+    def __init__(self, data, offset: int):
+        self._data = data
+        self._offset = offset
+
+    def _take(self, size: int):
+        start = self._offset
+        end = start + size
+        if end > len(self._data):
+            raise TextGridParseError("Unexpected end of binary TextGrid.")
+        self._offset = end
+        return self._data[start:end]
+
+    def short_text(self) -> str:
+        (length,) = struct.unpack(">B", self._take(1))
+        return self._take(length).decode("ascii", errors="replace")
+
+    def text(self) -> str:
+        (length,) = struct.unpack(">H", self._take(2))
+        if length == 0xFFFF:
+            (length,) = struct.unpack(">H", self._take(2))
+            return self._take(length * 2).decode("utf-16-be", errors="replace")
+        return self._take(length).decode("latin-1")
+
+    def skip_text(self) -> None:
+        (length,) = struct.unpack(">H", self._take(2))
+        if length == 0xFFFF:
+            (length,) = struct.unpack(">H", self._take(2))
+            self._take(length * 2)
+        else:
+            self._take(length)
+
+    def time(self) -> float:
+        return round(struct.unpack(">d", self._take(8))[0], TIME_PRECISION)
+
+    def count(self) -> int:
+        return struct.unpack(">i", self._take(4))[0]
+
+    def flag(self) -> bool:
+        return self._take(1) != b"\x00"
+
+
+def _utf16_encoding(data) -> str | None:
+    """Return the codec for UTF-16 files, or None when the bytes can be scanned directly."""
+    head = bytes(data[:4])
+    if head.startswith((b"\xfe\xff", b"\xff\xfe")):
+        return "utf-16"
+    if len(head) >= 2 and head[1] == 0:
+        return "utf-16-le"
+    if len(head) >= 2 and head[0] == 0:
+        return "utf-16-be"
+    return None
+
+
+def _transcode_to_utf8(data, encoding: str):
+    """Re-encode ``data`` as UTF-8 into a mapped temporary file, a chunk at a time.
+
+    The byte tokenizer then scans it like any UTF-8 grid, without the decoded text of
+    the whole file in memory.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with tempfile.TemporaryFile() as handle:
+        for start in range(0, len(data), _TRANSCODE_CHUNK_BYTES):
+            handle.write(decoder.decode(data[start : start + _TRANSCODE_CHUNK_BYTES]).encode("utf-8"))
+        handle.write(decoder.decode(b"", final=True).encode("utf-8"))
+        handle.flush()
+        if handle.tell() == 0:
+            raise TextGridParseError("The TextGrid file is empty.")
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _open_reader(data):
+    if bytes(data[: len(_BINARY_MAGIC)]) == _BINARY_MAGIC:
+        reader = _BinaryReader(data, len(_BINARY_MAGIC))
+        object_class = reader.short_text()
+    else:
+        encoding = _utf16_encoding(data)
+        if encoding is not None:
+            data = _transcode_to_utf8(data, encoding)
+        offset = 3 if bytes(data[:3]) == b"\xef\xbb\xbf" else 0
+        reader = _TextReader(memoryview(data)[offset:] if offset else data)
+        file_type = reader.text()
+        if not file_type.startswith("ooTextFile"):
+            raise TextGridParseError("The file is not a Praat text or binary file.")
+        object_class = reader.text()
+    if object_class != "TextGrid":
+        raise TextGridParseError(f"Expected a TextGrid, found {object_class!r}.")
+
+    reader.time()  # xmin
+    reader.time()  # xmax
+    if not reader.flag():
+        return reader, 0
+    return reader, reader.count()
+
+
+def _read_tier_header(reader) -> tuple[str, str, int]:
+    tier_class = reader.short_text() if isinstance(reader, _BinaryReader) else reader.text()
+    name = reader.text()
+    reader.time()  # xmin
+    reader.time()  # xmax
+    return tier_class, name, reader.count()
+
+
+def _intervals(reader, size: int, keep: bool) -> Iterator[LabeledInterval]:
+    for _ in range(size):
+        min_time = reader.time()
+        max_time = reader.time()
+        if not keep:
+            reader.skip_text()
+            continue
+        mark = reader.text()
+        # The textgrid package drops empty-width intervals; do the same for parity.
+        if mark.strip() and min_time < max_time:
+            yield LabeledInterval(min_time, max_time, mark)
+
+
+def _skip_points(reader, size: int) -> None:
+    for _ in range(size):
+        reader.time()
+        reader.skip_text()
+
+
+def _map_file(textgrid_path: Path):
+    with open(textgrid_path, "rb") as handle:
+        if Path(textgrid_path).stat().st_size == 0:
+            raise TextGridParseError("The TextGrid file is empty.")
+        # The mapping outlives the handle and is released once the last reader drops it.
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_labeled_tiers(
+    textgrid_path: Path,
+    tiers: Collection[str] | None = None,
+) -> Iterator[tuple[str, Iterator[LabeledInterval]]]:
+    """Yield ``(tier name, labeled intervals)`` for each interval tier, reading lazily.
+
+    Handles Praat's long and short text formats (UTF-8 or UTF-16) and its binary format.
+    Each tier's intervals are produced on demand and must be consumed before moving to
+    the next tier; whatever is left is skipped. Point tiers, and interval tiers not named
+    in ``tiers`` (when given), are skipped without building any intervals.
+    """
+    reader, tier_count = _open_reader(_map_file(textgrid_path))
+    for _ in range(tier_count):
+        tier_class, name, size = _read_tier_header(reader)
+        if tier_class != "IntervalTier":
+            _skip_points(reader, size)
+            continue
+        keep = tiers is None or name in tiers
+        intervals = _intervals(reader, size, keep)
+        if keep:
+            yield name, intervals
+        for _ in intervals:
+            pass
+
+
+def read_tier_names(textgrid_path: Path) -> list[str]:
+    """Return the interval tier names in file order without building any intervals."""
+    reader, tier_count = _open_reader(_map_file(textgrid_path))
+    names = []
+    for _ in range(tier_count):
+        tier_class, name, size = _read_tier_header(reader)
+        if tier_class == "IntervalTier":
+            names.append(name)
+            for _ in _intervals(reader, size, keep=False):
+                pass
+        else:
+            _skip_points(reader, size)
+    return names
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import mmap
+import struct
+import wave
+from pathlib import Path
+from typing import Iterator
+
+
+class WavFormatError(ValueError):
+    pass
+
+
+def _find_chunks(handle, file_size: int) -> tuple[bytes, int, int]:
+    header = handle.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        raise WavFormatError("Not a RIFF/WAVE file.")
+
+    fmt_chunk = b""
+    offset = 12
+    while offset + 8 <= file_size:
+        handle.seek(offset)
+        chunk_id, chunk_size = struct.unpack("<4sI", handle.read(8))
+        body_offset = offset + 8
+        if chunk_id == b"fmt ":
+            fmt_chunk = handle.read(chunk_size)
+        elif chunk_id == b"data":
+            if not fmt_chunk:
+                raise WavFormatError("WAV data chunk appears before its fmt chunk.")
+            # Streamed writers may leave a placeholder size; trust the file length instead.
+            data_size = min(chunk_size, file_size - body_offset)
+            return fmt_chunk, body_offset, data_size
+        offset = body_offset + chunk_size + (chunk_size & 1)
+    raise WavFormatError("WAV file has no data chunk.")
+
+
+class PcmWav:
+    """Memory-mapped, read-only view over the PCM payload of a WAV file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            file_size = self.path.stat().st_size
+            fmt_chunk, self.data_offset, self.data_size = _find_chunks(self._file, file_size)
+            audio_format, channels, sample_rate, _, block_align, bits = struct.unpack(
+                "<HHIIHH", fmt_chunk[:16]
+            )
+            if audio_format not in (1, 0xFFFE):
+                raise WavFormatError("Only integer PCM WAV files are supported.")
+            self.channels = channels
+            self.sample_rate = sample_rate
+            self.sample_width = bits // 8
+            self.block_align = block_align
+            self.frame_count = self.data_size // block_align
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if file_size else None
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+
+    def frames(self, start_frame: int, end_frame: int) -> memoryview:
+        start_frame = max(0, min(start_frame, self.frame_count))
+        end_frame = max(start_frame, min(end_frame, self.frame_count))
+        start = self.data_offset + (start_frame * self.block_align)
+        end = self.data_offset + (end_frame * self.block_align)
+        return self._view[start:end]
+
+    def frames_for_ms(self, start_ms: int, end_ms: int) -> memoryview:
+        return self.frames(
+            (start_ms * self.sample_rate) // 1000,
+            (end_ms * self.sample_rate) // 1000,
+        )
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> PcmWav:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def wav_header(data_size: int, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    block_align = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+def read_pcm(path: Path) -> bytes:
+    with wave.open(str(path), "rb") as wav_file:
+        return wav_file.readframes(wav_file.getnframes())
+
+
+def iter_pcm(path: Path, chunk_frames: int) -> Iterator[bytes]:
+    """Yield the PCM of a WAV file ``chunk_frames`` frames at a time, never holding all of it."""
+    with wave.open(str(path), "rb") as wav_file:
+        while True:
+            data = wav_file.readframes(chunk_frames)
+            if not data:
+                return
+            yield data
+
+
+def wav_duration_ms(path: Path) -> int:
+    with wave.open(str(path), "rb") as wav_file:
+        return wav_file.getnframes() * 1000 // wav_file.getframerate()
+
+
+def write_wav(path: Path, pcm, sample_rate: int, channels: int = 1, sample_width: int = 2) -> None:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)